@@ -0,0 +1 @@
+"""Performance benchmarks of Maha, run them using ``python -m benchmarks``."""
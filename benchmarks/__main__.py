@@ -0,0 +1,203 @@
+"""Runs the benchmarks and optionally compares the results with a baseline.
+
+Usage::
+
+    python -m benchmarks --size 1MB --output results.json
+    python -m benchmarks --size 100MB --baseline results.json --threshold 10
+
+Cleaners run on each line of a synthetic corpus of the given size generated from
+``sample_data``, parsers run on the first ``--parser-size`` bytes of the corpus
+(the time rule is much slower than the cleaners) and processors run on the corpus
+file. Some cleaners also run on fixed adversarial inputs, e.g.
+``reduce_repeated_substring.laughter``. The throughput of each benchmark is the
+number of input bytes processed per second, using the best of ``--repeat`` runs.
+
+When a baseline is given, the command fails if the throughput of any benchmark
+drops by more than ``--threshold`` percent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+import regex
+
+from .cases import Benchmark, get_benchmarks
+from .corpus import DEFAULT_CORPUS_PATH, get_corpus, parse_size, read_lines
+
+
+def _time_lines(benchmark: Benchmark, lines: list[str]) -> float:
+    function = benchmark.function
+    start = time.perf_counter()
+    for line in lines:
+        function(line)
+    return time.perf_counter() - start
+
+
+def _time_file(benchmark: Benchmark, path: Path) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        benchmark.function(path, Path(directory) / "output.txt")
+        return time.perf_counter() - start
+
+
+def run_benchmarks(
+    benchmarks: list[Benchmark],
+    corpus: Path,
+    parser_size: int,
+    repeat: int,
+) -> dict[str, dict[str, Any]]:
+    """Runs the input benchmarks and returns the results of each one"""
+    lines = read_lines(corpus)
+    parser_lines = read_lines(corpus, parser_size)
+    inputs = {
+        "cleaners": (lines, _get_size(lines)),
+        "parsers": (parser_lines, _get_size(parser_lines)),
+    }
+
+    results = {}
+    for benchmark in benchmarks:
+        if benchmark.group == "processors":
+            size = corpus.stat().st_size
+            timings = [_time_file(benchmark, corpus) for _ in range(repeat)]
+        else:
+            if benchmark.inputs is not None:
+                benchmark_lines = benchmark.inputs
+                size = _get_size(benchmark_lines)
+            else:
+                benchmark_lines, size = inputs[benchmark.group]
+            # Warm up, patterns are compiled on first use
+            _time_lines(benchmark, benchmark_lines[:10])
+            timings = [_time_lines(benchmark, benchmark_lines) for _ in range(repeat)]
+
+        best = min(timings)
+        results[benchmark.name] = {
+            "group": benchmark.group,
+            "bytes": size,
+            "seconds": timings,
+            "best": best,
+            "throughput": size / best / 2**20 if best else float("inf"),
+        }
+        print(
+            f"{benchmark.name:<32} {results[benchmark.name]['throughput']:>10.2f} MB/s"
+            f" ({best:.3f}s)",
+            flush=True,
+        )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """Compares the throughput of the results with the baseline and returns the
+    names of the benchmarks that regressed by more than ``threshold`` percent"""
+    regressions = []
+    print(f"\n{'Benchmark':<32} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["throughput"], result["throughput"]
+        change = (new - old) / old * 100
+        marker = ""
+        if change < -threshold:
+            regressions.append(name)
+            marker = " REGRESSION"
+        print(f"{name:<32} {old:>10.2f} {new:>10.2f} {change:>+7.1f}%{marker}")
+    return regressions
+
+
+def _get_size(lines: list[str]) -> int:
+    return sum(len(line.encode("utf8")) + 1 for line in lines)
+
+
+def _get_metadata(size: int, parser_size: int, repeat: int) -> dict[str, Any]:
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "regex": regex.__version__,
+        "platform": platform.platform(),
+        "size": size,
+        "parser_size": parser_size,
+        "repeat": repeat,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--size", default="1MB", help="Size of the corpus, e.g. 1MB or 100MB"
+    )
+    parser.add_argument(
+        "--parser-size",
+        default="64KB",
+        help="Size of the part of the corpus used by the parsers",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    parser.add_argument(
+        "--filter",
+        default="*",
+        help="Only run the benchmarks with matching names, e.g. 'parse_dimension.*'",
+    )
+    parser.add_argument("--output", type=Path, help="Path to save the JSON results")
+    parser.add_argument(
+        "--baseline", type=Path, help="JSON results to compare the results with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="Maximum allowed throughput drop in percent, by default 10",
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=DEFAULT_CORPUS_PATH,
+        help="Directory of the generated corpora",
+    )
+    args = parser.parse_args(argv)
+
+    size, parser_size = parse_size(args.size), parse_size(args.parser_size)
+    if args.repeat < 1:
+        parser.error("--repeat should be greater than 0")
+
+    benchmarks = [
+        b for b in get_benchmarks() if fnmatch.fnmatchcase(b.name, args.filter)
+    ]
+    if not benchmarks:
+        parser.error(f"No benchmarks match {args.filter}")
+
+    corpus = get_corpus(size, args.corpus_dir)
+    results = run_benchmarks(benchmarks, corpus, parser_size, args.repeat)
+
+    if args.output:
+        output = {
+            "metadata": _get_metadata(size, parser_size, args.repeat),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(output, indent=4) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(
+                f"\n{len(regressions)} benchmark(s) regressed by more than "
+                f"{args.threshold}%: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
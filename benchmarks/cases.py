@@ -0,0 +1,145 @@
+"""Benchmarked functions"""
+
+from __future__ import annotations
+
+import os
+import random
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from maha.cleaners.functions import (
+    contains_repeated_substring,
+    keep,
+    normalize,
+    numbers_to_text,
+    reduce_repeated_substring,
+    remove,
+    replace_pairs,
+)
+from maha.constants import ALEF, ALEF_VARIATIONS, ARABIC_LETTERS
+from maha.parsers.functions import parse_dimension
+from maha.processors import StreamFileProcessor
+
+
+@dataclass
+class Benchmark:
+    """A benchmarked function and the input it runs on"""
+
+    name: str
+    """Name of the benchmark"""
+    group: str
+    """``cleaners`` and ``parsers`` run on each line of the corpus, ``processors``
+    run on the corpus file"""
+    function: Callable
+    inputs: list[str] | None = None
+    """Lines the benchmark runs on instead of the corpus lines"""
+
+
+ADVERSARIAL_LINE_LENGTH = 5000
+""" Number of characters of each line of the adversarial inputs """
+ADVERSARIAL_LINES = 20
+""" Number of lines of the adversarial inputs """
+
+
+def get_adversarial_inputs() -> dict[str, list[str]]:
+    """Returns the inputs that are slow to search for repeated substrings: long
+    laughter runs, long lines without repeats and near-periodic lines whose units
+    are repeated twice then changed"""
+    generator = random.Random(0)
+    laughter, no_repeats, near_periodic = [], [], []
+    for _ in range(ADVERSARIAL_LINES):
+        laughter.append("ه" * ADVERSARIAL_LINE_LENGTH)
+
+        characters = [generator.choice(ARABIC_LETTERS)]
+        while len(characters) < ADVERSARIAL_LINE_LENGTH:
+            character = generator.choice(ARABIC_LETTERS)
+            if character != characters[-1]:
+                characters.append(character)
+        no_repeats.append("".join(characters))
+
+        # Units longer than the units found using a pattern
+        unit = "".join(generator.choices(ARABIC_LETTERS, k=12))
+        units: list[str] = []
+        while len(units) * len(unit) < ADVERSARIAL_LINE_LENGTH:
+            units += [unit, unit]
+            index = generator.randrange(len(unit))
+            unit = unit[:index] + generator.choice(ARABIC_LETTERS) + unit[index + 1 :]
+        near_periodic.append("".join(units)[:ADVERSARIAL_LINE_LENGTH])
+    return {
+        "laughter": laughter,
+        "no_repeats": no_repeats,
+        "near_periodic": near_periodic,
+    }
+
+
+def _process_and_save(input_path: Path, output_path: Path, workers: int | None):
+    processor = StreamFileProcessor(input_path)
+    processor.normalize(all=True).keep(arabic=True).drop_empty_lines()
+    processor.process_and_save(output_path, override=True, workers=workers)
+
+
+def get_benchmarks() -> list[Benchmark]:
+    """Returns all benchmarks"""
+    benchmarks = [
+        Benchmark("normalize", "cleaners", partial(normalize, all=True)),
+        Benchmark(
+            "remove",
+            "cleaners",
+            partial(remove, harakat=True, punctuations=True, emojis=True, links=True),
+        ),
+        Benchmark("keep", "cleaners", partial(keep, arabic=True)),
+        Benchmark(
+            "replace_pairs",
+            "cleaners",
+            partial(
+                replace_pairs,
+                keys=ALEF_VARIATIONS + ["ة", "ى"],
+                values=[ALEF] * len(ALEF_VARIATIONS) + ["ه", "ي"],
+            ),
+        ),
+        Benchmark("reduce_repeated_substring", "cleaners", reduce_repeated_substring),
+        Benchmark("numbers_to_text", "cleaners", numbers_to_text),
+    ]
+
+    for name, lines in get_adversarial_inputs().items():
+        benchmarks += [
+            Benchmark(
+                f"reduce_repeated_substring.{name}",
+                "cleaners",
+                reduce_repeated_substring,
+                lines,
+            ),
+            Benchmark(
+                f"contains_repeated_substring.{name}",
+                "cleaners",
+                contains_repeated_substring,
+                lines,
+            ),
+        ]
+
+    for dimension in ["duration", "distance", "numeral", "ordinal", "time", "names"]:
+        arguments: dict[str, Any] = {dimension: True}
+        benchmarks.append(
+            Benchmark(
+                f"parse_dimension.{dimension}",
+                "parsers",
+                partial(parse_dimension, **arguments),
+            )
+        )
+
+    benchmarks.append(
+        Benchmark(
+            "process_and_save", "processors", partial(_process_and_save, workers=None)
+        )
+    )
+    if (os.cpu_count() or 1) > 1:
+        benchmarks.append(
+            Benchmark(
+                "process_and_save.workers",
+                "processors",
+                partial(_process_and_save, workers=min(os.cpu_count() or 1, 4)),
+            )
+        )
+    return benchmarks
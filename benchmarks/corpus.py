@@ -0,0 +1,78 @@
+"""Synthetic corpora generated from the sample data"""
+
+from __future__ import annotations
+
+import random
+import re
+import tempfile
+from pathlib import Path
+
+SAMPLE_DATA_PATH = Path(__file__).parent.parent / "sample_data"
+""" Directory of the sample data used to generate the corpora """
+SAMPLE_FILES = [
+    "tweets.txt",
+    "wiki_arlang.txt",
+    "wiki_arnumbers.txt",
+    "surah_al-ala.txt",
+]
+""" Sample files used to generate the corpora """
+DEFAULT_CORPUS_PATH = Path(tempfile.gettempdir()) / "maha-benchmarks"
+""" Default directory of the generated corpora """
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 2**10, "MB": 2**20, "GB": 2**30}
+
+
+def parse_size(size: str) -> int:
+    """Converts a size such as ``1MB`` or ``64KB`` to a number of bytes"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*", size.upper())
+    if match is None:
+        raise ValueError(f"Invalid size {size}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+def get_sample_lines() -> list[str]:
+    """Returns the non-empty lines of the sample files"""
+    lines: list[str] = []
+    for name in SAMPLE_FILES:
+        text = (SAMPLE_DATA_PATH / name).read_text(encoding="utf8")
+        lines.extend(line for line in text.splitlines() if line.strip())
+    return lines
+
+
+def get_corpus(size: int, directory: Path = DEFAULT_CORPUS_PATH) -> Path:
+    """Returns the path of a corpus of approximately ``size`` bytes. The corpus is
+    made of the sample lines in a random (but fixed) order and is generated once.
+    """
+    path = directory / f"corpus-{size}.txt"
+    if path.exists():
+        return path
+
+    directory.mkdir(parents=True, exist_ok=True)
+    lines = get_sample_lines()
+    generator = random.Random(size)
+    temp_path = path.with_suffix(".tmp")
+    written = 0
+    with temp_path.open("w", encoding="utf8") as f:
+        while written < size:
+            generator.shuffle(lines)
+            for line in lines:
+                data = line + "\n"
+                f.write(data)
+                written += len(data.encode("utf8"))
+                if written >= size:
+                    break
+    temp_path.replace(path)
+    return path
+
+
+def read_lines(path: Path, size: int | None = None) -> list[str]:
+    """Reads the lines of the corpus, up to ``size`` bytes if given"""
+    lines = []
+    read = 0
+    with path.open(encoding="utf8") as f:
+        for line in f:
+            read += len(line.encode("utf8"))
+            if size is not None and read > size:
+                break
+            lines.append(line.rstrip("\n"))
+    return lines
@@ -0,0 +1,126 @@
+"""Command line interface of Maha.
+
+Usage::
+
+    maha cache warm     # compile the patterns of all rules and cache them
+    maha cache stats    # show the size of the cache
+    maha cache clear    # remove all cached patterns
+
+It can also be run using ``python -m maha``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from types import ModuleType
+from typing import Iterator, Sequence
+
+
+def _get_rule_expressions() -> Iterator:
+    """Yields all expressions defined in :mod:`maha.parsers.rules`"""
+    import maha.parsers.rules
+    from maha.rexy import Expression, ExpressionGroup
+
+    # Loads all rules
+    maha.parsers.rules.__all__
+
+    seen: set[int] = set()
+    modules = [
+        module
+        for name, module in list(sys.modules.items())
+        if name.startswith("maha.parsers.rules") and isinstance(module, ModuleType)
+    ]
+    stack = [value for module in modules for value in vars(module).values()]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, ExpressionGroup):
+            stack.extend(value.expressions)
+        elif isinstance(value, Expression):
+            yield value
+            if isinstance(getattr(value, "value", None), ExpressionGroup):
+                stack.append(value.value)  # type: ignore
+
+
+def _format_size(size: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def cache_warm(_: argparse.Namespace):
+    from maha.rexy import PATTERN_CACHE
+
+    start = time.perf_counter()
+    count = 0
+    for expression in _get_rule_expressions():
+        if expression.pickle:
+            expression.compile()
+            count += 1
+    elapsed = time.perf_counter() - start
+    print(f"Cached {count} patterns in {elapsed:.1f}s")
+    print(f"Directory: {PATTERN_CACHE.directory}")
+
+
+def cache_stats(_: argparse.Namespace):
+    from maha.rexy import PATTERN_CACHE
+
+    stats = PATTERN_CACHE.stats()
+    print(f"Directory: {stats.directory}")
+    print(f"Entries: {stats.entries} ({_format_size(stats.size)})")
+    print(f"Stale entries: {stats.stale_entries} ({_format_size(stats.stale_size)})")
+    print(f"Maximum size: {_format_size(stats.max_size)}")
+
+
+def cache_clear(args: argparse.Namespace):
+    from maha.rexy import PATTERN_CACHE
+
+    removed = PATTERN_CACHE.clear(stale_only=args.stale)
+    print(f"Removed {removed} patterns from {PATTERN_CACHE.directory}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the command line interface with the input arguments.
+
+    Parameters
+    ----------
+    argv : Sequence[str], optional
+        Command line arguments, by default ``sys.argv[1:]``
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(prog="maha")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cache = commands.add_parser("cache", help="Manage the compiled patterns cache")
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    warm = cache_commands.add_parser(
+        "warm", help="Compile the patterns of all rules and cache them"
+    )
+    warm.set_defaults(function=cache_warm)
+    stats = cache_commands.add_parser("stats", help="Show statistics of the cache")
+    stats.set_defaults(function=cache_stats)
+    clear = cache_commands.add_parser("clear", help="Remove cached patterns")
+    clear.add_argument(
+        "--stale",
+        action="store_true",
+        help="Only remove patterns cached by other Python or regex versions",
+    )
+    clear.set_defaults(function=cache_clear)
+
+    args = parser.parse_args(argv)
+    args.function(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,8 +11,7 @@ __all__ = [
     "contains_single_letter_word",
 ]
 
-import regex as re
-
+from maha.cleaners.utils import has_repeated_substring
 from maha.constants import (
     ALL_HARAKAT,
     ARABIC,
@@ -47,8 +46,12 @@ from maha.expressions import (
     EXPRESSION_LINKS,
     EXPRESSION_MENTIONS,
 )
-from maha.rexy import Expression, ExpressionGroup
-from maha.utils import check_positive_integer
+from maha.rexy import (
+    Expression,
+    ExpressionGroup,
+    get_expression,
+    get_strings_expression,
+)
 
 
 def contains(
@@ -280,10 +283,7 @@ def contains_repeated_substring(text: str, min_repeated: int = 3) -> bool:
         >>> contains_repeated_substring(text)
         True
     """
-    check_positive_integer(min_repeated, "min_repeated")
-
-    pattern = r"(.+?)\1{}".format(f"{{{min_repeated-1},}}")
-    return contains_expressions(text, pattern)
+    return has_repeated_substring(text, min_repeated)
 
 
 def contains_single_letter_word(
@@ -333,8 +333,8 @@ def contains_single_letter_word(
     if not letters:
         raise ValueError("At least one argument should be True")
 
-    pattern = r"\b[{}]\b".format("".join(letters))
-    return contains_expressions(text, pattern)
+    expression = get_strings_expression(tuple(letters), r"\b[{}]\b", "")
+    return contains_expressions(text, expression)
 
 
 def contains_expressions(
@@ -381,7 +381,7 @@ def contains_expressions(
         return bool(expressions.search(text))
 
     if isinstance(expressions, str):
-        return bool(Expression(expressions).search(text))
+        return bool(get_expression(expressions).search(text))
 
     raise ValueError("'expressions' must be of type Expression, ExpressionGroup or str")
 
@@ -420,11 +420,7 @@ def contain_strings(text: str, strings: list[str] | str) -> bool:
     if not strings:
         raise ValueError("'strings cannot be empty.")
 
-    # convert list to str
-    if isinstance(strings, list):
-        strings = "|".join(str(re.escape(c)) for c in strings)
-    else:
-        strings = str(re.escape(strings))
+    if isinstance(strings, str):
+        strings = [strings]
 
-    expression = Expression(f"({strings})")
-    return contains_expressions(text, expression)
+    return contains_expressions(text, get_strings_expression(tuple(strings)))
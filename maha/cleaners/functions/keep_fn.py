@@ -12,6 +12,8 @@ __all__ = [
     "keep_arabic_letters_with_harakat",
 ]
 
+from functools import lru_cache
+
 import maha.cleaners.functions as functions
 from maha.constants import (
     ALL_HARAKAT,
@@ -32,6 +34,7 @@ from maha.constants import (
     SPACE,
     TATWEEL,
 )
+from maha.rexy.rexy import EXPRESSION_CACHE_SIZE
 
 
 def keep(
@@ -310,7 +313,7 @@ def keep_strings(text: str, strings: list[str] | str, use_space: bool = True) ->
     if use_space:
         # remove all not included harakat first or tatweel
         # (to fix extra spacing between characters)
-        not_included_harakat = [h for h in ALL_HARAKAT + [TATWEEL] if h not in strings]
+        not_included_harakat = _get_not_included_harakat(tuple(strings))
 
         output_text = text
         # replace harakat with empty character
@@ -323,3 +326,10 @@ def keep_strings(text: str, strings: list[str] | str, use_space: bool = True) ->
         output_text = functions.replace_except(text, strings, EMPTY)
 
     return output_text.strip()
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _get_not_included_harakat(strings: tuple[str, ...]) -> list[str]:
+    """Returns the harakat and tatweel that are not in the input strings"""
+    included = set(strings)
+    return [h for h in ALL_HARAKAT + [TATWEEL] if h not in included]
@@ -1,17 +1,21 @@
 """
 Logic for converting numbers to text
 """
+from __future__ import annotations
+
 __all__ = [
     "numbers_to_text",
+    "numbers_to_text_many",
 ]
 
-import regex as re
+import warnings
+from functools import lru_cache
+from typing import Iterable
 
-import maha.cleaners.functions as functions
-from maha.constants import TEH_MARBUTA
+from maha.constants import ARABIC_NUMBERS, ENGLISH_NUMBERS, TEH_MARBUTA
 from maha.expressions import EXPRESSION_DECIMAL, EXPRESSION_INTEGER
-from maha.parsers.utils import convert_to_number_if_possible
-from maha.rexy import non_capturing_group
+from maha.rexy import Expression, non_capturing_group
+from maha.utils import convert_to_number_if_possible
 
 FASILA = "فاصلة"
 TWO_SUFFIX_NOMINATIVE = "ان"
@@ -56,6 +60,17 @@ NUMBER_MAP = {
     "9": "تسع",
 }
 
+MAX_NUMBER_LENGTH = 15
+""" Maximum number of characters of the numbers converted to text """
+NUMBER_CACHE_SIZE = 4096
+""" Maximum number of converted numbers kept in the cache of :func:`number_to_text` """
+
+EXPRESSION_NUMBER = Expression(
+    non_capturing_group(EXPRESSION_DECIMAL, EXPRESSION_INTEGER)
+)
+""" Expression of the numbers converted to text """
+_ENGLISH_NUMBERS_TABLE = str.maketrans(dict(zip(ARABIC_NUMBERS, ENGLISH_NUMBERS)))
+
 
 def numbers_to_text(text: str, accusative: bool = False):
     """Converts numbers in text to their equivalent text in Arabic.
@@ -72,21 +87,53 @@ def numbers_to_text(text: str, accusative: bool = False):
     str
         Text with numbers converted to their equivalent text in Arabic.
 
+    Warns
+    -----
+    UserWarning
+        If a number is longer than :data:`MAX_NUMBER_LENGTH`, it is kept as is.
+
     """
-    converted_text = functions.arabic_numbers_to_english(text)
-    output = re.sub(
-        non_capturing_group(EXPRESSION_DECIMAL, EXPRESSION_INTEGER),
-        lambda x: number_to_text(x.group(), accusative),
-        converted_text,
+    converted_text = text.translate(_ENGLISH_NUMBERS_TABLE)
+    return EXPRESSION_NUMBER.sub(
+        lambda x: number_to_text(x.group(), accusative), converted_text
     )
 
-    return output
 
+def numbers_to_text_many(texts: Iterable[str], accusative: bool = False) -> list[str]:
+    """Converts numbers in many texts to their equivalent text in Arabic, see
+    :func:`numbers_to_text`.
+
+    The conversions of the numbers are cached, numbers that are repeated across
+    the texts are converted once.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        Texts with numbers to be converted.
+    accusative : bool, optional
+        If True, the numbers will be converted to their accusative form.
+
+    Returns
+    -------
+    List[str]
+        Each text with numbers converted to their equivalent text in Arabic.
 
-def number_to_text(number: str, accusative: bool):
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.cleaners.functions import numbers_to_text_many
+        >>> numbers_to_text_many(["عندي 3 كتب", "عمري 21 سنة"])
+        ['عندي ثلاثة كتب', 'عمري واحد وعشرون سنة']
+    """
+    return [numbers_to_text(text, accusative) for text in texts]
+
+
+@lru_cache(maxsize=NUMBER_CACHE_SIZE)
+def number_to_text(number: str, accusative: bool) -> str:
     number_corrected = convert_to_number_if_possible(number)
-    if len(str(number_corrected)) > 15:
-        print(f"Number {number} is too long to be converted to text")
+    if len(str(number_corrected)) > MAX_NUMBER_LENGTH:
+        warnings.warn(f"Number {number} is too long to be converted to text")
         return number
     splits = str(number_corrected).split(".")
     if len(splits) == 2:
@@ -117,21 +164,33 @@ def _handle_decimal_part(integer_part: str, decimal_part: str, accusative: bool)
 
 
 def _convert_number(number: str, accusative) -> str:
-    if number == "0":
-        return NUMBER_MAP[number]
-    parts = [part[::-1] for part in re.split(r"(\d{1,3})", number[::-1]) if part]
+    if not number.isdigit():
+        raise ValueError(f"Cannot convert {number!r} to text")
+    value = int(number)
+    if value == 0:
+        return NUMBER_MAP["0"]
     output = []
-    for i, part in enumerate(parts):
-        text = _get_text_for_hundreds(part, accusative)
-        multiplier = _get_multiplier(part, i, accusative)
-        if text and multiplier:
-            if int(part) <= 2:
-                output.append(multiplier)
-            else:
-                output.append(text + " " + multiplier)
-        elif text:
-            output.append(text)
-    return f" {CONNECTOR}".join(output[::-1])
+    for texts in _GROUP_TEXTS[accusative]:
+        value, part = divmod(value, 1000)
+        if part:
+            output.append(texts[part])
+        if not value:
+            break
+    else:
+        raise ValueError(f"Cannot convert {number!r} to text")
+    return f" {CONNECTOR}".join(reversed(output))
+
+
+def _get_group_text(part: str, i: int, accusative: bool) -> str:
+    """Returns the text of a group of three digits at position ``i`` from the
+    right, including its multiplier"""
+    text = _get_text_for_hundreds(part, accusative)
+    multiplier = _get_multiplier(part, i, accusative)
+    if not text or not multiplier:
+        return text
+    if int(part) <= 2:
+        return multiplier
+    return text + " " + multiplier
 
 
 def _get_multiplier(part: str, i: int, accusative) -> str:
@@ -218,3 +277,13 @@ def _from_one_to_nine(part: str, accusative: bool) -> str:
     if number == 2:
         return NUMBER_MAP[part] + two_suffix
     return NUMBER_MAP[part] + TEH_MARBUTA
+
+
+_GROUP_TEXTS = {
+    accusative: [
+        [_get_group_text(str(part), i, accusative) for part in range(1000)]
+        for i in range(len(MULTIPLIER_MAP) + 1)
+    ]
+    for accusative in (False, True)
+}
+""" Text of each group of three digits by form, position and value """
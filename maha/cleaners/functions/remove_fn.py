@@ -3,7 +3,7 @@ Functions that operate on a string and remove certain characters.
 """
 from __future__ import annotations
 
-from maha.rexy import non_capturing_group
+from maha.rexy import get_expression, non_capturing_group
 
 __all__ = [
     "remove",
@@ -27,6 +27,7 @@ __all__ = [
 
 
 import maha.cleaners.functions as functions
+from maha.cleaners.utils import find_repeated_substrings
 from maha.constants import (
     ALL_HARAKAT,
     ARABIC,
@@ -64,6 +65,16 @@ from maha.expressions import (
 from maha.rexy import Expression, ExpressionGroup
 from maha.utils import check_positive_integer
 
+EXPRESSION_NOON_WITHOUT_DOT = Expression(
+    r"{}(?=[^{}]|[{}]\b|$)".format(
+        NOON,
+        "".join(ARABIC_LETTERS + ALL_HARAKAT),
+        "".join(ALL_HARAKAT),
+    )
+)
+""" Expression that matches :data:`.NOON` written without a dot, which is the noon
+at the end of the word """
+
 
 def remove(
     text: str,
@@ -219,10 +230,10 @@ def remove(
 
     # expressions to remove
     if isinstance(custom_expressions, str):
-        custom_expressions = Expression(custom_expressions)
+        custom_expressions = get_expression(custom_expressions)
 
     elif isinstance(custom_expressions, list):
-        custom_expressions = Expression(non_capturing_group(*custom_expressions))
+        custom_expressions = get_expression(non_capturing_group(*custom_expressions))
 
     expressions_to_remove = ExpressionGroup(custom_expressions)
 
@@ -272,8 +283,9 @@ def reduce_repeated_substring(
     to ``reduce_to`` times. For example with the default arguments, 'hhhhhh' is
     reduced to 'hh'
 
-    TODO: Maybe change the implemention for 50x speed
-    https://stackoverflow.com/questions/29481088/how-can-i-tell-if-a-string-repeats-itself-in-python/29489919#29489919
+    The substrings are the matches of ``(.+?)\\1{min_repeated-1,}``, they are found
+    without trying every unit length at every position using
+    :func:`~.find_repeated_substrings`.
 
     Parameters
     ----------
@@ -319,8 +331,14 @@ def reduce_repeated_substring(
     if reduce_to > min_repeated:
         raise ValueError("`reduce_to` cannot be greater than `min_repeated`")
 
-    pattern = r"(.+?)\1{}".format(f"{{{min_repeated-1},}}")
-    return functions.replace_expression(text, pattern, r"\1" * reduce_to)
+    output = []
+    position = 0
+    for start, end, length in find_repeated_substrings(text, min_repeated):
+        output.append(text[position:start])
+        output.append(text[start : start + length] * reduce_to)
+        position = end
+    output.append(text[position:])
+    return EMPTY.join(output)
 
 
 def remove_hash_keep_tag(text: str):
@@ -785,13 +803,7 @@ def remove_arabic_letter_dots(text: str) -> str:
         'الحَمدُ للهِ الَّدى ٮٮِعمٮِه ٮَٮمُّ الصَّالحاٮُ'
     """
     output = functions.replace_expression(
-        text,
-        r"{}(?=[^{}]|[{}]\b|$)".format(
-            NOON,
-            "".join(ARABIC_LETTERS + ALL_HARAKAT),
-            "".join(ALL_HARAKAT),
-        ),
-        DOTLESS_NOON_GHUNNA,
+        text, EXPRESSION_NOON_WITHOUT_DOT, DOTLESS_NOON_GHUNNA
     )
     output = functions.replace_pairs(
         output, list(ARABIC_DOTLESS_MAP.keys()), list(ARABIC_DOTLESS_MAP.values())
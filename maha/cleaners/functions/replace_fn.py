@@ -13,7 +13,8 @@ __all__ = [
 ]
 
 
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Collection
 
 # To enjoy infinite width lookbehind
 import regex as re
@@ -31,7 +32,13 @@ from maha.constants import (
     TEH,
     WAW,
 )
-from maha.rexy import Expression, ExpressionGroup
+from maha.rexy import (
+    Expression,
+    ExpressionGroup,
+    get_expression,
+    get_strings_expression,
+)
+from maha.rexy.rexy import EXPRESSION_CACHE_SIZE
 
 
 def connect_single_letter_word(
@@ -88,7 +95,9 @@ def connect_single_letter_word(
         letters.extend(re.escape(s) for s in custom_strings)
 
     chars = "|".join(letters)
-    return replace_expression(text, rf"(\b)({chars})(?:\s)(?=.)", r"\1\2")
+    return replace_expression(
+        text, get_expression(rf"(\b)({chars})(?:\s)(?=.)"), r"\1\2"
+    )
 
 
 def arabic_numbers_to_english(text: str):
@@ -164,10 +173,10 @@ def replace_expression(
         'ذهبت الفتاة إلى المدرسة'
     """
     if isinstance(expression, str):
-        expression = Expression(expression)
+        expression = get_expression(expression)
 
     if isinstance(expression, ExpressionGroup):
-        expression = Expression(expression.join())
+        expression = get_expression(expression.join())
 
     return expression.sub(with_value, text)
 
@@ -205,13 +214,16 @@ def replace(text: str, strings: list[str] | str, with_value: str) -> str:
         >>> replace(text, "$", "دولار")
         'ولقد كلف هذا المنتج 100 دولار'
     """
-    # convert list to str
-    if isinstance(strings, list):
-        strings = "|".join(str(re.escape(c)) for c in strings)
-    else:
-        strings = str(re.escape(strings))
+    strings_key = _to_tuple(strings)
+    # Characters are matched faster using a character class than an alternation,
+    # the value is a template that can refer to the group when it has a backslash.
+    if "\\" not in with_value:
+        expression = _get_characters_expression(strings_key, "[{}]")
+        if expression is not None:
+            return expression.sub(with_value, text)
 
-    return replace_expression(text, f"({strings})", with_value)
+    expression = get_strings_expression(strings_key)
+    return replace_expression(text, expression, with_value)
 
 
 def replace_except(text: str, strings: list[str] | str, with_value: str) -> str:
@@ -242,18 +254,19 @@ def replace_except(text: str, strings: list[str] | str, with_value: str) -> str:
         >>> replace_except(text, ARABIC_LETTERS + [SPACE], EMPTY)
         'ليت الذين تحب العين رؤيتهم'
     """
-    # convert list to str
-    if isinstance(strings, list):
-        strings = "|".join(str(re.escape(c)) for c in strings)
-    else:
-        strings = str(re.escape(strings))
+    strings_key = _to_tuple(strings)
+    # When only characters are preserved, each run of other characters (except
+    # new lines, which "." does not match) is replaced with a single value.
+    expression = _get_characters_expression(strings_key, "[^{}\\n]+")
+    if expression is not None:
+        return expression.sub(lambda _: with_value, text)
 
-    # To include the end
-    strings += "|$"
+    # "$" to include the end
+    expression = get_strings_expression(strings_key, "(.*?)({}|$)")
 
     return replace_expression(
         text,
-        f"(.*?)({strings})",
+        expression,
         lambda m: with_value + m.groups()[1] if m.groups()[0] else m.groups()[1],
     )
 
@@ -293,10 +306,40 @@ def replace_pairs(text: str, keys: list[str], values: list[str]) -> str:
     if len(keys) != len(values):
         raise ValueError("'keys' and 'values' should have the same length")
 
-    escaped = [str(re.escape(c)) for c in keys]
-    pattern = "|".join(escaped)
+    pairs = _get_pairs(tuple(keys), tuple(values))
+    expression = _get_characters_expression(tuple(keys), "[{}]") or (
+        get_strings_expression(tuple(keys), "{}")
+    )
+
+    return replace_expression(text, expression, lambda m: pairs[m.group(0)])
+
+
+def _to_tuple(strings: list[str] | str) -> tuple[str, ...]:
+    """Converts the input strings to a hashable key of the memoized expressions"""
+    return (strings,) if isinstance(strings, str) else tuple(strings)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _get_pairs(keys: tuple[str, ...], values: tuple[str, ...]) -> dict[str, str]:
+    """Maps each key to its value, the first value is used for duplicate keys"""
+    pairs: dict[str, str] = {}
+    for key, value in zip(keys, values):
+        pairs.setdefault(key, value)
+    return pairs
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _get_characters_expression(
+    strings: tuple[str, ...], template: str
+) -> Expression | None:
+    """Returns the expression of the character class ``template`` of the input
+    strings, None if they are not all single characters"""
+    if not _are_characters(strings):
+        return None
+    return get_strings_expression(strings, template, "")
 
-    def func(match):
-        return values[keys.index(match.group(0))]
 
-    return replace_expression(text, pattern, func)
+def _are_characters(strings: Collection[str]) -> bool:
+    """Checks whether there are strings and all of them are single characters
+    (code points)"""
+    return bool(strings) and all(len(s) == 1 for s in strings)
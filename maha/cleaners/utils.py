@@ -0,0 +1,280 @@
+"""Search for consecutive repeated substrings"""
+
+from __future__ import annotations
+
+__all__ = ["find_repeated_substrings", "has_repeated_substring"]
+
+import heapq
+import operator
+import re
+from functools import lru_cache, partial
+from itertools import compress
+from typing import Callable, Iterator, Pattern
+
+from maha.utils import check_positive_integer
+
+SMALL_UNIT_LENGTH = 8
+""" Longest repeated unit found using a pattern, longer units are found using
+:meth:`str.find` or in the periodic regions of the line """
+PERIODIC_SCAN_LENGTH = 2**10
+""" Length from which the lines are scanned for periodic regions instead of searching
+the units longer than :data:`SMALL_UNIT_LENGTH` at each position """
+
+
+def find_repeated_substrings(
+    text: str, min_repeated: int = 3
+) -> Iterator[tuple[int, int, int]]:
+    r"""Finds consecutive substrings that are repeated at least ``min_repeated``
+    times.
+
+    The matches are identical to the matches of ``(.+?)\1{min_repeated-1,}``
+    (with ``min_repeated - 1`` written as a number): the shortest repeated unit is
+    taken at each position, with as many repetitions as possible. The pattern tries
+    every unit length at every position, which is quadratic in the length of the
+    lines. Instead, units of up to :data:`SMALL_UNIT_LENGTH` characters are found
+    using a pattern with bounded units. Longer units are found using
+    :meth:`str.find` at each position in the lines shorter than
+    :data:`PERIODIC_SCAN_LENGTH`, and in the regions of the longer lines that are
+    periodic with a longer period. These regions are found once per line with
+    ``O(n log n)`` character comparisons: a region that is at least two periods
+    long contains a multiple of the period, so only the multiples of each period
+    are compared before the matching ones are extended.
+
+    Parameters
+    ----------
+    text : str
+        Text to search
+    min_repeated : int, optional
+        Minimum number of consecutive repeated substring to consider, by default 3
+
+    Yields
+    ------
+    Tuple[int, int, int]
+        Start, end and unit length of each match, from left to right.
+
+    Raises
+    ------
+    ValueError
+        If non positive integer is passed
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.cleaners.utils import find_repeated_substrings
+        >>> list(find_repeated_substrings("ههههه يا هلا هلا هلا"))
+        [(0, 5, 1), (7, 19, 4)]
+    """
+    check_positive_integer(min_repeated, "min_repeated")
+    offset = 0
+    for line in text.split("\n"):
+        for start, end, length in _iter_line_matches(line, min_repeated):
+            yield offset + start, offset + end, length
+        offset += len(line) + 1
+
+
+def has_repeated_substring(text: str, min_repeated: int = 3) -> bool:
+    """Checks for consecutive substrings that are repeated at least
+    ``min_repeated`` times, see :func:`find_repeated_substrings`.
+
+    Parameters
+    ----------
+    text : str
+        Text to check
+    min_repeated : int, optional
+        Minimum number of consecutive repeated substring to consider, by default 3
+
+    Returns
+    -------
+    bool
+        True if the text contains consecutive repeated substrings, otherwise False
+
+    Raises
+    ------
+    ValueError
+        If non positive integer is passed
+    """
+    check_positive_integer(min_repeated, "min_repeated")
+    small_units = _get_small_units_pattern(min_repeated)
+    for line in text.split("\n"):
+        if small_units.search(line) is not None:
+            return True
+        if len(line) < PERIODIC_SCAN_LENGTH:
+            if _find_large_unit(line, min_repeated, 0, len(line)) is not None:
+                return True
+        elif next(_iter_periodic_regions(line, min_repeated), None) is not None:
+            return True
+    return False
+
+
+def _iter_line_matches(line: str, min_repeated: int) -> Iterator[tuple[int, int, int]]:
+    """Yields the matches of a line without line breaks"""
+    small_units = _get_small_units_pattern(min_repeated)
+    find_large_unit: Callable[[int, int], tuple[int, int, int] | None]
+    if len(line) < PERIODIC_SCAN_LENGTH:
+        find_large_unit = partial(_find_large_unit, line, min_repeated)
+    else:
+        find_large_unit = _LargeUnits(line, min_repeated).find
+    position = 0
+    match = small_units.search(line)
+    while True:
+        # The next match of the pattern is kept until a longer unit overlaps it,
+        # to avoid searching the same characters again after each longer unit
+        if match is not None and match.start() < position:
+            match = small_units.search(line, position)
+        stop = len(line) if match is None else match.start()
+        large = find_large_unit(position, stop) if position < stop else None
+        if large is not None:
+            yield large
+            position = large[1]
+        elif match is not None:
+            yield match.start(), match.end(), len(match.group(1))
+            position = match.end()
+            match = small_units.search(line, position)
+        else:
+            return
+
+
+def _find_large_unit(
+    line: str, min_repeated: int, start: int, stop: int
+) -> tuple[int, int, int] | None:
+    """Returns the first match of a unit longer than :data:`SMALL_UNIT_LENGTH` that
+    starts from ``start`` to before ``stop``"""
+    size = len(line)
+    width = SMALL_UNIT_LENGTH + 1
+    for position in range(start, min(stop, size - min_repeated * width + 1)):
+        # The unit is repeated if the first characters are found again at its end
+        prefix = line[position : position + width]
+        limit = position + (size - position) // min_repeated + width
+        found = line.find(prefix, position + width, limit)
+        while found >= 0:
+            length = found - position
+            repeated = (min_repeated - 1) * length
+            if line[position : position + repeated] == line[found : found + repeated]:
+                unit = line[position:found]
+                end = found + repeated
+                while line.startswith(unit, end):
+                    end += length
+                return position, end, length
+            found = line.find(prefix, found + 1, limit)
+    return None
+
+
+class _LargeUnits:
+    """Finds the units longer than :data:`SMALL_UNIT_LENGTH` repeated at least
+    ``min_repeated`` times in a line, from left to right, in the periodic regions
+    of the line"""
+
+    def __init__(self, line: str, min_repeated: int):
+        self._line = line
+        self._min_repeated = min_repeated
+        self._regions: list[tuple[int, int, int]] | None = None
+        self._next = 0
+        # Period, last start and end of the regions that start before the position
+        self._active: list[tuple[int, int, int]] = []
+
+    def find(self, start: int, stop: int) -> tuple[int, int, int] | None:
+        """Returns the first match that starts from ``start`` to before ``stop``,
+        with the shortest unit. ``start`` must not decrease between calls."""
+        if self._regions is None:
+            self._regions = sorted(
+                _iter_periodic_regions(self._line, self._min_repeated)
+            )
+        regions, active = self._regions, self._active
+        position = start
+        while True:
+            while self._next < len(regions) and regions[self._next][0] <= position:
+                _, end, period = regions[self._next]
+                last = end - self._min_repeated * period
+                heapq.heappush(active, (period, last, end))
+                self._next += 1
+            while active and active[0][1] < position:
+                heapq.heappop(active)
+            if active:
+                break
+            if self._next == len(regions) or regions[self._next][0] >= stop:
+                return None
+            position = regions[self._next][0]
+
+        period, _, end = active[0]
+        return position, position + (end - position) // period * period, period
+
+
+def _iter_periodic_regions(
+    line: str, min_repeated: int
+) -> Iterator[tuple[int, int, int]]:
+    """Yields the start, end and period of the maximal regions of the line that are
+    periodic with a period longer than :data:`SMALL_UNIT_LENGTH` and at least
+    ``min_repeated`` periods long, by period"""
+    size = len(line)
+    for period in range(SMALL_UNIT_LENGTH + 1, size // min_repeated + 1):
+        length = (min_repeated - 1) * period
+        # The characters one period apart are equal for at least half of the
+        # length before or after the multiple of the period in a region
+        half = length // 2
+        following = 0
+        # Only the multiples of the period where the characters one period apart
+        # are equal are compared in Python
+        equal = map(operator.eq, line[: size - period : period], line[period::period])
+        for i in compress(range(0, size - period, period), equal):
+            if i < following or (
+                line[i : i + half] != line[i + period : i + period + half]
+                and (
+                    half > i
+                    or line[i - half : i] != line[i + period - half : i + period]
+                )
+            ):
+                continue
+            right = _common_prefix_length(line, i, i + period)
+            left = _common_suffix_length(line, i, i + period)
+            if left + right >= length:
+                yield i - left, i + period + right, period
+            # The characters one period apart differ at ``i + right``
+            following = i + right + 1
+
+
+def _common_prefix_length(line: str, i: int, j: int) -> int:
+    """Returns the length of the common prefix of ``line[i:]`` and ``line[j:]``,
+    where ``i < j``, comparing blocks of doubling size"""
+    limit = len(line) - j
+    low, step = 0, 1
+    while low < limit:
+        high = min(low + step, limit)
+        if line[i + low : i + high] != line[j + low : j + high]:
+            while high - low > 1:
+                middle = (low + high) // 2
+                if line[i + low : i + middle] == line[j + low : j + middle]:
+                    low = middle
+                else:
+                    high = middle
+            return low
+        low = high
+        step *= 2
+    return low
+
+
+def _common_suffix_length(line: str, i: int, j: int) -> int:
+    """Returns the length of the common suffix of ``line[:i]`` and ``line[:j]``,
+    where ``i < j``, comparing blocks of doubling size"""
+    low, step = 0, 1
+    while low < i:
+        high = min(low + step, i)
+        if line[i - high : i - low] != line[j - high : j - low]:
+            while high - low > 1:
+                middle = (low + high) // 2
+                if line[i - middle : i - low] == line[j - middle : j - low]:
+                    low = middle
+                else:
+                    high = middle
+            return low
+        low = high
+        step *= 2
+    return low
+
+
+@lru_cache(maxsize=None)
+def _get_small_units_pattern(min_repeated: int) -> Pattern:
+    """Pattern of the units of up to :data:`SMALL_UNIT_LENGTH` characters repeated
+    at least ``min_repeated`` times"""
+    # The standard library is faster than regex for this pattern
+    return re.compile(r"(.{1,%d}?)\1{%d,}" % (SMALL_UNIT_LENGTH, min_repeated - 1))
@@ -1 +1,15 @@
-from .rules import *
+# The rules are exposed lazily to avoid building them when importing submodules,
+# e.g. ``maha.parsers.templates``.
+
+from importlib import import_module
+
+
+def __getattr__(name: str):
+    # ``__all__`` is delegated for ``from maha.parsers import *``
+    if name.startswith("__") and name != "__all__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(".rules", __name__), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(dir(import_module(".rules", __name__))))
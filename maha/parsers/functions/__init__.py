@@ -1,2 +1,3 @@
 from .parse_dimensions import *
 from .parse_fn import *
+from .parse_many_fn import *
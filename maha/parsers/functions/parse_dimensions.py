@@ -3,16 +3,47 @@ from __future__ import annotations
 __all__ = ["parse_dimension"]
 
 
-from maha.parsers.rules import (
-    RULE_DISTANCE,
-    RULE_DURATION,
-    RULE_NAME,
-    RULE_NUMERAL,
-    RULE_ORDINAL,
-    RULE_TIME,
-)
+from functools import lru_cache
+from typing import Iterable
+
+import maha.parsers.rules as rules
 from maha.parsers.templates import Dimension, DimensionType
-from maha.rexy import Expression
+from maha.rexy import (
+    OVERLAP_POLICIES,
+    Expression,
+    ExpressionResult,
+    ExpressionScanner,
+    resolve_overlaps,
+)
+
+RULES_MAP = {
+    DimensionType.DURATION: "RULE_DURATION",
+    DimensionType.DISTANCE: "RULE_DISTANCE",
+    DimensionType.NUMERAL: "RULE_NUMERAL",
+    DimensionType.ORDINAL: "RULE_ORDINAL",
+    DimensionType.TIME: "RULE_TIME",
+    DimensionType.NAME: "RULE_NAME",
+}
+""" Maps each dimension type to the name of the rule used to extract it, rules are
+loaded on first use """
+FSM_RULES_MAP = {
+    DimensionType.NUMERAL: "RULE_NUMERAL_FSM",
+    DimensionType.ORDINAL: "RULE_ORDINAL_FSM",
+}
+""" Maps the dimension types that have a finite-state engine to the name of the
+engine, used instead of :data:`RULES_MAP` when ``engine`` is "fsm" """
+ENGINES = ("regex", "fsm")
+""" Engines of :func:`parse_dimension` """
+DIMENSION_PRIORITY = {
+    DimensionType.TIME: 0,
+    DimensionType.DURATION: 1,
+    DimensionType.DISTANCE: 2,
+    DimensionType.ORDINAL: 3,
+    DimensionType.NUMERAL: 4,
+    DimensionType.NAME: 5,
+}
+""" Priority of each dimension type when resolving overlaps, lower values win.
+Dimensions that contain numbers win over the numerals they contain """
 
 
 def parse_dimension(
@@ -27,9 +58,16 @@ def parse_dimension(
     time: bool | None = None,
     volume: bool | None = None,
     names: bool | None = None,
+    overlap: str | None = None,
+    engine: str = "regex",
 ) -> list[Dimension]:
     """Extract dimensions from a given text.
 
+    The text is scanned once for all selected rules using
+    :class:`~.ExpressionScanner`. The extracted dimensions are grouped by type in the
+    same order of the arguments, dimensions of different types can overlap unless
+    ``overlap`` is set.
+
     Parameters
     ----------
     text : str
@@ -61,6 +99,21 @@ def parse_dimension(
     volume : bool, optional
         Extract volume using the rule :data:`~.RULE_VOLUME`,
         by default None
+    names : bool, optional
+        Extract names using the rule :data:`~.RULE_NAME`,
+        by default None
+    overlap : str, optional
+        Policy used to remove dimensions that are contained in other dimensions,
+        one of :data:`~.OVERLAP_POLICIES`. See :func:`~.resolve_overlaps`. The
+        priority of the "priority" policy is :data:`DIMENSION_PRIORITY`. If None,
+        all dimensions are returned, by default None
+    engine : str, optional
+        Engine used to extract numerals and ordinals, one of :data:`ENGINES`.
+        "regex" matches the rules :data:`~.RULE_NUMERAL` and :data:`~.RULE_ORDINAL`,
+        "fsm" reads the text one token at a time using the equivalent state
+        machines :data:`~.RULE_NUMERAL_FSM` and :data:`~.RULE_ORDINAL_FSM`. Both
+        engines extract the same values, other dimensions are not affected,
+        by default "regex"
 
     Returns
     -------
@@ -70,30 +123,76 @@ def parse_dimension(
     Raises
     ------
     ValueError
-        If no argument is set to True
+        If no argument is set to True, ``overlap`` is not a supported policy or
+        ``engine`` is not a supported engine
     """
-    output = []
+    dimension_types = _get_dimension_types(
+        amount_of_money,
+        duration,
+        distance,
+        numeral,
+        ordinal,
+        quantity,
+        temperature,
+        time,
+        volume,
+        names,
+    )
+    _check_overlap(overlap)
+    _check_engine(engine)
+    return _parse_dimension(text, dimension_types, overlap, engine)
+
+
+def _check_overlap(overlap: str | None):
+    if overlap is not None and overlap not in OVERLAP_POLICIES:
+        raise ValueError(
+            f"Invalid overlap {overlap!r}, expected one of "
+            f"{', '.join(OVERLAP_POLICIES)}"
+        )
+
+
+def _check_engine(engine: str):
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Invalid engine {engine!r}, expected one of {', '.join(ENGINES)}"
+        )
+
+
+def _get_dimension_types(
+    amount_of_money: bool | None = None,
+    duration: bool | None = None,
+    distance: bool | None = None,
+    numeral: bool | None = None,
+    ordinal: bool | None = None,
+    quantity: bool | None = None,
+    temperature: bool | None = None,
+    time: bool | None = None,
+    volume: bool | None = None,
+    names: bool | None = None,
+) -> tuple[DimensionType, ...]:
+    """Returns the dimension types of the True arguments of :func:`parse_dimension`"""
+    dimension_types = []
 
     if amount_of_money:
         raise NotImplementedError("amount_of_money is not implemented yet")
     if duration:
-        output.extend(_get_dimensions(RULE_DURATION, text, DimensionType.DURATION))
+        dimension_types.append(DimensionType.DURATION)
     if distance:
-        output.extend(_get_dimensions(RULE_DISTANCE, text, DimensionType.DISTANCE))
+        dimension_types.append(DimensionType.DISTANCE)
     if numeral:
-        output.extend(_get_dimensions(RULE_NUMERAL, text, DimensionType.NUMERAL))
+        dimension_types.append(DimensionType.NUMERAL)
     if ordinal:
-        output.extend(_get_dimensions(RULE_ORDINAL, text, DimensionType.ORDINAL))
+        dimension_types.append(DimensionType.ORDINAL)
     if quantity:
         raise NotImplementedError("quantity is not implemented yet")
     if temperature:
         raise NotImplementedError("temperature is not implemented yet")
     if time:
-        output.extend(_get_dimensions(RULE_TIME, text, DimensionType.TIME))
+        dimension_types.append(DimensionType.TIME)
     if volume:
         raise NotImplementedError("volume is not implemented yet")
     if names:
-        output.extend(_get_dimensions(RULE_NAME, text, DimensionType.NAME))
+        dimension_types.append(DimensionType.NAME)
 
     if not any(
         [
@@ -111,14 +210,48 @@ def parse_dimension(
     ):
         raise ValueError("At least one argument should be True")
 
+    return tuple(dimension_types)
+
+
+def _parse_dimension(
+    text: str,
+    dimension_types: tuple[DimensionType, ...],
+    overlap: str | None = None,
+    engine: str = "regex",
+) -> list[Dimension]:
+    scanner = _get_scanner(dimension_types, engine)
+    output = []
+    for dimension_type, results in zip(dimension_types, scanner.scan(text)):
+        output.extend(_get_dimensions(results, text, dimension_type))
+    if overlap is not None:
+        output = resolve_overlaps(output, overlap, _get_dimension_priority)
     return output
 
 
+def _get_dimension_priority(dimension: Dimension) -> int:
+    return DIMENSION_PRIORITY.get(dimension.dimension_type, len(DIMENSION_PRIORITY))
+
+
+@lru_cache(maxsize=None)
+def _get_scanner(
+    dimension_types: tuple[DimensionType, ...], engine: str = "regex"
+) -> ExpressionScanner:
+    return ExpressionScanner(*[_get_rule(d, engine) for d in dimension_types])
+
+
+def _get_rule(dimension_type: DimensionType, engine: str = "regex") -> Expression:
+    """Returns the rule used to extract the input ``dimension_type`` using the
+    input ``engine``"""
+    if engine == "fsm" and dimension_type in FSM_RULES_MAP:
+        return getattr(rules, FSM_RULES_MAP[dimension_type])
+    return getattr(rules, RULES_MAP[dimension_type])
+
+
 def _get_dimensions(
-    rule: Expression, text: str, dimension_type: DimensionType
+    results: Iterable[ExpressionResult], text: str, dimension_type: DimensionType
 ) -> list[Dimension]:
     output = []
-    for result in rule(text):
+    for result in results:
         output.append(
             Dimension(
                 result.expression,
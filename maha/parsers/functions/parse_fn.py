@@ -4,6 +4,8 @@ from __future__ import annotations
 
 __all__ = ["parse", "parse_expression"]
 
+from typing import Any
+
 from maha.constants import (
     ALL_HARAKAT,
     ARABIC,
@@ -161,48 +163,59 @@ def parse(
     if not text:
         return []
 
-    # current function arguments
-    current_arguments = locals()
+    expressions = _get_expressions(locals())
+    return _parse_expressions(text, expressions)
+
+
+def _get_expressions(
+    arguments: dict[str, Any]
+) -> list[tuple[ExpressionGroup | Expression, DimensionType]]:
+    """Returns the expressions of the True arguments of :func:`parse` with the
+    corresponding dimension types.
+    """
     constants = globals()
+    include_space = arguments["include_space"]
+    custom_expressions = arguments["custom_expressions"]
 
-    output = []
-    any_argument_set = False
+    output: list[tuple[ExpressionGroup | Expression, DimensionType]] = []
 
     # Since each argument has the same name as the corresponding constant
     # (But, expressions should be prefixed with "EXPRESSION_" to match the actual expression.)
     # Looping through all arguments and appending constants that correspond to the
     # True arguments can work
     # TODO: Maybe find a good pythonic way to do this
-    for arg, value in current_arguments.items():
+    for arg, value in arguments.items():
         const = constants.get(arg.upper())
         if const and value is True:
-            any_argument_set = True
             if include_space:
                 pattern = f"(?:[{''.join(const)}](?:\\s+)?)+"
             else:
                 pattern = f"[{''.join(const)}]+"
-            text_exp = TextExpression(pattern)
-            parsed = parse_expression(text, text_exp, DimensionType[arg.upper()])
-            output.extend(parsed)
+            output.append((TextExpression(pattern), DimensionType[arg.upper()]))
             continue
         # check for expression
         expression: Expression | None = constants.get("EXPRESSION_" + arg.upper())
         if expression and value is True:
-            any_argument_set = True
-            text_exp = TextExpression(str(expression))
-            parsed = parse_expression(text, text_exp, DimensionType[arg.upper()])
-            output.extend(parsed)
+            output.append((TextExpression(str(expression)), DimensionType[arg.upper()]))
 
     if custom_expressions:
-        any_argument_set = True
-        output.extend(parse_expression(text, custom_expressions))
+        output.append((custom_expressions, DimensionType.GENERAL))
 
-    if not any_argument_set:
+    if not output:
         raise ValueError("At least one argument should be True")
 
     return output
 
 
+def _parse_expressions(
+    text: str, expressions: list[tuple[ExpressionGroup | Expression, DimensionType]]
+) -> list[Dimension]:
+    output = []
+    for expression, dimension_type in expressions:
+        output.extend(parse_expression(text, expression, dimension_type))
+    return output
+
+
 def parse_expression(
     text: str,
     expressions: ExpressionGroup | Expression,
@@ -0,0 +1,308 @@
+"""Functions that extract values from many texts"""
+
+from __future__ import annotations
+
+__all__ = ["parse_dimension_many", "parse_many"]
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from inspect import signature
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from maha.constants import SPACE
+from maha.parsers.templates import Dimension
+from maha.rexy import Expression, ExpressionGroup
+from maha.utils import check_positive_integer
+
+from .parse_dimensions import (
+    _check_engine,
+    _check_overlap,
+    _get_dimension_types,
+    _get_rule,
+    _parse_dimension,
+    parse_dimension,
+)
+from .parse_fn import _get_expressions, _parse_expressions, parse
+
+
+class _Parser:
+    """Parses texts using :func:`~.parse_dimension` or :func:`~.parse` with the same
+    arguments. The arguments are validated and the expressions are created once.
+
+    Dimensions can be converted to tuples that refer to the expressions by index,
+    to avoid sending the (large) expressions between processes.
+    """
+
+    def __init__(self, name: str, arguments: dict[str, Any]):
+        expressions: list[Expression | ExpressionGroup]
+        if name == "parse_dimension":
+            arguments = dict(arguments)
+            overlap = arguments.pop("overlap", None)
+            engine = arguments.pop("engine", "regex")
+            _check_overlap(overlap)
+            _check_engine(engine)
+            dimension_types = _get_dimension_types(**arguments)
+            self._function = lambda text: _parse_dimension(
+                text, dimension_types, overlap, engine
+            )
+            expressions = [_get_rule(d, engine) for d in dimension_types]
+        else:
+            parse_arguments = {
+                name: param.default
+                for name, param in signature(parse).parameters.items()
+                if name != "text"
+            }
+            parse_arguments.update(arguments)
+            parse_expressions = _get_expressions(parse_arguments)
+            self._function = lambda text: (
+                _parse_expressions(text, parse_expressions) if text else []
+            )
+            expressions = [expression for expression, _ in parse_expressions]
+
+        self.expressions: list[Expression] = []
+        for expression in expressions:
+            if isinstance(expression, ExpressionGroup):
+                self.expressions.extend(expression.expressions)
+            else:
+                self.expressions.append(expression)
+        self._indices = {id(e): i for i, e in enumerate(self.expressions)}
+
+    def __call__(self, text: str) -> list[Dimension]:
+        return self._function(text)
+
+    def dump(self, dimensions: list[Dimension]) -> list[tuple]:
+        return [
+            (
+                self._indices.get(id(d.expression), d.expression),
+                d.body,
+                d.value,
+                d.start,
+                d.end,
+                d.dimension_type,
+            )
+            for d in dimensions
+        ]
+
+    def load(self, items: list[tuple]) -> list[Dimension]:
+        return [
+            Dimension(
+                self.expressions[item[0]] if isinstance(item[0], int) else item[0],
+                *item[1:],
+            )
+            for item in items
+        ]
+
+
+_worker_parser: _Parser | None = None
+""" Parser of the current worker process """
+
+
+def _init_worker(name: str, arguments: dict[str, Any]):
+    global _worker_parser
+    _worker_parser = _Parser(name, arguments)
+    # Compile the expressions once
+    _worker_parser(SPACE)
+
+
+def _parse_chunk(texts: list[str]) -> list[list[tuple]]:
+    assert _worker_parser is not None
+    return [_worker_parser.dump(_worker_parser(text)) for text in texts]
+
+
+def _get_chunks(texts: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    iterator = iter(texts)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+
+def _parse_in_workers(
+    parser: _Parser,
+    name: str,
+    arguments: dict[str, Any],
+    texts: Iterable[str],
+    workers: int,
+    chunksize: int,
+) -> Iterator[list[Dimension]]:
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(name, arguments)
+    ) as executor:
+        # Only a few chunks are submitted ahead to keep the memory bounded.
+        pending: deque[Future] = deque()
+        for chunk in _get_chunks(texts, chunksize):
+            pending.append(executor.submit(_parse_chunk, chunk))
+            if len(pending) > 2 * workers:
+                yield from map(parser.load, pending.popleft().result())
+        while pending:
+            yield from map(parser.load, pending.popleft().result())
+
+
+def _parse_many(
+    name: str,
+    arguments: dict[str, Any],
+    texts: Iterable[str],
+    with_index: bool,
+    workers: int | None,
+    chunksize: int,
+):
+    if workers is not None:
+        check_positive_integer(workers, "workers")
+    check_positive_integer(chunksize, "chunksize")
+
+    # Validates the arguments before iterating
+    parser = _Parser(name, arguments)
+
+    results: Iterator[list[Dimension]]
+    if workers is None or workers == 1:
+        results = map(parser, texts)
+    else:
+        results = _parse_in_workers(parser, name, arguments, texts, workers, chunksize)
+
+    if with_index:
+        return enumerate(results)
+    return results
+
+
+def parse_dimension_many(
+    texts: Iterable[str],
+    amount_of_money: bool | None = None,
+    duration: bool | None = None,
+    distance: bool | None = None,
+    numeral: bool | None = None,
+    ordinal: bool | None = None,
+    quantity: bool | None = None,
+    temperature: bool | None = None,
+    time: bool | None = None,
+    volume: bool | None = None,
+    names: bool | None = None,
+    overlap: str | None = None,
+    engine: str = "regex",
+    with_index: bool = False,
+    workers: int | None = None,
+    chunksize: int = 100,
+) -> Iterator[list[Dimension]] | Iterator[tuple[int, list[Dimension]]]:
+    """Applies :func:`~.parse_dimension` to each text of the input ``texts``.
+
+    The arguments are validated and the rules are prepared once for all texts. The
+    results are streamed back in the same order of the input texts.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        Texts to extract dimensions from, can be any iterable (e.g. a file).
+    with_index : bool, optional
+        Yield ``(index, dimensions)`` pairs instead of ``dimensions``,
+        by default False
+    workers : int, optional
+        Number of processes used to parse the texts. The rules are compiled once
+        per process. If None or 1, the texts are parsed in the current process,
+        by default None
+    chunksize : int, optional
+        Number of texts sent to a process at a time, by default 100
+
+    See :func:`~.parse_dimension` for the other arguments.
+
+    Returns
+    -------
+    Iterator[Union[List[:class:`~.Dimension`], Tuple[int, List[:class:`~.Dimension`]]]]
+        Dimensions extracted from each text.
+
+    Raises
+    ------
+    ValueError
+        If no argument is set to True, if ``overlap`` or ``engine`` is not
+        supported or if ``workers`` or ``chunksize`` is not a positive integer.
+
+    Example
+    -------
+
+    .. code:: pycon
+
+        >>> from maha.parsers.functions import parse_dimension_many
+        >>> texts = ["ثلاثة", "لا شيء", "عشرين"]
+        >>> for index, output in parse_dimension_many(texts, numeral=True, with_index=True):
+        ...     print(index, [dimension.value for dimension in output])
+        0 [3]
+        1 []
+        2 [20]
+    """
+    arguments = _get_arguments(parse_dimension, locals())
+    return _parse_many(
+        "parse_dimension", arguments, texts, with_index, workers, chunksize
+    )
+
+
+def parse_many(
+    texts: Iterable[str],
+    arabic: bool = False,
+    english: bool = False,
+    arabic_letters: bool = False,
+    english_letters: bool = False,
+    english_small_letters: bool = False,
+    english_capital_letters: bool = False,
+    numbers: bool = False,
+    harakat: bool = False,
+    all_harakat: bool = False,
+    tatweel: bool = False,
+    punctuations: bool = False,
+    arabic_numbers: bool = False,
+    english_numbers: bool = False,
+    arabic_punctuations: bool = False,
+    english_punctuations: bool = False,
+    arabic_ligatures: bool = False,
+    arabic_hashtags: bool = False,
+    arabic_mentions: bool = False,
+    emails: bool = False,
+    english_hashtags: bool = False,
+    english_mentions: bool = False,
+    hashtags: bool = False,
+    links: bool = False,
+    mentions: bool = False,
+    emojis: bool = False,
+    custom_expressions: ExpressionGroup | Expression | None = None,
+    include_space=False,
+    with_index: bool = False,
+    workers: int | None = None,
+    chunksize: int = 100,
+) -> Iterator[list[Dimension]] | Iterator[tuple[int, list[Dimension]]]:
+    """Applies :func:`~.parse` to each text of the input ``texts``.
+
+    The arguments are validated and the expressions are created once for all texts.
+    The results are streamed back in the same order of the input texts.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        Texts to extract values from, can be any iterable (e.g. a file).
+    with_index : bool, optional
+        Yield ``(index, dimensions)`` pairs instead of ``dimensions``,
+        by default False
+    workers : int, optional
+        Number of processes used to parse the texts. If None or 1, the texts are
+        parsed in the current process, by default None
+    chunksize : int, optional
+        Number of texts sent to a process at a time, by default 100
+
+    See :func:`~.parse` for the other arguments.
+
+    Returns
+    -------
+    Iterator[Union[List[:class:`~.Dimension`], Tuple[int, List[:class:`~.Dimension`]]]]
+        Dimensions extracted from each text.
+
+    Raises
+    ------
+    ValueError
+        If no argument is set to True or if ``workers`` or ``chunksize`` is not a
+        positive integer.
+    """
+    arguments = _get_arguments(parse, locals())
+    return _parse_many("parse", arguments, texts, with_index, workers, chunksize)
+
+
+def _get_arguments(function, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Returns the arguments of the input ``function`` except the text"""
+    parameters = signature(function).parameters
+    return {k: v for k, v in arguments.items() if k in parameters and k != "text"}
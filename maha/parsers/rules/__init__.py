@@ -1,10 +1,59 @@
+"""Rules of the dimension parsers.
+
+The rules are loaded lazily, the patterns of a rule (and the rules it depends on)
+are built on first access, e.g. ``from maha.parsers.rules import RULE_NUMERAL``
+only builds the numeral rules. Patterns are compiled when first used.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+
 from .common import *
-from .distance import *
-from .duration import *
-from .names import *
-from .numeral import *
-from .ordinal import *
-from .time import *
+from .common import __all__ as _common_all
+
+_RULE_MODULES = {
+    "RULE_DISTANCE": ".distance",
+    "RULE_DURATION": ".duration",
+    "parse_duration": ".duration",
+    "RULE_NAME": ".names",
+    "RULE_NUMERAL": ".numeral",
+    "RULE_ORDINAL": ".ordinal",
+    "parse_ordinal": ".ordinal",
+    "RULE_TIME": ".time",
+    "parse_time": ".time",
+}
+""" Maps the names (or prefixes of the names) of the rules to their modules """
+
+
+def _get_rule_module(name: str) -> str | None:
+    for prefix, module in _RULE_MODULES.items():
+        if name == prefix or name.startswith(prefix + "_"):
+            return module
+    return None
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        names = list(_common_all) + ["RULE_NAME"]
+        for module_name in sorted(set(_RULE_MODULES.values()) - {".names"}):
+            names.extend(import_module(f"{module_name}.rule", __name__).__all__)
+        globals()["__all__"] = names
+        return names
+
+    module = _get_rule_module(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(import_module(module, __name__), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__getattr__("__all__")))
 
 
 def compile_rules():
@@ -15,58 +64,23 @@ def compile_rules():
 
 
 def compile_numeral_rules():
-    for rule in [
-        RULE_NUMERAL_ONES,
-        RULE_NUMERAL_TENS,
-        RULE_NUMERAL_HUNDREDS,
-        RULE_NUMERAL_THOUSANDS,
-        RULE_NUMERAL_MILLIONS,
-        RULE_NUMERAL_BILLIONS,
-        RULE_NUMERAL_TRILLIONS,
-        RULE_NUMERAL_INTEGERS,
-        RULE_NUMERAL,
-    ]:
-        rule.compile()
+    _compile_module_rules(".numeral")
 
 
 def compile_ordinal_rules():
-    for rule in [
-        RULE_ORDINAL_ONES,
-        RULE_ORDINAL_TENS,
-        RULE_ORDINAL_HUNDREDS,
-        RULE_ORDINAL_THOUSANDS,
-        RULE_ORDINAL_MILLIONS,
-        RULE_ORDINAL_BILLIONS,
-        RULE_ORDINAL_TRILLIONS,
-        RULE_ORDINAL,
-    ]:
-        rule.compile()
+    _compile_module_rules(".ordinal")
 
 
 def compile_time_rules():
-    for rule in [
-        RULE_TIME_YEARS,
-        RULE_TIME_MONTHS,
-        RULE_TIME_WEEKS,
-        RULE_TIME_DAYS,
-        RULE_TIME_HOURS,
-        RULE_TIME_MINUTES,
-        RULE_TIME_AM_PM,
-        RULE_TIME_NOW,
-        RULE_TIME,
-    ]:
-        rule.compile()
+    _compile_module_rules(".time")
 
 
 def compile_duration_rules():
-    for rule in [
-        RULE_DURATION_SECONDS,
-        RULE_DURATION_MINUTES,
-        RULE_DURATION_HOURS,
-        RULE_DURATION_DAYS,
-        RULE_DURATION_WEEKS,
-        RULE_DURATION_MONTHS,
-        RULE_DURATION_YEARS,
-        RULE_DURATION,
-    ]:
-        rule.compile()
+    _compile_module_rules(".duration")
+
+
+def _compile_module_rules(module_name: str):
+    module = import_module(f"{module_name}.rule", __name__)
+    for name in module.__all__:
+        if name.startswith("RULE_"):
+            getattr(module, name).compile()
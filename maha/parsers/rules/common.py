@@ -30,6 +30,9 @@ __all__ = [
 
 
 from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+import numpy as np
 
 from maha.constants import ALEF_VARIATIONS, ARABIC_COMMA, COMMA, LAM, WAW
 from maha.expressions import EXPRESSION_SPACE, EXPRESSION_SPACE_OR_NONE
@@ -52,6 +55,101 @@ class ValueUnit:
     unit: Unit
 
 
+AGGREGATIONS = ("sum", "min", "max")
+""" Aggregations supported by :func:`aggregate_values` """
+
+
+def get_conversion_matrix(
+    conversion_map: Mapping[Any, Mapping[Any, float]]
+) -> np.ndarray:
+    """Returns the dense matrix of a conversion map of units. The value of the
+    matrix at ``[to_unit.value, from_unit.value]`` is the factor that converts from
+    ``from_unit`` to ``to_unit``, missing conversions are NaN.
+
+    Parameters
+    ----------
+    conversion_map : Dict[Unit, Dict[Unit, float]]
+        Factors that convert each unit (inner key) to another unit (outer key).
+
+    Returns
+    -------
+    numpy.ndarray
+        Conversion matrix.
+    """
+    units = set(conversion_map).union(*conversion_map.values())
+    size = max(unit.value for unit in units) + 1
+    matrix = np.full((size, size), np.nan)
+    for to_unit, factors in conversion_map.items():
+        for from_unit, factor in factors.items():
+            matrix[to_unit.value, from_unit.value] = factor
+    return matrix
+
+
+def convert_value_units(
+    valueunits: Sequence[ValueUnit], matrix: np.ndarray, to_unit: Unit
+) -> np.ndarray:
+    """Converts many values to ``to_unit`` using a matrix of
+    :func:`get_conversion_matrix`.
+
+    Parameters
+    ----------
+    valueunits : Sequence[ValueUnit]
+        Values to convert.
+    matrix : numpy.ndarray
+        Conversion matrix of the units.
+    to_unit : Unit
+        Unit to convert to.
+
+    Returns
+    -------
+    numpy.ndarray
+        Converted values.
+    """
+    size = len(valueunits)
+    units = np.fromiter((v.unit.value for v in valueunits), np.intp, size)
+    values = np.fromiter((v.value for v in valueunits), np.float64, size)
+    return matrix[to_unit.value, units] * values
+
+
+def aggregate_values(
+    values: np.ndarray, groups: np.ndarray, size: int, how: str = "sum"
+) -> np.ndarray:
+    """Aggregates the values of each group.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values to aggregate.
+    groups : numpy.ndarray
+        Group of each value, from 0 to ``size - 1``.
+    size : int
+        Number of groups.
+    how : str, optional
+        Aggregation, one of :data:`AGGREGATIONS`, by default "sum"
+
+    Returns
+    -------
+    numpy.ndarray
+        Aggregated value of each group. Groups without values are 0 for "sum" and
+        NaN for "min" and "max".
+
+    Raises
+    ------
+    ValueError
+        If ``how`` is not supported.
+    """
+    if how == "sum":
+        return np.bincount(groups, weights=values, minlength=size).astype(np.float64)
+    if how in ("min", "max"):
+        output = np.full(size, np.nan)
+        # NaN is ignored by fmin and fmax
+        (np.fmin if how == "min" else np.fmax).at(output, groups, values)
+        return output
+    raise ValueError(
+        f"Invalid aggregation {how!r}, expected one of {', '.join(AGGREGATIONS)}"
+    )
+
+
 def get_fractions_of_unit_pattern(unit: str) -> str:
     """
     Returns the fractions of a unit pattern.
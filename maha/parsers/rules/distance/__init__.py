@@ -1 +1,2 @@
+from .normalize import *
 from .rule import *
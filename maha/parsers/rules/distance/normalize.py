@@ -0,0 +1,123 @@
+"""Normalization of many distances"""
+
+from __future__ import annotations
+
+__all__ = ["normalize_distances", "aggregate_distances"]
+
+
+from typing import Any, Iterable
+
+import numpy as np
+
+from maha.parsers.templates import Dimension, DimensionType, DistanceUnit
+
+from ..common import ValueUnit, aggregate_values, convert_value_units
+from .template import DistanceValue
+from .utils import DISTANCE_CONVERSION_MATRIX
+
+
+def normalize_distances(
+    values: Iterable[Dimension | DistanceValue | ValueUnit],
+    to_unit: DistanceUnit = DistanceUnit.METERS,
+) -> np.ndarray:
+    """Converts many distances to the same unit.
+
+    The distances are converted together using :data:`~.DISTANCE_CONVERSION_MATRIX`,
+    the results are the same as :attr:`~.DistanceValue.normalized_value`.
+
+    Parameters
+    ----------
+    values : Iterable[Union[:class:`~.Dimension`, :class:`~.DistanceValue`, :class:`~.ValueUnit`]]
+        Distances or dimensions of distances.
+    to_unit : :class:`~.DistanceUnit`, optional
+        Unit to convert to, by default :attr:`~.DistanceUnit.METERS`
+
+    Returns
+    -------
+    numpy.ndarray
+        Converted value of each distance.
+
+    Raises
+    ------
+    ValueError
+        If a value is not a distance.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.parsers.functions import parse_dimension
+        >>> from maha.parsers.rules.distance import normalize_distances
+        >>> output = parse_dimension("مترين وعشرين سم", distance=True)
+        >>> normalize_distances(output).tolist()
+        [2.0, 0.2]
+    """
+    valueunits = [_get_valueunit(value) for value in values]
+    return convert_value_units(valueunits, DISTANCE_CONVERSION_MATRIX, to_unit)
+
+
+def aggregate_distances(
+    documents: Iterable[Iterable[Dimension | DistanceValue | ValueUnit]],
+    how: str = "sum",
+    to_unit: DistanceUnit = DistanceUnit.METERS,
+) -> np.ndarray:
+    """Aggregates the distances of each document after converting them to the
+    same unit.
+
+    Parameters
+    ----------
+    documents : Iterable[Iterable[Union[:class:`~.Dimension`, :class:`~.DistanceValue`, :class:`~.ValueUnit`]]]
+        Distances of each document, e.g. the output of
+        :func:`~.parse_dimension_many`. Dimensions of other types are ignored.
+    how : str, optional
+        Aggregation, one of "sum", "min" and "max", by default "sum"
+    to_unit : :class:`~.DistanceUnit`, optional
+        Unit to convert to, by default :attr:`~.DistanceUnit.METERS`
+
+    Returns
+    -------
+    numpy.ndarray
+        Aggregated distance of each document. Documents without distances are 0 for
+        "sum" and NaN for "min" and "max".
+
+    Raises
+    ------
+    ValueError
+        If ``how`` is not supported or if a value is not a distance.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.parsers.functions import parse_dimension_many
+        >>> from maha.parsers.rules.distance import aggregate_distances
+        >>> texts = ["مشيت 3 كيلومتر", "لا شيء", "مترين وعشرين سم"]
+        >>> documents = parse_dimension_many(texts, distance=True)
+        >>> aggregate_distances(documents).tolist()
+        [3000.0, 0.0, 2.2]
+    """
+    valueunits: list[ValueUnit] = []
+    groups: list[int] = []
+    size = 0
+    for index, document in enumerate(documents):
+        size += 1
+        for value in document:
+            if (
+                isinstance(value, Dimension)
+                and value.dimension_type != DimensionType.DISTANCE
+            ):
+                continue
+            valueunits.append(_get_valueunit(value))
+            groups.append(index)
+    values = convert_value_units(valueunits, DISTANCE_CONVERSION_MATRIX, to_unit)
+    return aggregate_values(values, np.array(groups, dtype=np.intp), size, how)
+
+
+def _get_valueunit(value: Any) -> ValueUnit:
+    if isinstance(value, Dimension):
+        value = value.value
+    if isinstance(value, DistanceValue):
+        value = value.valueunit
+    if not isinstance(value, ValueUnit) or not isinstance(value.unit, DistanceUnit):
+        raise ValueError(f"Expected a distance, got {value!r}")
+    return value
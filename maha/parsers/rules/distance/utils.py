@@ -5,7 +5,7 @@ from maha.parsers.templates import DistanceUnit
 __all__ = ["convert_between_distances"]
 
 
-from ..common import ValueUnit
+from ..common import ValueUnit, get_conversion_matrix
 
 DISTANCE_CONVERSION_MAP: dict[DistanceUnit, dict[DistanceUnit, float]] = {
     DistanceUnit.METERS: {
@@ -108,6 +108,9 @@ DISTANCE_CONVERSION_MAP: dict[DistanceUnit, dict[DistanceUnit, float]] = {
         DistanceUnit.INCHES: 1,
     },
 }
+DISTANCE_CONVERSION_MATRIX = get_conversion_matrix(DISTANCE_CONVERSION_MAP)
+""" Dense matrix of :data:`DISTANCE_CONVERSION_MAP` indexed by the values of the
+units, ``[to_unit.value, from_unit.value]`` """
 
 
 def convert_between_distances(
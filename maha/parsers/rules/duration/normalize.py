@@ -0,0 +1,138 @@
+"""Normalization of many durations"""
+
+from __future__ import annotations
+
+__all__ = ["normalize_durations", "aggregate_durations"]
+
+
+from typing import Any, Iterable
+
+import numpy as np
+
+from maha.parsers.templates import Dimension, DimensionType, DurationUnit
+
+from ..common import ValueUnit, aggregate_values, convert_value_units
+from .template import DurationValue
+from .utils import DURATION_CONVERSION_MATRIX
+
+
+def normalize_durations(
+    values: Iterable[Dimension | DurationValue | ValueUnit],
+    to_unit: DurationUnit = DurationUnit.SECONDS,
+) -> np.ndarray:
+    """Converts many durations to the same unit.
+
+    The durations are converted together using :data:`~.DURATION_CONVERSION_MATRIX`,
+    the units of each :class:`~.DurationValue` are summed. The results are the same
+    as :attr:`~.DurationValue.normalized_value`.
+
+    Parameters
+    ----------
+    values : Iterable[Union[:class:`~.Dimension`, :class:`~.DurationValue`, :class:`~.ValueUnit`]]
+        Durations or dimensions of durations.
+    to_unit : :class:`~.DurationUnit`, optional
+        Unit to convert to, by default :attr:`~.DurationUnit.SECONDS`
+
+    Returns
+    -------
+    numpy.ndarray
+        Converted value of each duration.
+
+    Raises
+    ------
+    ValueError
+        If a value is not a duration.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.parsers.functions import parse_dimension
+        >>> from maha.parsers.rules.duration import normalize_durations
+        >>> output = parse_dimension("ساعتين و 30 دقيقة", duration=True)
+        >>> normalize_durations(output).tolist()
+        [9000.0]
+    """
+    valueunits: list[ValueUnit] = []
+    owners: list[int] = []
+    size = 0
+    for index, value in enumerate(values):
+        size += 1
+        for valueunit in _get_valueunits(value):
+            valueunits.append(valueunit)
+            owners.append(index)
+    converted = convert_value_units(valueunits, DURATION_CONVERSION_MATRIX, to_unit)
+    return aggregate_values(converted, np.array(owners, dtype=np.intp), size)
+
+
+def aggregate_durations(
+    documents: Iterable[Iterable[Dimension | DurationValue | ValueUnit]],
+    how: str = "sum",
+    to_unit: DurationUnit = DurationUnit.SECONDS,
+) -> np.ndarray:
+    """Aggregates the durations of each document after converting them to the
+    same unit.
+
+    Parameters
+    ----------
+    documents : Iterable[Iterable[Union[:class:`~.Dimension`, :class:`~.DurationValue`, :class:`~.ValueUnit`]]]
+        Durations of each document, e.g. the output of
+        :func:`~.parse_dimension_many`. Dimensions of other types are ignored.
+    how : str, optional
+        Aggregation, one of "sum", "min" and "max", by default "sum"
+    to_unit : :class:`~.DurationUnit`, optional
+        Unit to convert to, by default :attr:`~.DurationUnit.SECONDS`
+
+    Returns
+    -------
+    numpy.ndarray
+        Aggregated duration of each document. Documents without durations are 0 for
+        "sum" and NaN for "min" and "max".
+
+    Raises
+    ------
+    ValueError
+        If ``how`` is not supported or if a value is not a duration.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.parsers.functions import parse_dimension_many
+        >>> from maha.parsers.rules.duration import aggregate_durations
+        >>> from maha.parsers.templates import DurationUnit
+        >>> texts = ["يومين", "لا شيء", "ساعتين و 30 دقيقة"]
+        >>> documents = parse_dimension_many(texts, duration=True)
+        >>> aggregate_durations(documents, "max", DurationUnit.HOURS).tolist()
+        [48.0, nan, 2.5]
+    """
+    durations: list[Dimension | DurationValue | ValueUnit] = []
+    groups: list[int] = []
+    size = 0
+    for index, document in enumerate(documents):
+        size += 1
+        for value in document:
+            if (
+                isinstance(value, Dimension)
+                and value.dimension_type != DimensionType.DURATION
+            ):
+                continue
+            durations.append(value)
+            groups.append(index)
+    values = normalize_durations(durations, to_unit)
+    return aggregate_values(values, np.array(groups, dtype=np.intp), size, how)
+
+
+def _get_valueunits(value: Any) -> list[ValueUnit]:
+    if isinstance(value, Dimension):
+        value = value.value
+    if isinstance(value, DurationValue):
+        valueunits = value.values
+    else:
+        valueunits = [value]
+    for valueunit in valueunits:
+        if not isinstance(valueunit, ValueUnit) or not isinstance(
+            valueunit.unit, DurationUnit
+        ):
+            raise ValueError(f"Expected a duration, got {value!r}")
+    return valueunits
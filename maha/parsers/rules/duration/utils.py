@@ -4,7 +4,7 @@ __all__ = ["convert_between_durations"]
 
 from maha.parsers.templates import DurationUnit
 
-from ..common import ValueUnit
+from ..common import ValueUnit, get_conversion_matrix
 
 DURATION_CONVERSION_MAP: dict[DurationUnit, dict[DurationUnit, float]] = {
     DurationUnit.SECONDS: {
@@ -71,6 +71,9 @@ DURATION_CONVERSION_MAP: dict[DurationUnit, dict[DurationUnit, float]] = {
         DurationUnit.YEARS: 1,
     },
 }
+DURATION_CONVERSION_MATRIX = get_conversion_matrix(DURATION_CONVERSION_MAP)
+""" Dense matrix of :data:`DURATION_CONVERSION_MAP` indexed by the values of the
+units, ``[to_unit.value, from_unit.value]`` """
 
 
 def convert_between_durations(
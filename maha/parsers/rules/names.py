@@ -1,3 +1,9 @@
-from maha.rexy import Expression
+from maha.rexy import TrieExpression
+from maha.rexy.templates.expression import CACHE_PATH
 
-RULE_NAME = Expression.from_cache("names")
+from .common import EXPRESSION_END, EXPRESSION_START
+
+RULE_NAME = TrieExpression.load(
+    CACHE_PATH / "names.trie", EXPRESSION_START, EXPRESSION_END
+)
+""" Rule to extract names, matched using a memory-mapped trie of names """
@@ -0,0 +1,245 @@
+"""Finite-state engine of the numeral rule"""
+
+from __future__ import annotations
+
+__all__ = ["NumeralMachine", "RULE_NUMERAL_FSM"]
+
+
+from functools import reduce
+
+from maha.expressions import EXPRESSION_SPACE
+from maha.parsers.templates import TokenMachine
+from maha.rexy import non_capturing_group
+
+from ..common import EXPRESSION_END, EXPRESSION_START, WAW_CONNECTOR
+from .rule import (
+    AFTER_FRACTION,
+    BEFORE_FRACTIONS,
+    MULTIPLIERS,
+    MULTIPLIERS_GROUP_NAME,
+    NUMERAL_VALUES,
+    NUMERAL_VALUES_GROUP_NAME,
+    RULE_NUMERAL,
+    _get_token_value,
+)
+from .values import EXPRESSION_OF_FASILA
+
+_BEFORE_FRACTIONS = "before_fractions"
+_AFTER_FRACTION = "after_fraction"
+
+
+class _Accumulator:
+    """Computes the value of a sequence of numeral tokens one token at a time.
+
+    The arithmetic is identical to the regex rule: each numeral starts a new term
+    unless it follows a perfect hundred (e.g. "ثلاثمية وخمسة"), multipliers and
+    after fractions multiply the current term and before fractions multiply the
+    following numeral.
+    """
+
+    __slots__ = ["total", "term", "fraction", "perfect_hundred"]
+
+    def __init__(self):
+        self.total: float = 0
+        self.term: float = 0
+        self.fraction: float | None = None
+        self.perfect_hundred = False
+
+    def push(self, group: str, text: str):
+        value, perfect_hundred = _get_token_value(group, text)
+        if group == NUMERAL_VALUES_GROUP_NAME:
+            if not self.perfect_hundred:
+                self.total += self.term
+                self.term = 0
+            if self.fraction is not None:
+                self.term = self.fraction * value
+                self.fraction = None
+            else:
+                self.term += value
+        elif group == _BEFORE_FRACTIONS:
+            self.fraction = value
+        else:
+            self.term *= value
+        self.perfect_hundred = perfect_hundred
+
+    def value(self) -> float:
+        total = self.total + self.term
+        if total == int(total):
+            total = int(total)
+        return total
+
+
+class _DecimalAccumulator(_Accumulator):
+    """Accumulator of the decimal part, trailing multipliers multiply the whole
+    number instead of the decimal part (e.g. "اربعة فاصلة خمسة مليون")."""
+
+    __slots__ = ["multipliers"]
+
+    def __init__(self):
+        super().__init__()
+        self.multipliers: list[str] = []
+
+    def push(self, group: str, text: str):
+        if group == MULTIPLIERS_GROUP_NAME:
+            self.multipliers.append(text)
+            return
+        for multiplier in self.multipliers:
+            super().push(MULTIPLIERS_GROUP_NAME, multiplier)
+        self.multipliers.clear()
+        super().push(group, text)
+
+    def combine(self, integer: float) -> float:
+        decimal = self.value()
+        if int(decimal) != decimal:
+            output = integer + decimal
+        else:
+            output = integer + decimal / 10 ** len(str(decimal))
+        multipliers = [1, 1] + [
+            _get_token_value(MULTIPLIERS_GROUP_NAME, m)[0]
+            for m in reversed(self.multipliers)
+        ]
+        output *= reduce(lambda x, y: x * y, multipliers)
+        if output.is_integer():
+            output = int(output)
+        return output
+
+
+class NumeralMachine(TokenMachine):
+    """Extracts numerals using a deterministic state machine over numeral tokens.
+
+    Instead of matching the whole :data:`~.RULE_NUMERAL` pattern and sorting its
+    captures, the text is read one token at a time from left to right. Each token
+    is matched using a small pattern of its lexicon (numeral values, multipliers,
+    fractions and the decimal separator ``فاصلة``) that is allowed in the current
+    state, and its value is accumulated as soon as it is read. The extracted values
+    are identical to :data:`~.RULE_NUMERAL`.
+
+    The states are:
+
+    * Start of a term: a numeral value, optionally preceded by a before fraction,
+      e.g. "نص مية".
+    * After a numeral value: a numeral connected with waw, an after fraction,
+      a multiplier, a new term connected with waw or the decimal separator.
+    * After an after fraction or a multiplier: a multiplier, a new term connected
+      with waw or the decimal separator.
+
+    A state without a valid transition ends the numeral.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.parsers.rules.numeral import RULE_NUMERAL_FSM
+        >>> [result.value for result in RULE_NUMERAL_FSM("ثلاثة وعشرين الف وخمسة")]
+        [23005]
+    """
+
+    @property  # type: ignore
+    def pattern(self) -> str:  # type: ignore
+        return RULE_NUMERAL.pattern
+
+    def get_token_patterns(self) -> dict[str, str]:
+        values = NUMERAL_VALUES.join()
+        before_fractions = BEFORE_FRACTIONS.join()
+        return {
+            "start": EXPRESSION_START
+            + non_capturing_group(before_fractions, values)
+            + EXPRESSION_END,
+            NUMERAL_VALUES_GROUP_NAME: values + EXPRESSION_END,
+            MULTIPLIERS_GROUP_NAME: MULTIPLIERS.join() + EXPRESSION_END,
+            _BEFORE_FRACTIONS: before_fractions + EXPRESSION_END,
+            _AFTER_FRACTION: AFTER_FRACTION.join() + EXPRESSION_END,
+            "fasila": EXPRESSION_SPACE
+            + EXPRESSION_OF_FASILA
+            + EXPRESSION_SPACE
+            + EXPRESSION_START,
+            "waw": str(WAW_CONNECTOR),
+            "space": str(EXPRESSION_SPACE),
+        }
+
+    def read(self, text: str, position: int) -> tuple[int, float] | None:
+        integer = _Accumulator()
+        end = self._read_terms(text, position, integer)
+        if end is None:
+            return None
+
+        fasila = self.tokens["fasila"].match(text, end)
+        if fasila is not None:
+            decimal = _DecimalAccumulator()
+            decimal_end = self._read_terms(text, fasila.end(), decimal)
+            if decimal_end is not None:
+                return decimal_end, decimal.combine(integer.value())
+        return end, integer.value()
+
+    def _read_terms(self, text: str, position: int, output: _Accumulator) -> int | None:
+        """Reads terms connected with waw and adds their tokens to ``output``,
+        returns the end of the last term or None if there is no term."""
+        tokens = self.tokens
+        values = tokens[NUMERAL_VALUES_GROUP_NAME].match
+        multipliers = tokens[MULTIPLIERS_GROUP_NAME].match
+        after_fractions = tokens[_AFTER_FRACTION].match
+        waw = tokens["waw"].match
+        space = tokens["space"].match
+
+        position = self._read_term_start(text, position, output)
+        if position < 0:
+            return None
+
+        after_value = True
+        while True:
+            connector = waw(text, position)
+            if after_value and connector is not None:
+                token = values(text, connector.end())
+                if token is not None:
+                    output.push(NUMERAL_VALUES_GROUP_NAME, token.group())
+                    position = token.end()
+                    continue
+
+            separator = space(text, position)
+            if separator is not None:
+                token = None
+                if after_value:
+                    token = after_fractions(text, separator.end())
+                    group = _AFTER_FRACTION
+                if token is None:
+                    token = multipliers(text, separator.end())
+                    group = MULTIPLIERS_GROUP_NAME
+                if token is not None:
+                    output.push(group, token.group())
+                    position = token.end()
+                    after_value = False
+                    continue
+
+            if connector is not None:
+                end = self._read_term_start(text, connector.end(), output)
+                if end >= 0:
+                    position = end
+                    after_value = True
+                    continue
+            return position
+
+    def _read_term_start(self, text: str, position: int, output: _Accumulator) -> int:
+        """Reads a numeral value optionally preceded by a before fraction, returns
+        its end or -1 if there is no value."""
+        tokens = self.tokens
+        values = tokens[NUMERAL_VALUES_GROUP_NAME].match
+
+        fraction = tokens[_BEFORE_FRACTIONS].match(text, position)
+        if fraction is not None:
+            separator = tokens["space"].match(text, fraction.end())
+            token = separator and values(text, separator.end())
+            if token:
+                output.push(_BEFORE_FRACTIONS, fraction.group())
+                output.push(NUMERAL_VALUES_GROUP_NAME, token.group())
+                return token.end()
+
+        token = values(text, position)
+        if token is None:
+            return -1
+        output.push(NUMERAL_VALUES_GROUP_NAME, token.group())
+        return token.end()
+
+
+RULE_NUMERAL_FSM = NumeralMachine()
+""" Finite-state engine equivalent to :data:`~.RULE_NUMERAL`, see
+:class:`NumeralMachine` """
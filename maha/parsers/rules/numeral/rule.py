@@ -12,18 +12,18 @@ __all__ = [
     "RULE_NUMERAL",
 ]
 
-from functools import reduce
+from functools import lru_cache, reduce
 
 from maha.expressions import EXPRESSION_DECIMAL, EXPRESSION_INTEGER, EXPRESSION_SPACE
 from maha.parsers.rules.ordinal.values import ALEF_LAM
 from maha.parsers.templates import FunctionValue
-from maha.parsers.utils import convert_to_number_if_possible
 from maha.rexy import (
     ExpressionGroup,
     named_group,
     non_capturing_group,
     optional_non_capturing_group,
 )
+from maha.utils import convert_to_number_if_possible
 
 from ..common import (
     HALF,
@@ -47,15 +47,13 @@ def numeral_group(pattern):
 
 
 def _construct_numeral(sorted_values) -> float:
-    output = [0] * len(sorted_values)
+    output: list[float] = [0] * len(sorted_values)
     last_numeral_index = 0
     multiply = False
     is_perfect_hundred = False
     for i, (_, dict_value) in enumerate(sorted_values.items()):
         group = dict_value["group"]
-        exp = EXPRESSION_NUMERAL_MAP[group].get_matched_expression(dict_value["value"])
-        assert exp is not None
-        value = next(iter(exp(dict_value["value"]))).value
+        value, perfect_hundred = _get_token_value(group, dict_value["value"])
         if group == NUMERAL_VALUES_GROUP_NAME:
             if not is_perfect_hundred:
                 last_numeral_index = i
@@ -72,9 +70,7 @@ def _construct_numeral(sorted_values) -> float:
         elif group == "after_fraction":
             output[last_numeral_index] *= value
 
-        is_perfect_hundred = bool(
-            perfect_hundreds.get_matched_expression(dict_value["value"])
-        )
+        is_perfect_hundred = perfect_hundred
 
     total = sum(output)
     # to int if possible
@@ -83,6 +79,16 @@ def _construct_numeral(sorted_values) -> float:
     return total
 
 
+@lru_cache(maxsize=4096)
+def _get_token_value(group: str, text: str) -> tuple[float, bool]:
+    """Returns the value of the input numeral token of the input group and whether
+    it is a perfect hundred"""
+    exp = EXPRESSION_NUMERAL_MAP[group].get_matched_expression(text)
+    assert exp is not None
+    value = next(iter(exp(text))).value
+    return value, perfect_hundreds.get_matched_expression(text) is not None
+
+
 def _parse_numeral(sorted_values):
     decimal_part_index = 0
     for k, v in sorted_values.items():
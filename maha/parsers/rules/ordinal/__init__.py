@@ -1 +1,2 @@
+from .machine import *
 from .rule import *
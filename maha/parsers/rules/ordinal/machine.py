@@ -0,0 +1,122 @@
+"""Finite-state engine of the ordinal rule"""
+
+from __future__ import annotations
+
+__all__ = ["OrdinalMachine", "RULE_ORDINAL_FSM"]
+
+
+from maha.expressions import EXPRESSION_SPACE, EXPRESSION_SPACE_OR_NONE
+from maha.parsers.templates import TokenMachine
+from maha.rexy import named_group, non_capturing_group
+
+from ..common import AFTER, EXPRESSION_END, EXPRESSION_START, WORD_SEPARATOR
+from .rule import (
+    RULE_ORDINAL,
+    _get_group_value,
+    after_values,
+    billions_group,
+    hundreds_group,
+    millions_group,
+    ones_group,
+    tens_group,
+    thousands_group,
+    trillions_group,
+)
+
+_GROUPS = {
+    "trillions": trillions_group,
+    "billions": billions_group,
+    "millions": millions_group,
+    "thousands": thousands_group,
+    "hundreds": hundreds_group,
+    "tens": tens_group,
+    "ones": ones_group,
+}
+""" Patterns of the tokens of each group, in the order they are tried """
+_SEQUENCE_GROUPS = ("hundreds", "tens", "ones")
+""" Groups of the tokens that can follow hundreds """
+
+
+class OrdinalMachine(TokenMachine):
+    """Extracts ordinals using a deterministic state machine over ordinal tokens.
+
+    The text is read one token at a time from left to right, each token is matched
+    using the pattern of its group and its value is added as soon as it is read.
+    The extracted values are identical to :data:`~.RULE_ORDINAL`.
+
+    The states are:
+
+    * Start: trillions, billions, millions, thousands, hundreds, tens or ones.
+    * After hundreds: hundreds, tens or ones separated by a word separator.
+    * End: an optional "بعد" followed by a hundred, thousand, million, billion or
+      trillion, e.g. "الحادي عشر بعد المية".
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.parsers.rules.ordinal import RULE_ORDINAL_FSM
+        >>> [result.value for result in RULE_ORDINAL_FSM("الخامس والعشرين")]
+        [25]
+    """
+
+    scan_prefixes = True
+
+    @property  # type: ignore
+    def pattern(self) -> str:  # type: ignore
+        return RULE_ORDINAL.pattern
+
+    def get_token_patterns(self) -> dict[str, str]:
+        patterns = {name: group + EXPRESSION_END for name, group in _GROUPS.items()}
+        patterns["start"] = (
+            EXPRESSION_START + non_capturing_group(*_GROUPS.values()) + EXPRESSION_END
+        )
+        # The separator can end before the spaces that precede the next token
+        patterns["separator"] = WORD_SEPARATOR + EXPRESSION_SPACE_OR_NONE
+        patterns["after_value"] = (
+            EXPRESSION_SPACE
+            + AFTER
+            + EXPRESSION_SPACE
+            + named_group("after_value", after_values.join())
+            + EXPRESSION_END
+        )
+        return patterns
+
+    def read(self, text: str, position: int) -> tuple[int, int]:
+        tokens = self.tokens
+
+        value = 0
+        for name in _GROUPS:
+            token = tokens[name].match(text, position)
+            if token is not None:
+                value += _get_group_value(name, token.group())
+                position = token.end()
+                break
+
+        if name == "hundreds":
+            has_tens = False
+            separator = tokens["separator"].match(text, position)
+            while separator is not None:
+                for name in _SEQUENCE_GROUPS:
+                    token = tokens[name].match(text, separator.end())
+                    if token is not None:
+                        break
+                if token is None:
+                    break
+                # Only the first tens are added
+                if name != "tens" or not has_tens:
+                    value += _get_group_value(name, token.group())
+                has_tens = has_tens or name == "tens"
+                position = token.end()
+                separator = tokens["separator"].match(text, position)
+
+        after = tokens["after_value"].match(text, position)
+        if after is not None:
+            value += _get_group_value("after_value", after.group("after_value"))
+            position = after.end()
+        return position, value
+
+
+RULE_ORDINAL_FSM = OrdinalMachine()
+""" Finite-state engine equivalent to :data:`~.RULE_ORDINAL`, see
+:class:`OrdinalMachine` """
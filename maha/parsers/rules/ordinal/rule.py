@@ -13,9 +13,10 @@ __all__ = [
 ]
 
 
+from functools import lru_cache
+
 from maha.parsers.templates import FunctionValue
 from maha.rexy import (
-    Expression,
     ExpressionGroup,
     named_group,
     non_capturing_group,
@@ -54,41 +55,25 @@ def parse_tens(matched_text):
 
 def parse_ordinal(match):
     groups = match.capturesdict()
-    _trillions = groups.get("trillions")
-    _billions = groups.get("billions")
-    _millions = groups.get("millions")
-    _thousands = groups.get("thousands")
-    _hundreds = groups.get("hundreds")
-    _tens = groups.get("tens")
-    _ones = groups.get("ones")
-    _after_value = groups.get("after_value")
     value = 0
+    for name in ORDINAL_GROUP_NAMES:
+        captures = groups.get(name)
+        if not captures:
+            continue
+        # Only the first tens are added
+        if name == "tens":
+            captures = captures[:1]
+        for text in captures:
+            value += _get_group_value(name, text)
+    return value
 
-    def get_value(groups, expressions: list[ExpressionGroup | Expression]) -> int:
-        exp_group = ExpressionGroup(*expressions)
-        value = 0
-        for group in groups:
-            value += exp_group.get_matched_expression(group).value  # type: ignore
-        return value
-
-    if _trillions:
-        value += get_value(_trillions, [ONE_TRILLION, TWO_TRILLIONS])
-    if _billions:
-        value += get_value(_billions, [ONE_BILLION, TWO_BILLIONS])
-    if _millions:
-        value += get_value(_millions, [ONE_MILLION, TWO_MILLIONS])
-    if _thousands:
-        value += get_value(_thousands, [ONE_THOUSAND, TWO_THOUSANDS])
-    if _hundreds:
-        value += get_value(_hundreds, [perfect_hundreds, ONE_HUNDRED, TWO_HUNDREDS])
-    if _tens:
-        value += parse_tens(_tens[0])
-    if _ones:
-        value += get_value(_ones, [ones])
-    if _after_value:
-        value += get_value(_after_value, [after_values])
 
-    return value
+@lru_cache(maxsize=4096)
+def _get_group_value(name: str, text: str) -> int:
+    """Returns the value of the input ``text`` captured by the group ``name``"""
+    if name == "tens":
+        return parse_tens(text)
+    return GROUP_EXPRESSIONS[name].get_matched_expression(text).value  # type: ignore
 
 
 after_values = ExpressionGroup(
@@ -136,6 +121,28 @@ tens = non_capturing_group(
     eleven_to_nineteen.join(),
 )
 
+ORDINAL_GROUP_NAMES = (
+    "trillions",
+    "billions",
+    "millions",
+    "thousands",
+    "hundreds",
+    "tens",
+    "ones",
+    "after_value",
+)
+""" Names of the groups of the ordinal rules, in the order their values are added """
+GROUP_EXPRESSIONS = {
+    "trillions": ExpressionGroup(ONE_TRILLION, TWO_TRILLIONS),
+    "billions": ExpressionGroup(ONE_BILLION, TWO_BILLIONS),
+    "millions": ExpressionGroup(ONE_MILLION, TWO_MILLIONS),
+    "thousands": ExpressionGroup(ONE_THOUSAND, TWO_THOUSANDS),
+    "hundreds": ExpressionGroup(perfect_hundreds, ONE_HUNDRED, TWO_HUNDREDS),
+    "ones": ones,
+    "after_value": after_values,
+}
+""" Expressions that give the value of the text captured by each group """
+
 tens_group = named_group("tens", tens)
 ones_group = named_group("ones", ones.join())
 hundreds_group = named_group(
@@ -1 +1,3 @@
+from .hijri import *
+from .resolve import *
 from .rule import *
@@ -1,3 +1,9 @@
+from datetime import datetime
+
 from dateutil.relativedelta import SU
 
 START_OF_WEEK = SU.weekday
+INTERVAL_REFERENCE_TIME = datetime(2021, 9, 1)
+""" Time used to compare the start and end of the parsed intervals. The intervals
+are extracted without a reference time, this keeps them independent of the time
+they are resolved against """
@@ -0,0 +1,228 @@
+"""Table of the Umm al-Qura hijri calendar"""
+
+from __future__ import annotations
+
+__all__ = ["HijriCalendar", "HIJRI_CALENDAR"]
+
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from hijri_converter import Hijri, ummalqura
+
+
+class HijriCalendar:
+    """Table of the Umm al-Qura calendar that converts between gregorian and hijri
+    dates in constant time.
+
+    The table holds the gregorian ordinal (see :meth:`datetime.date.toordinal`) of
+    the first day of each hijri month in the supported range, along with the month
+    of each day in the range. Conversions and month lengths are lookups in these
+    arrays. The table is built once from :mod:`hijri_converter` and gives the same
+    results, it can also be saved to and loaded from a file.
+
+    Parameters
+    ----------
+    first_year : int
+        First hijri year of the table.
+    month_starts : numpy.ndarray
+        Gregorian ordinal of the first day of each month starting from the first
+        month of ``first_year``, followed by the ordinal of the day after the last
+        month.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from datetime import date
+        >>> from maha.parsers.rules.time import HIJRI_CALENDAR
+        >>> HIJRI_CALENDAR.to_hijri(date(2021, 9, 1))
+        (1443, 1, 24)
+        >>> HIJRI_CALENDAR.to_gregorian(1443, 9, 1)
+        datetime.date(2022, 4, 2)
+        >>> HIJRI_CALENDAR.month_length(1443, 9)
+        30
+    """
+
+    __slots__ = ["first_year", "month_starts", "_starts", "_months"]
+
+    def __init__(self, first_year: int, month_starts: np.ndarray):
+        month_starts = np.asarray(month_starts, dtype=np.int64)
+        if month_starts.ndim != 1 or (month_starts.size - 1) % 12 != 0:
+            raise ValueError("Expected the starts of whole years and the end")
+        lengths = np.diff(month_starts)
+        if month_starts.size < 13 or (lengths <= 0).any():
+            raise ValueError("Expected increasing month starts")
+
+        self.first_year = first_year
+        self.month_starts = month_starts
+        # Python lists are faster than arrays for scalar lookups
+        self._starts: list[int] = month_starts.tolist()
+        self._months: list[int] = np.repeat(np.arange(lengths.size), lengths).tolist()
+
+    @classmethod
+    def build(cls) -> HijriCalendar:
+        """Builds the table from :mod:`hijri_converter`.
+
+        Returns
+        -------
+        :class:`HijriCalendar`
+            Table of the range supported by :mod:`hijri_converter`.
+        """
+        (first_year, _, _), (last_year, _, _) = ummalqura.HIJRI_RANGE
+        starts = [
+            Hijri(year, month, 1).to_gregorian().toordinal()
+            for year in range(first_year, last_year + 1)
+            for month in range(1, 13)
+        ]
+        starts.append(starts[-1] + Hijri(last_year, 12, 1).month_length())
+        return cls(first_year, np.array(starts, dtype=np.int64))
+
+    @classmethod
+    def load(cls, path: str | Path) -> HijriCalendar:
+        """Loads a table saved with :meth:`save`.
+
+        Parameters
+        ----------
+        path : Union[str, :obj:`pathlib.Path`]
+            Path of the file.
+
+        Returns
+        -------
+        :class:`HijriCalendar`
+            Loaded table.
+        """
+        with np.load(path) as data:
+            return cls(int(data["first_year"]), data["month_starts"])
+
+    def save(self, path: str | Path):
+        """Saves the table to a ``.npz`` file.
+
+        Parameters
+        ----------
+        path : Union[str, :obj:`pathlib.Path`]
+            Path of the file.
+        """
+        with open(path, "wb") as f:
+            np.savez(f, first_year=self.first_year, month_starts=self.month_starts)
+
+    @property
+    def last_year(self) -> int:
+        """Last hijri year of the table"""
+        return self.first_year + (len(self._starts) - 1) // 12 - 1
+
+    def to_hijri(self, value: date) -> tuple[int, int, int]:
+        """Converts a gregorian date to hijri.
+
+        Parameters
+        ----------
+        value : :class:`datetime.date`
+            Gregorian date, can be a :class:`datetime.datetime`.
+
+        Returns
+        -------
+        Tuple[int, int, int]
+            Hijri year, month and day.
+
+        Raises
+        ------
+        OverflowError
+            If the date is out of the range of the table.
+        """
+        day = value.toordinal() - self._starts[0]
+        if not 0 <= day < len(self._months):
+            raise OverflowError("date out of range")
+        index = self._months[day]
+        return (
+            self.first_year + index // 12,
+            index % 12 + 1,
+            day - self._starts[index] + self._starts[0] + 1,
+        )
+
+    def to_gregorian(self, year: int, month: int, day: int) -> date:
+        """Converts a hijri date to gregorian.
+
+        Parameters
+        ----------
+        year : int
+            Hijri year.
+        month : int
+            Hijri month.
+        day : int
+            Hijri day.
+
+        Returns
+        -------
+        :class:`datetime.date`
+            Gregorian date.
+
+        Raises
+        ------
+        OverflowError
+            If the year is out of the range of the table.
+        ValueError
+            If the month or the day is invalid.
+        """
+        month_length = self.month_length(year, month)
+        if not 1 <= day <= month_length:
+            raise ValueError(f"day must be in 1..{month_length} for month")
+        return date.fromordinal(self._starts[self._index(year, month)] + day - 1)
+
+    def month_length(self, year: int, month: int) -> int:
+        """Returns the number of days of a hijri month.
+
+        Parameters
+        ----------
+        year : int
+            Hijri year.
+        month : int
+            Hijri month.
+
+        Returns
+        -------
+        int
+            Number of days, 29 or 30.
+
+        Raises
+        ------
+        OverflowError
+            If the year is out of the range of the table.
+        ValueError
+            If the month is invalid.
+        """
+        index = self._index(year, month)
+        return self._starts[index + 1] - self._starts[index]
+
+    def month_lengths(self, year: int) -> list[int]:
+        """Returns the number of days of each month of a hijri year.
+
+        Parameters
+        ----------
+        year : int
+            Hijri year.
+
+        Returns
+        -------
+        List[int]
+            Number of days of the 12 months.
+
+        Raises
+        ------
+        OverflowError
+            If the year is out of the range of the table.
+        """
+        index = self._index(year, 1)
+        starts = self._starts[index : index + 13]
+        return [end - start for start, end in zip(starts, starts[1:])]
+
+    def _index(self, year: int, month: int) -> int:
+        if not self.first_year <= year <= self.last_year:
+            raise OverflowError("date out of range")
+        if not 1 <= month <= 12:
+            raise ValueError("month must be in 1..12")
+        return (year - self.first_year) * 12 + month - 1
+
+
+HIJRI_CALENDAR = HijriCalendar.build()
+""" Umm al-Qura calendar used to resolve hijri dates """
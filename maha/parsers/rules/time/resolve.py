@@ -0,0 +1,349 @@
+"""Resolution of the extracted time values against reference times"""
+
+from __future__ import annotations
+
+__all__ = ["resolve_times"]
+
+
+from datetime import datetime
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Iterable
+
+import numpy as np
+
+from maha.parsers.templates import Dimension, DimensionType
+
+from . import constants
+from .template import _RELATIVE_ATTRIBUTES, TimeInterval, TimeValue
+
+_DAY = 86_400_000_000
+_HOUR = 3_600_000_000
+_MINUTE = 60_000_000
+_SECOND = 1_000_000
+_LIMIT = 10**7
+""" Relative values larger than this are resolved one at a time, this keeps the
+arithmetic in microseconds within the range of int64 """
+_ABSOLUTE_RANGES = {
+    "year": (1, 9999),
+    "month": (1, 12),
+    "day": (1, 31),
+    "hour": (0, 23),
+    "minute": (0, 59),
+    "second": (0, 59),
+    "microsecond": (0, 999_999),
+}
+""" Supported range of each absolute value, values outside these ranges are
+resolved one at a time """
+_DEFAULT_FIELDS = (0,) * 10 + (-1,) * 8 + (1, 0, 0)
+""" Fields of the values that are resolved one at a time """
+_NAT = np.datetime64("NaT", "us")
+
+_get_relative = attrgetter(*_RELATIVE_ATTRIBUTES)
+_get_absolute = attrgetter(*_ABSOLUTE_RANGES)
+
+
+def resolve_times(
+    values: Iterable[Dimension | TimeValue | TimeInterval],
+    reference_times: Any,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resolves the time values against their reference times, e.g. the time each
+    message was sent at.
+
+    The values are resolved together using :mod:`numpy` ``datetime64`` arithmetic.
+    Values that depend on the calendar in ways the arithmetic doesn't cover, such
+    as hijri dates, are resolved one at a time by adding them to their reference
+    time. Both give the same results as ``reference_time + value``.
+
+    Parameters
+    ----------
+    values : Iterable[Union[:class:`~.Dimension`, :class:`~.TimeValue`, :class:`~.TimeInterval`]]
+        Time values or dimensions of time values to resolve.
+    reference_times : Union[datetime, numpy.datetime64, ArrayLike]
+        Reference time of each value, or a single reference time for all values.
+        Times should be naive, they are converted to ``datetime64[us]``.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        Start and end times of the values as ``datetime64[us]`` arrays. The start and
+        end of a :class:`~.TimeValue` are the same, missing starts and ends of
+        intervals are ``NaT``.
+
+    Raises
+    ------
+    ValueError
+        If a value is not a time value, if the number of reference times is not the
+        same as the number of values, if a reference time is ``NaT`` or if a value
+        can't be resolved.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from datetime import datetime
+        >>> from maha.parsers.functions import parse_dimension
+        >>> from maha.parsers.rules.time import resolve_times
+        >>> values = [
+        ...     parse_dimension("غدا", time=True)[0],
+        ...     parse_dimension("من الساعة 9 الى 11 صباحا", time=True)[0],
+        ... ]
+        >>> starts, ends = resolve_times(
+        ...     values, [datetime(2021, 9, 1, 10), datetime(2022, 1, 31, 8)]
+        ... )
+        >>> [str(time) for time in starts]
+        ['2021-09-02T10:00:00.000000', '2022-01-31T09:00:00.000000']
+        >>> [str(time) for time in ends]
+        ['2021-09-02T10:00:00.000000', '2022-01-31T11:00:00.000000']
+    """
+    items = [_get_time_value(value) for value in values]
+    references = _get_references(reference_times, len(items))
+
+    # Starts and ends are resolved together, ``sides`` is 0 for values, 1 for starts
+    # and 2 for ends of intervals
+    time_values: list[TimeValue] = []
+    indices: list[int] = []
+    sides: list[int] = []
+    for index, item in enumerate(items):
+        if isinstance(item, TimeValue):
+            time_values.append(item)
+            indices.append(index)
+            sides.append(0)
+            continue
+        for side, time_value in ((1, item.start), (2, item.end)):
+            if time_value is not None:
+                time_values.append(time_value)
+                indices.append(index)
+                sides.append(side)
+    resolved = _resolve(time_values, references[indices])
+
+    positions = np.array(indices, dtype=np.int64)
+    is_start = np.array(sides, dtype=np.int64) == 1
+    is_end = np.array(sides, dtype=np.int64) == 2
+    starts = np.full(len(items), _NAT)
+    ends = np.full(len(items), _NAT)
+    starts[positions[~is_end]] = resolved[~is_end]
+    ends[positions[~is_start]] = resolved[~is_start]
+    return starts, ends
+
+
+def _get_time_value(value: Any) -> TimeValue | TimeInterval:
+    if isinstance(value, Dimension):
+        if value.dimension_type != DimensionType.TIME:
+            raise ValueError(
+                f"Expected a time dimension, got {value.dimension_type} dimension"
+            )
+        value = value.value
+    if not isinstance(value, (TimeValue, TimeInterval)):
+        raise ValueError(f"Expected a time value, got {type(value).__name__}")
+    return value
+
+
+def _get_references(reference_times: Any, size: int) -> np.ndarray:
+    references = np.asarray(reference_times, dtype="datetime64[us]")
+    if references.ndim == 0:
+        references = np.full(size, references)
+    elif references.shape != (size,):
+        raise ValueError(
+            f"Expected {size} reference times, got {references.size} reference times"
+        )
+    if np.isnat(references).any():
+        raise ValueError("Reference times can't be NaT")
+    return references
+
+
+def _resolve(values: list[TimeValue], references: np.ndarray) -> np.ndarray:
+    """Resolves each value against its reference time"""
+    fields, scalar = _get_fields(values)
+    output, invalid = _resolve_fields(fields, references)
+    output = output.astype("datetime64[us]")
+    for index in np.flatnonzero(scalar | invalid):
+        reference: datetime = references[index].item()
+        try:
+            output[index] = np.datetime64(reference + values[index], "us")
+        except (ValueError, OverflowError) as error:
+            raise ValueError(
+                f"Can't resolve {values[index]!r} against {reference}"
+            ) from error
+    return output
+
+
+def _get_fields(values: list[TimeValue]) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the fields of the values used by :func:`_resolve_fields` and the mask
+    of the values that are resolved one at a time."""
+    size = len(values)
+    relative = _to_array([_get_relative(value) for value in values], 9)
+    absolute = _to_array([_get_absolute(value) for value in values], 7)
+    weekdays = _to_array([_get_weekday(value.weekday) for value in values], 2)
+    months = _to_array([(value.next_month, value.prev_month) for value in values], 2)
+
+    days_set = ~np.isnan(relative[:, 2])
+    relative = np.nan_to_num(relative, nan=0)
+    months = np.nan_to_num(months, nan=0)
+    absolute_set = ~np.isnan(absolute)
+    absolute = np.where(absolute_set, absolute, -1)
+    low, high = np.array(list(_ABSOLUTE_RANGES.values())).T
+
+    scalar = np.array([bool(value.hijri) for value in values], dtype=bool)
+    scalar |= ~np.all(_is_integer(relative) & (np.abs(relative) < _LIMIT), axis=1)
+    # Relative time values are normalized into the days that weeks overwrite
+    scalar |= (relative[:, 4] != 0) & np.any(relative[:, 5:] != 0, axis=1)
+    scalar |= ~np.all(
+        ~absolute_set
+        | (_is_integer(absolute) & (low <= absolute) & (absolute <= high)),
+        axis=1,
+    )
+    scalar |= ~np.all(_is_integer(weekdays) & (np.abs(weekdays) < _LIMIT), axis=1)
+    scalar |= (weekdays[:, 0] < -1) | (weekdays[:, 0] > 6)
+    scalar |= ~np.all(
+        (months == 0) | (_is_integer(months) & (months >= 1) & (months <= 12)), axis=1
+    )
+
+    fields = np.column_stack([relative, days_set, absolute, weekdays, months])
+    fields[scalar] = _DEFAULT_FIELDS
+    return fields.astype(np.int64).reshape(size, len(_DEFAULT_FIELDS)), scalar
+
+
+def _get_weekday(weekday: Any) -> tuple[Any, Any]:
+    """Returns the weekday and its index, or -1 if there is no weekday"""
+    if weekday is None:
+        return -1, 1
+    if isinstance(weekday, int):
+        return weekday, 1
+    return weekday.weekday, weekday.n or 1
+
+
+def _to_array(rows: list[tuple], width: int) -> np.ndarray:
+    """Converts the rows to a float array, None is converted to NaN and values
+    that are not numbers are converted to infinity."""
+    array = np.fromiter(
+        chain.from_iterable(rows), dtype=object, count=len(rows) * width
+    )
+    array[np.equal(array, None)] = np.nan  # type: ignore
+    try:
+        output = array.astype(np.float64)
+    except (TypeError, ValueError, OverflowError):
+        output = np.array([_to_float(v) for v in array], dtype=np.float64)
+    return output.reshape(len(rows), width)
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return np.inf
+
+
+def _is_integer(array: np.ndarray) -> np.ndarray:
+    return np.isfinite(array) & (array == np.floor(array))
+
+
+def _resolve_fields(
+    fields: np.ndarray, references: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resolves the fields of the values using the same steps as
+    :meth:`~.TimeValue.to_relativedelta` followed by adding the relative delta.
+
+    Returns the resolved times in microseconds and the mask of the values that
+    are out of the supported range of dates.
+    """
+    (
+        years,
+        months,
+        days,
+        leapdays,
+        weeks,
+        hours,
+        minutes,
+        seconds,
+        microseconds,
+        days_set,
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        microsecond,
+        weekday,
+        nth,
+        next_month,
+        prev_month,
+    ) = fields.T
+
+    reference_months = references.astype("datetime64[M]")
+    reference_days = references.astype("datetime64[D]")
+    reference_year = reference_months.astype(np.int64) // 12 + 1970
+    reference_month = reference_months.astype(np.int64) % 12 + 1
+    reference_day = (reference_days - reference_months).astype(np.int64) + 1
+    reference_time = (references - reference_days).astype(np.int64)
+    reference_weekday = (reference_days.astype(np.int64) + 3) % 7
+
+    # Next/prev week
+    start_of_week = (reference_weekday + 7 - constants.START_OF_WEEK) % 7
+    days = days + np.where(
+        days_set,
+        weeks * 7,
+        np.where(
+            weeks > 0,
+            7 - start_of_week + (weeks - 1) * 7,
+            np.where(weeks < 0, 7 * weeks - start_of_week, 0),
+        ),
+    )
+
+    # Next/prev month
+    has_next = next_month > 0
+    has_prev = ~has_next & (prev_month > 0)
+    years = years + (has_next & (next_month <= reference_month))
+    years = years - (has_prev & (prev_month > reference_month))
+    month = np.where(has_next, next_month, np.where(has_prev, prev_month, month))
+
+    # Absolute values, the day is clipped to the length of the month
+    total_months = (
+        (np.where(year > 0, year, reference_year) + years) * 12
+        + np.where(month > 0, month, reference_month)
+        - 1
+        + months
+    )
+    year = total_months // 12
+    invalid = (year < 1) | (year > 9999)
+    total_months = np.where(invalid, (reference_year * 12), total_months) - 1970 * 12
+    month_start = total_months.astype("datetime64[M]").astype("datetime64[D]")
+    month_end = (total_months + 1).astype("datetime64[M]").astype("datetime64[D]")
+    day = np.minimum(
+        (month_end - month_start).astype(np.int64),
+        np.where(day > 0, day, reference_day),
+    )
+    time = (
+        np.where(hour >= 0, hour, reference_time // _HOUR) * _HOUR
+        + np.where(minute >= 0, minute, reference_time // _MINUTE % 60) * _MINUTE
+        + np.where(second >= 0, second, reference_time // _SECOND % 60) * _SECOND
+        + np.where(microsecond >= 0, microsecond, reference_time % _SECOND)
+    )
+
+    # Relative values
+    month = total_months % 12 + 1
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days = days + np.where((month > 2) & is_leap, leapdays, 0)
+    output = (
+        (month_start.astype(np.int64) + day - 1 + days) * _DAY
+        + time
+        + hours * _HOUR
+        + minutes * _MINUTE
+        + seconds * _SECOND
+        + microseconds
+    )
+
+    # Weekday
+    output_weekday = (output // _DAY + 3) % 7
+    jump = (np.abs(nth) - 1) * 7 + np.where(
+        nth > 0, (7 - output_weekday + weekday) % 7, (output_weekday - weekday) % 7
+    )
+    output = output + np.where(weekday >= 0, np.where(nth > 0, jump, -jump) * _DAY, 0)
+
+    lowest = np.datetime64("0001-01-01", "us").astype(np.int64)
+    highest = np.datetime64("9999-12-31T23:59:59.999999", "us").astype(np.int64)
+    invalid |= (output < lowest) | (output > highest)
+    return output, invalid
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 __all__ = [
     "RULE_TIME_YEARS",
     "RULE_TIME_MONTHS",
@@ -11,13 +13,34 @@ __all__ = [
     "parse_time",
 ]
 
-from datetime import datetime
-
 from maha.parsers.rules.time.template import TimeInterval
 
 from ..common import FROM, TO, combine_patterns
+from . import constants
 from .values import *
 
+_INTERVAL_PROPERTIES = (
+    "microsecond",
+    "second",
+    "minute",
+    "hour",
+    "day",
+    "weekday",
+    "month",
+    "year",
+    "years",
+    "months",
+    "weeks",
+    "days",
+    "leapdays",
+    "hours",
+    "minutes",
+    "seconds",
+    "microseconds",
+)
+""" Properties copied from the start time to the end time of an interval, in order,
+until the end time is greater than the start time """
+
 
 def get_combined_value(groups, expression: ExpressionGroup):
     value = TimeValue()
@@ -34,43 +57,29 @@ def process_time_interval(start_time: TimeValue, end_time: TimeValue):
         if getattr(end_time, value) is not None and getattr(start_time, value) is None:
             setattr(start_time, value, getattr(end_time, value))
 
-    def get_end_if_none(value: str, none_value=None):
+    def get_end_if_none(value: str, none_value=None) -> TimeValue | None:
         if (
             getattr(start_time, value) is not none_value
             and getattr(end_time, value) is none_value
         ):
             return TimeValue(**{value: getattr(start_time, value)})
-        return TimeValue()
+        return None
 
-    now = datetime(2021, 9, 1)
+    now = constants.INTERVAL_REFERENCE_TIME
     # always set am/pm to both if one is set
     set_start_if_none("am_pm")
-    end_time += get_end_if_none("am_pm")
+    end_time += get_end_if_none("am_pm") or TimeValue()
 
-    for prop in [
-        "microsecond",
-        "second",
-        "minute",
-        "hour",
-        "day",
-        "weekday",
-        "month",
-        "year",
-        "years",
-        "months",
-        "weeks",
-        "days",
-        "leapdays",
-        "hours",
-        "minutes",
-        "seconds",
-        "microseconds",
-    ]:
-        from_time = start_time + now
-        to_time = end_time + now
+    # Only the end time changes, it is recomputed when a value is copied to it
+    from_time = start_time + now
+    to_time = end_time + now
+    for prop in _INTERVAL_PROPERTIES:
         if from_time < to_time:
             break
-        end_time += get_end_if_none(prop, 0 if prop[-1] == "s" else None)
+        value = get_end_if_none(prop, 0 if prop[-1] == "s" else None)
+        if value is not None:
+            end_time += value
+            to_time = end_time + now
 
     return TimeInterval(start_time, end_time)
 
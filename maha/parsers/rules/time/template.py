@@ -3,20 +3,65 @@ from __future__ import annotations
 __all__ = ["TimeValue", "TimeInterval"]
 
 
+from copy import copy
 from dataclasses import dataclass
 from datetime import datetime
 
-from dateutil.relativedelta import relativedelta
-from hijri_converter import Gregorian, Hijri
+from dateutil.relativedelta import relativedelta, weekdays
 
 from . import constants
+from .hijri import HIJRI_CALENDAR
+
+_RELATIVE_ATTRIBUTES = (
+    "_years",
+    "_months",
+    "_days",
+    "_leapdays",
+    "_weeks",
+    "_hours",
+    "_minutes",
+    "_seconds",
+    "_microseconds",
+)
+""" Attributes of the relative values, these are summed when values are added """
+_ABSOLUTE_ATTRIBUTES = (
+    "year",
+    "month",
+    "day",
+    "weekday",
+    "hour",
+    "minute",
+    "second",
+    "microsecond",
+    "next_month",
+    "prev_month",
+)
+""" Attributes of the absolute values, these are replaced when values are added """
+
+
+def _add(value1, value2):
+    if value1 is not None and value2 is not None:
+        return value1 + value2
+    if value1 is None:
+        return value2
+    return value1
+
+
+class TimeValue:
+    """Time value extracted from text, relative to a reference date.
+
+    Relative values (e.g. ``days``) shift the reference date, absolute values
+    (e.g. ``day``) replace its fields. Unlike
+    :class:`~dateutil.relativedelta.relativedelta`, the values are stored as they
+    are without normalization, and unset values are None. Values are combined using
+    ``+`` or in place using ``+=``, and applied to a date by adding them to a
+    :class:`~datetime.datetime` or using :meth:`to_relativedelta`.
+    """
+
+    __slots__ = _RELATIVE_ATTRIBUTES + _ABSOLUTE_ATTRIBUTES + ("_am_pm", "hijri")
 
-
-class TimeValue(relativedelta):
     def __init__(
         self,
-        dt1=None,
-        dt2=None,
         years=None,
         months=None,
         days=None,
@@ -30,8 +75,6 @@ class TimeValue(relativedelta):
         month=None,
         day=None,
         weekday=None,
-        yearday=None,
-        nlyearday=None,
         hour=None,
         minute=None,
         second=None,
@@ -41,29 +84,6 @@ class TimeValue(relativedelta):
         prev_month=None,
         hijri=None,
     ):
-
-        super().__init__(
-            dt1=dt1,
-            dt2=dt2,
-            years=years if years is not None else 0,
-            months=months if months is not None else 0,
-            days=days if days is not None else 0,
-            leapdays=leapdays if leapdays is not None else 0,
-            hours=hours if hours is not None else 0,
-            minutes=minutes if minutes is not None else 0,
-            seconds=seconds if seconds is not None else 0,
-            microseconds=microseconds if microseconds is not None else 0,
-            year=year,
-            month=month,
-            day=day,
-            weekday=weekday,
-            yearday=yearday,
-            nlyearday=nlyearday,
-            hour=hour,
-            minute=minute,
-            second=second,
-            microsecond=microsecond,
-        )
         self._years = years
         self._months = months
         self._days = days
@@ -73,6 +93,16 @@ class TimeValue(relativedelta):
         self._minutes = minutes
         self._seconds = seconds
         self._microseconds = microseconds
+        self.year = year
+        self.month = month
+        self.day = day
+        if isinstance(weekday, int):
+            weekday = weekdays[weekday]
+        self.weekday = weekday
+        self.hour = hour
+        self.minute = minute
+        self.second = second
+        self.microsecond = microsecond
         self.next_month = next_month
         self.prev_month = prev_month
         self.am_pm = am_pm
@@ -89,6 +119,22 @@ class TimeValue(relativedelta):
         if am_pm == "PM" and self.hour is not None and self.hour < 12:
             self.hour += 12
 
+    @property
+    def years(self):
+        return self._years or 0
+
+    @years.setter
+    def years(self, value):
+        self._years = value
+
+    @property
+    def months(self):
+        return self._months or 0
+
+    @months.setter
+    def months(self, value):
+        self._months = value
+
     @property
     def weeks(self):
         return self._weeks or 0
@@ -97,6 +143,54 @@ class TimeValue(relativedelta):
     def weeks(self, value):
         self._weeks = value
 
+    @property
+    def days(self):
+        return self._days or 0
+
+    @days.setter
+    def days(self, value):
+        self._days = value
+
+    @property
+    def leapdays(self):
+        return self._leapdays or 0
+
+    @leapdays.setter
+    def leapdays(self, value):
+        self._leapdays = value
+
+    @property
+    def hours(self):
+        return self._hours or 0
+
+    @hours.setter
+    def hours(self, value):
+        self._hours = value
+
+    @property
+    def minutes(self):
+        return self._minutes or 0
+
+    @minutes.setter
+    def minutes(self, value):
+        self._minutes = value
+
+    @property
+    def seconds(self):
+        return self._seconds or 0
+
+    @seconds.setter
+    def seconds(self, value):
+        self._seconds = value
+
+    @property
+    def microseconds(self):
+        return self._microseconds or 0
+
+    @microseconds.setter
+    def microseconds(self, value):
+        self._microseconds = value
+
     def is_years_set(self):
         return self._years is not None or self.year is not None
 
@@ -130,116 +224,132 @@ class TimeValue(relativedelta):
     def is_hijri_set(self):
         return self.hijri is not None
 
-    def _add(self, value1, value2):
-        if value1 is not None and value2 is not None:
-            return value1 + value2
-        if value1 is None:
-            return value2
-        if value2 is None:
-            return value1
-
-    def __add__(self, other):
-        if isinstance(other, TimeValue):
-            return self.__class__(
-                years=self._add(other._years, self._years),
-                months=self._add(other._months, self._months),
-                days=self._add(other._days, self._days),
-                leapdays=self._add(other._leapdays, self._leapdays),
-                weeks=self._add(other._weeks, self._weeks),
-                hours=self._add(other._hours, self._hours),
-                minutes=self._add(other._minutes, self._minutes),
-                seconds=self._add(other._seconds, self._seconds),
-                microseconds=self._add(other._microseconds, self._microseconds),
-                year=(other.year if other.year is not None else self.year),
-                month=(other.month if other.month is not None else self.month),
-                day=(other.day if other.day is not None else self.day),
-                weekday=(other.weekday if other.weekday is not None else self.weekday),
-                hour=(other.hour if other.hour is not None else self.hour),
-                minute=(other.minute if other.minute is not None else self.minute),
-                second=(other.second if other.second is not None else self.second),
-                microsecond=(
-                    other.microsecond
-                    if other.microsecond is not None
-                    else self.microsecond
-                ),
-                am_pm=other.am_pm or self.am_pm,
-                next_month=(
-                    other.next_month
-                    if other.next_month is not None
-                    else self.next_month
-                ),
-                prev_month=(
-                    other.prev_month
-                    if other.prev_month is not None
-                    else self.prev_month
-                ),
-                hijri=other.hijri or self.hijri,
-            )
-
-        old_values = self.__dict__.copy()
+    def to_relativedelta(self, date: datetime | None = None) -> relativedelta:
+        """Converts the value to :class:`~dateutil.relativedelta.relativedelta`.
+
+        Weeks, hijri dates and the next/previous month depend on the date the
+        value is applied to, these are only converted if ``date`` is given.
+
+        Parameters
+        ----------
+        date : datetime, optional
+            Date the value is applied to, by default None
+
+        Returns
+        -------
+        :class:`~dateutil.relativedelta.relativedelta`
+            Equivalent relative delta, adding it to ``date`` gives the same result
+            as adding the value.
+        """
+        value = relativedelta(
+            years=self.years,
+            months=self.months,
+            days=self.days,
+            leapdays=self.leapdays,
+            hours=self.hours,
+            minutes=self.minutes,
+            seconds=self.seconds,
+            microseconds=self.microseconds,
+            year=self.year,
+            month=self.month,
+            day=self.day,
+            weekday=self.weekday,
+            hour=self.hour,
+            minute=self.minute,
+            second=self.second,
+            microsecond=self.microsecond,
+        )
+        if date is None:
+            return value
 
         # Handle next/prev week
-        if isinstance(other, datetime) and self.weeks:
-            self.days = self._days or 0
-            current_day = other.weekday()
+        if self.weeks:
+            value.days = self.days
+            current_day = date.weekday()
             if self._days is not None:
-                self.days += self.weeks * 7
+                value.days += self.weeks * 7
             else:
                 start_of_week = (current_day + 7 - constants.START_OF_WEEK) % 7
                 # next week(s)
                 if self.weeks > 0:
-                    self.days += 7 - start_of_week + (self.weeks - 1) * 7
+                    value.days += 7 - start_of_week + (self.weeks - 1) * 7
                 # prev week(s)
                 elif self.weeks < 0:
-                    self.days -= start_of_week - 7 * self.weeks
+                    value.days -= start_of_week - 7 * self.weeks
 
         # Handle hijri date
-        if isinstance(other, datetime) and self.hijri:
-            current_hijri = Gregorian.fromdate(other.date()).to_hijri()
-            hijri_year = self.year or current_hijri.year
-            hijri_month = self.month or current_hijri.month
-            hijri_day = self.day or current_hijri.day
-            month_lengths = [0] + [
-                Hijri(hijri_year, i, 1).month_length() for i in range(1, 13)
-            ]
+        if self.hijri:
+            current_year, current_month, current_day = HIJRI_CALENDAR.to_hijri(date)
+            hijri_year = value.year or current_year
+            hijri_month = value.month or current_month
+            hijri_day = value.day or current_day
+            month_lengths = [0] + HIJRI_CALENDAR.month_lengths(hijri_year)
             hijri_day = min(hijri_day, month_lengths[hijri_month])
-            hijri_year += self.years
-            hijri_month += self.months
-            hijri_day += self.days
+            hijri_year += value.years
+            hijri_month += value.months
+            hijri_day += value.days
 
             while hijri_day > month_lengths[hijri_month]:
                 if hijri_month > 12:
-                    hijri_year += self.months // 12
-                    hijri_month = self.months % 12
+                    hijri_year += value.months // 12
+                    hijri_month = value.months % 12
                 hijri_day -= month_lengths[hijri_month]
                 hijri_month += 1
 
             if self.next_month:
-                hijri_year += 1 if self.next_month <= current_hijri.month else 0
+                hijri_year += 1 if self.next_month <= current_month else 0
                 hijri_month = self.next_month
             elif self.prev_month:
-                hijri_year += 0 if self.prev_month <= current_hijri.month else -1
+                hijri_year += 0 if self.prev_month <= current_month else -1
                 hijri_month = self.prev_month
 
-            new_date = Hijri(hijri_year, hijri_month, hijri_day).to_gregorian()
-            self.year = new_date.year
-            self.month = new_date.month
-            self.day = new_date.day
-            self.years = 0
-            self.months = 0
-            self.days = 0
-        elif isinstance(other, datetime):
-            current_month = other.month
+            new_date = HIJRI_CALENDAR.to_gregorian(hijri_year, hijri_month, hijri_day)
+            value.year = new_date.year
+            value.month = new_date.month
+            value.day = new_date.day
+            value.years = 0
+            value.months = 0
+            value.days = 0
+        else:
+            current_month = date.month
             if self.next_month:
-                self.years += 1 if self.next_month <= current_month else 0
-                self.month = self.next_month
+                value.years += 1 if self.next_month <= current_month else 0
+                value.month = self.next_month
             elif self.prev_month:
-                self.years += 0 if self.prev_month <= current_month else -1
-                self.month = self.prev_month
+                value.years += 0 if self.prev_month <= current_month else -1
+                value.month = self.prev_month
+
+        return value
 
-        output = super().__add__(other)
-        self.__dict__ = old_values
-        return output
+    def __iadd__(self, other):
+        if not isinstance(other, TimeValue):
+            return NotImplemented
+        for attr in _RELATIVE_ATTRIBUTES:
+            setattr(self, attr, _add(getattr(other, attr), getattr(self, attr)))
+        for attr in _ABSOLUTE_ATTRIBUTES:
+            value = getattr(other, attr)
+            if value is not None:
+                setattr(self, attr, value)
+        self.hijri = other.hijri or self.hijri
+        self.am_pm = other.am_pm or self.am_pm
+        return self
+
+    def __add__(self, other):
+        if isinstance(other, TimeValue):
+            value = copy(self)
+            value += other
+            return value
+        if isinstance(other, datetime):
+            return other + self.to_relativedelta(other)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __copy__(self):
+        value = self.__class__.__new__(self.__class__)
+        for attr in self.__slots__:
+            setattr(value, attr, getattr(self, attr))
+        return value
 
     def __repr__(self):
         l = []
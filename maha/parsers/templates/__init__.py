@@ -1,4 +1,5 @@
 from .dimension import *
 from .enums import *
 from .text_expression import *
+from .token_machine import *
 from .value_expressions import *
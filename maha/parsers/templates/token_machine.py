@@ -0,0 +1,113 @@
+__all__ = ["TokenMachine"]
+
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+import regex as re
+from regex import Pattern
+
+from maha.rexy import Expression, ExpressionResult, get_concurrent, get_prefix_pattern
+
+_COMPILE_LOCK = threading.Lock()
+""" Lock of the lazy compilation of the token patterns """
+
+
+class TokenMachine(Expression):
+    """Base class of the expressions that extract values using a deterministic
+    state machine, the text is read one token at a time from left to right.
+
+    Subclasses define the patterns of the tokens in :meth:`get_token_patterns` and
+    read a value starting at a position in :meth:`read`. The ``"start"`` pattern
+    must match the first token of the values, the text is searched for it and
+    :meth:`read` is called at each position it matches at.
+    """
+
+    __slots__ = ["_tokens", "_candidates"]
+
+    scan_prefixes = False
+    """ If True, the ``"start"`` pattern is only matched at the positions where its
+    first characters are found, similar to :class:`~.ExpressionScanner`. This is
+    faster than searching for large start patterns with few possible prefixes """
+
+    def __init__(self):
+        self.pickle = False
+        self._compiled_pattern = None  # type: ignore
+        self._tokens: Optional[Dict[str, Pattern]] = None
+        self._candidates: Optional[Pattern] = None
+
+    @property  # type: ignore
+    def pattern(self) -> str:  # type: ignore
+        """Equivalent regular expression, used by the regex based methods such as
+        :meth:`~.Expression.search` and :meth:`~.Expression.sub`."""
+        raise NotImplementedError
+
+    def get_token_patterns(self) -> Dict[str, str]:
+        """Returns the pattern of each token name"""
+        raise NotImplementedError
+
+    def read(self, text: str, position: int) -> Optional[Tuple[int, Any]]:
+        """Reads the value that starts at ``position``.
+
+        Parameters
+        ----------
+        text : str
+            Text to read the value from.
+        position : int
+            Position at which the ``"start"`` token matched.
+
+        Returns
+        -------
+        Optional[Tuple[int, Any]]
+            End and value, or None if there is no value at ``position``.
+        """
+        raise NotImplementedError
+
+    @property
+    def tokens(self) -> Dict[str, Pattern]:
+        """Compiled patterns of the tokens"""
+        self.compile()
+        return self._tokens  # type: ignore
+
+    def compile(self):
+        if self._tokens is not None:
+            return
+        with _COMPILE_LOCK:
+            if self._tokens is not None:
+                return
+            patterns = {k: str(v) for k, v in self.get_token_patterns().items()}
+            prefix = None
+            if self.scan_prefixes:
+                prefix = get_prefix_pattern(patterns["start"])
+            if prefix is not None:
+                self._candidates = re.compile(f"(?={prefix})", re.MULTILINE)
+            self._tokens = {k: re.compile(v) for k, v in patterns.items()}
+
+    def parse(self, text: str) -> Iterable[ExpressionResult]:
+        next_position = 0
+        for position in self._find_starts(text):
+            if position < next_position:
+                continue
+            output = self.read(text, position)
+            if output is not None:
+                next_position, value = output
+                yield ExpressionResult(position, next_position, value, self)
+
+    def _find_starts(self, text: str) -> Iterator[int]:
+        """Yields the positions at which the ``"start"`` pattern matches"""
+        start = self.tokens["start"]
+        concurrent = get_concurrent()
+        if self._candidates is None:
+            match = start.search(text, concurrent=concurrent)
+            while match is not None:
+                yield match.start()
+                match = start.search(text, match.start() + 1, concurrent=concurrent)
+        else:
+            for candidate in self._candidates.finditer(text, concurrent=concurrent):
+                if start.match(text, candidate.start()) is not None:
+                    yield candidate.start()
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
@@ -1,3 +1,8 @@
 from .base_processor import *
 from .basic_processors import *
+from .compression import *
+from .duplicates import *
+from .plan import *
+from .readers import *
+from .statistics import *
 from .stream_processors import *
@@ -24,8 +24,10 @@ from maha.cleaners.functions import (
     replace_pairs,
 )
 from maha.rexy import Expression, ExpressionGroup
+from maha.utils import check_positive_integer
 
-from .utils import ObjectGet
+from .duplicates import NearDuplicateFilter
+from .statistics import TextStatistics
 
 
 class BaseProcessor(ABC):
@@ -77,14 +79,34 @@ class BaseProcessor(ABC):
         """
         raise NotImplementedError()
 
+    def filter_chunks(self, fn: Callable[[list[str]], list[str]]):
+        """Keeps the lines returned by the input function, it is called with
+        consecutive chunks of lines in order and can keep a state between chunks
+
+        Parameters
+        ----------
+        fn :
+            Function that returns the lines to keep from a list of lines
+        """
+        raise NotImplementedError()
+
     def get(
         self,
         unique_characters: bool = False,
         character_length: bool = False,
         word_length: bool = False,
+        character_frequency: bool = False,
+        arabic_ratio: bool = False,
+        harakat_density: bool = False,
+        length_percentiles: bool = False,
+        n_lines: int = 1000,
     ):
         """Returns statistics about the provided text
 
+        The lines are read ``n_lines`` at a time and accumulated in a
+        :class:`~.TextStatistics`, so the text is never loaded at once by the stream
+        processors.
+
         Parameters
         ----------
         unique_characters : bool, optional
@@ -93,6 +115,19 @@ class BaseProcessor(ABC):
             Return the character length of each string, by default False
         word_length : bool, optional
             Return the word length of each string (split by space), by default False
+        character_frequency : bool, optional
+            Return the number of occurrences of each character, from the most
+            common, by default False
+        arabic_ratio : bool, optional
+            Return the ratio of Arabic letters to Arabic and English letters,
+            by default False
+        harakat_density : bool, optional
+            Return the number of harakat per Arabic letter, by default False
+        length_percentiles : bool, optional
+            Return the percentiles of the character and word lengths, see
+            :data:`~.LENGTH_PERCENTILES`, by default False
+        n_lines : int, optional
+            Number of lines to read at a time, by default 1000
 
         Returns
         -------
@@ -101,48 +136,28 @@ class BaseProcessor(ABC):
             * If more than one argument is set to True, a dictionary is returned where
                 keys are the True passed arguments with the corresponding values
 
+        Raises
+        ------
+        ValueError
+            If ``n_lines`` is not a positive integer.
         """
-
-        objects = []
-        if unique_characters:
-            objects.append(
-                ObjectGet(
-                    func=lambda prev, current: prev | set(current),
-                    prev=set(),
-                    name="unique_characters",
-                    post_fn=list,
-                )
-            )
-
-        if character_length:
-            objects.append(
-                ObjectGet(
-                    func=lambda prev, current: prev + [len(current)],
-                    prev=[],
-                    name="character_length",
-                )
-            )
-
-        if word_length:
-            objects.append(
-                ObjectGet(
-                    func=lambda prev, current: prev + [len(current.split())],
-                    prev=[],
-                    name="word_length",
-                )
-            )
-        for line in self.get_lines(1):
-            line = line[0]
-            for obj in objects:
-                obj.prev = obj.func(obj.prev, line)
-
-        output = {}
-        if len(objects) == 1:
-            output = objects[0].post_fn(objects[0].prev)
-        else:
-            for obj in objects:
-                output[obj.name] = obj.post_fn(obj.prev)
-
+        check_positive_integer(n_lines, "n_lines")
+        selected = {
+            "unique_characters": unique_characters,
+            "character_length": character_length,
+            "word_length": word_length,
+            "character_frequency": character_frequency,
+            "arabic_ratio": arabic_ratio,
+            "harakat_density": harakat_density,
+            "length_percentiles": length_percentiles,
+        }
+        statistics = TextStatistics(name for name, value in selected.items() if value)
+        for lines in self.get_lines(n_lines):
+            statistics.update(lines)
+
+        output = statistics.get()
+        if len(output) == 1:
+            return next(iter(output.values()))
         return output
 
     def print_unique_characters(self):
@@ -313,10 +328,7 @@ class BaseProcessor(ABC):
         if operator is None:
             raise ValueError("operator cannot be None")
 
-        arguments = locals()
-        self.filter(
-            lambda text: not contains(text, **self._arguments_except_self(arguments))
-        )
+        self.filter(partial(_not_contains, **self._arguments_except_self(locals())))
 
         return self
 
@@ -335,9 +347,7 @@ class BaseProcessor(ABC):
             True to switch to word level, which splits the text by space,
             by default False
         """
-        self.filter(
-            lambda line: (len(line.split()) if word_level else len(line)) >= length
-        )
+        self.filter(partial(_has_length_at_least, length=length, word_level=word_level))
         return self
 
     def drop_lines_above_len(self, length: int, word_level=False):
@@ -351,10 +361,54 @@ class BaseProcessor(ABC):
             True to switch to word level, which splits the text by space,
             by default False
         """
-        filter_fn = (
-            lambda line: (len(line.split()) if word_level else len(line)) <= length
+        self.filter(partial(_has_length_at_most, length=length, word_level=word_level))
+        return self
+
+    def drop_near_duplicates(
+        self,
+        threshold: float = 0.9,
+        shingle: str = "character",
+        shingle_size: int | None = None,
+        num_perm: int = 128,
+        seed: int = 0,
+    ):
+        """Drops lines that are similar to a previous line, e.g. retweets with
+        added mentions or hashtags. The first line of the similar lines is kept.
+
+        Lines are similar if the Jaccard similarity of their shingles, overlapping
+        sequences of characters or words, is at least ``threshold``. The similarity
+        is estimated using MinHash and LSH, see :class:`~.NearDuplicateFilter`.
+        Lines are compared after the previously selected functions are applied.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            Minimum estimated Jaccard similarity of near duplicates, by default 0.9
+        shingle : str, optional
+            Shingles of ``"character"`` or ``"word"``, by default "character"
+        shingle_size : int, optional
+            Number of characters or words of each shingle, by default 5 characters
+            or 2 words
+        num_perm : int, optional
+            Number of hashes of the MinHash signatures, by default 128
+        seed : int, optional
+            Seed of the hashes, by default 0
+
+        Raises
+        ------
+        ValueError
+            If ``threshold`` is not in the interval (0, 1], ``shingle`` is invalid
+            or ``shingle_size`` or ``num_perm`` is not a positive integer.
+        """
+        self.filter_chunks(
+            NearDuplicateFilter(
+                threshold=threshold,
+                shingle=shingle,
+                shingle_size=shingle_size,
+                num_perm=num_perm,
+                seed=seed,
+            )
         )
-        self.filter(filter_fn)
         return self
 
     def drop_lines_contain_repeated_substring(self, repeated=3):
@@ -366,7 +420,7 @@ class BaseProcessor(ABC):
             Minimum number of repetitions, by default 3
 
         """
-        self.filter(lambda line: not contains_repeated_substring(line, repeated))
+        self.filter(partial(_not_contains_repeated_substring, repeated=repeated))
         return self
 
     def drop_lines_contain_single_letter_word(
@@ -385,10 +439,10 @@ class BaseProcessor(ABC):
         See also :func:`~.connect_single_letter_word`.
         """
 
-        arguments = locals()
         self.filter(
-            lambda text: not contains_single_letter_word(
-                text, **self._arguments_except_self(arguments)
+            partial(
+                _not_contains_single_letter_word,
+                **self._arguments_except_self(locals()),
             )
         )
         return self
@@ -438,12 +492,37 @@ class BaseProcessor(ABC):
         if operator is None:
             raise ValueError("operator cannot be None")
 
-        arguments = locals()
-        self.filter(
-            lambda text: bool(contains(text, **self._arguments_except_self(arguments)))
-        )
+        self.filter(partial(_contains, **self._arguments_except_self(locals())))
         return self
 
     def _arguments_except_self(self, arguments: dict):
         """Used in combination with local() to return all arguments withoutself"""
         return {k: v for k, v in arguments.items() if k not in ["self", "arguments"]}
+
+
+# Filters are module-level functions (instead of lambdas) so the selected
+# functions can be pickled and sent to other processes.
+
+
+def _contains(text: str, **kwargs) -> bool:
+    return bool(contains(text, **kwargs))
+
+
+def _not_contains(text: str, **kwargs) -> bool:
+    return not contains(text, **kwargs)
+
+
+def _not_contains_repeated_substring(text: str, repeated: int) -> bool:
+    return not contains_repeated_substring(text, repeated)
+
+
+def _not_contains_single_letter_word(text: str, **kwargs) -> bool:
+    return not contains_single_letter_word(text, **kwargs)
+
+
+def _has_length_at_least(text: str, length: int, word_level: bool) -> bool:
+    return (len(text.split()) if word_level else len(text)) >= length
+
+
+def _has_length_at_most(text: str, length: int, word_level: bool) -> bool:
+    return (len(text.split()) if word_level else len(text)) <= length
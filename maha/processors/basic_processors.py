@@ -12,6 +12,8 @@ import pathlib
 from typing import Callable
 
 from .base_processor import BaseProcessor
+from .compression import open_file
+from .plan import CleaningPlan
 
 
 class TextProcessor(BaseProcessor):
@@ -21,17 +23,53 @@ class TextProcessor(BaseProcessor):
     ----------
     text : Union[List[str], str]
         A text or list of strings to process
+
+    .. note::
+        Cleaning functions supported by :class:`~.CleaningPlan` are queued and
+        executed in one pass when :attr:`lines` is accessed, their arguments are
+        checked when they are applied. Other functions are applied immediately.
     """
 
+    _lines: list[str]
+    _pending: list[Callable[[str], str]]
+
     def __init__(self, text: list[str] | str) -> None:
         self.set_lines(text)
 
+    @property
+    def lines(self) -> list[str]:
+        """Processed lines, pending functions are applied first."""
+        if self._pending:
+            try:
+                self._lines = list(map(CleaningPlan(self._pending), self._lines))
+                self._pending = []
+            except Exception:
+                # Applies the functions in turn to keep the output of the functions
+                # before the failing one, which is dropped.
+                while self._pending:
+                    fn = self._pending.pop(0)
+                    self._lines = list(map(fn, self._lines))
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines: list[str]):
+        self._lines = lines
+        self._pending = []
+
     def apply(self, fn: Callable[[str], str]):
-        self.lines: list[str] = list(map(fn, self.lines))
+        plan = CleaningPlan([fn])
+        if plan.operations == [fn]:
+            # Not expanded into operations, applied now so errors raise here
+            self.lines = list(map(fn, self.lines))
+        else:
+            self._pending.append(fn)
 
     def filter(self, fn: Callable[[str], bool]):
         self.lines = list(filter(fn, self.lines))
 
+    def filter_chunks(self, fn: Callable[[list[str]], list[str]]):
+        self.lines = list(fn(self.lines))
+
     def get_lines(self, n_lines: int = 100):
         for i in range(0, len(self.lines), n_lines):
             yield self.lines[i : i + n_lines]
@@ -114,7 +152,8 @@ class FileProcessor(TextProcessor):
     Parameters
     ----------
     path : Union[str, :obj:`pathlib.Path`]
-        Path of the file to process.
+        Path of the file to process, it can be compressed with gzip, bz2 or xz,
+        which is detected from its first bytes.
 
     Raises
     ------
@@ -132,7 +171,7 @@ class FileProcessor(TextProcessor):
         if not path.is_file():
             raise FileNotFoundError(f"{str(path)} doesn't exist.")
 
-        with path.open("r", encoding="utf8") as f:
+        with open_file(path, "r", encoding="utf8") as f:
             text = f.read()
 
         if not text:
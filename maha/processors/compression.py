@@ -0,0 +1,209 @@
+""" Compressed input and output of the file processors """
+
+from __future__ import annotations
+
+__all__ = ["COMPRESSIONS", "detect_compression", "open_file"]
+
+
+import bz2
+import gzip
+import io
+import lzma
+import pathlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, BinaryIO, Callable, TextIO, Union
+
+from maha.utils import check_positive_integer
+
+COMPRESSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+""" Supported compressions and the extension of their files """
+BUFFER_SIZE = 2**20
+""" Number of bytes of the read and write buffers """
+COMPRESSION_BLOCK_SIZE = 2**22
+""" Number of bytes compressed at a time by each thread """
+
+_MAGIC_NUMBERS = {"gzip": b"\x1f\x8b", "bz2": b"BZh", "xz": b"\xfd7zXZ\x00"}
+_MODULES = {"gzip": gzip, "bz2": bz2, "xz": lzma}
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+File = Union[str, pathlib.Path, BinaryIO]
+
+
+def detect_compression(path: str | pathlib.Path, mode: str = "r") -> str | None:
+    """Returns the compression of a file, from its first bytes when reading and
+    from its extension when writing.
+
+    Parameters
+    ----------
+    path : Union[str, :obj:`pathlib.Path`]
+        Path of the file.
+    mode : str, optional
+        ``"r"`` for a file to read, which must exist, or ``"w"`` for a file to
+        write, by default "r"
+
+    Returns
+    -------
+    Optional[str]
+        One of the keys of :data:`COMPRESSIONS`, or None if the file is not
+        compressed.
+
+    Raises
+    ------
+    ValueError
+        If the mode is not ``"r"`` or ``"w"``.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.processors import detect_compression
+        >>> detect_compression("corpus.txt.gz", mode="w")
+        'gzip'
+        >>> print(detect_compression("sample_data/surah_al-ala.txt"))
+        None
+    """
+    path = pathlib.Path(path)
+    if mode == "w":
+        for compression, extension in COMPRESSIONS.items():
+            if path.suffix.lower() == extension:
+                return compression
+        return None
+    if mode != "r":
+        raise ValueError(f"Invalid mode {mode!r}, expected 'r' or 'w'")
+
+    with path.open("rb") as f:
+        start = f.read(max(map(len, _MAGIC_NUMBERS.values())))
+    for compression, magic in _MAGIC_NUMBERS.items():
+        if start.startswith(magic):
+            return compression
+    return None
+
+
+def open_file(
+    file: File,
+    mode: str = "r",
+    encoding: str = "utf8",
+    compression: str | None = "infer",
+    threads: int | None = None,
+) -> TextIO:
+    """Opens a text file that can be compressed with gzip, bz2 or xz.
+
+    The file is read and written through buffers of :data:`BUFFER_SIZE` bytes.
+    When writing with more than one thread, the text is split into blocks of
+    :data:`COMPRESSION_BLOCK_SIZE` bytes that are compressed in parallel and written
+    in order as independent streams (gzip members), which are read back as one
+    file by :mod:`gzip`, :mod:`bz2`, :mod:`lzma` and the usual command line tools.
+
+    Parameters
+    ----------
+    file : Union[str, :obj:`pathlib.Path`, BinaryIO]
+        Path of the file or a file opened in binary mode, which should be closed
+        by the caller after the returned file.
+    mode : str, optional
+        ``"r"`` to read or ``"w"`` to write, by default "r"
+    encoding : str, optional
+        Text encoding, by default "utf8"
+    compression : str, optional
+        One of the keys of :data:`COMPRESSIONS`, None for no compression or
+        ``"infer"`` to use :func:`detect_compression` on the path,
+        by default "infer"
+    threads : int, optional
+        Number of threads used to compress the output, by default None
+
+    Returns
+    -------
+    TextIO
+        The opened file.
+
+    Raises
+    ------
+    ValueError
+        If the mode or the compression is invalid, if ``threads`` is not a positive
+        integer or if the compression is inferred from a file object.
+    """
+    if mode not in ("r", "w"):
+        raise ValueError(f"Invalid mode {mode!r}, expected 'r' or 'w'")
+    if threads is not None:
+        check_positive_integer(threads, "threads")
+    if compression == "infer":
+        if not isinstance(file, (str, pathlib.Path)):
+            raise ValueError("The compression of a file object can't be inferred")
+        compression = detect_compression(file, mode)
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression {compression!r}")
+
+    binary: IO[bytes]
+    if mode == "r":
+        if compression is not None:
+            decompressed = _MODULES[compression].open(file, "rb")
+            binary = io.BufferedReader(decompressed, BUFFER_SIZE)  # type: ignore
+        elif isinstance(file, (str, pathlib.Path)):
+            binary = open(file, "rb", buffering=BUFFER_SIZE)
+        else:
+            binary = file
+    elif compression is not None and threads is not None and threads > 1:
+        compressor = _BlockCompressor(file, compression, threads)
+        binary = io.BufferedWriter(compressor, COMPRESSION_BLOCK_SIZE)
+    elif compression is not None:
+        compressed = _MODULES[compression].open(file, "wb")
+        binary = io.BufferedWriter(compressed, BUFFER_SIZE)  # type: ignore
+    elif isinstance(file, (str, pathlib.Path)):
+        binary = open(file, "wb", buffering=BUFFER_SIZE)
+    else:
+        binary = file
+    return io.TextIOWrapper(binary, encoding=encoding)  # type: ignore
+
+
+class _BlockCompressor(io.RawIOBase):
+    """Writes blocks of bytes compressed in a pool of threads as independent
+    streams, in order"""
+
+    def __init__(self, file: File, compression: str, threads: int):
+        self._owned = isinstance(file, (str, pathlib.Path))
+        self._file: BinaryIO = open(file, "wb") if self._owned else file  # type: ignore
+        self._compress = _COMPRESSORS[compression]
+        self._threads = threads
+        self._executor = ThreadPoolExecutor(threads)
+        self._pending: deque[Future] = deque()
+        self._buffer = bytearray()
+        self._blocks = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore
+        self._buffer += data
+        while len(self._buffer) >= COMPRESSION_BLOCK_SIZE:
+            self._submit(bytes(self._buffer[:COMPRESSION_BLOCK_SIZE]))
+            del self._buffer[:COMPRESSION_BLOCK_SIZE]
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            # An empty output is still a valid compressed file
+            if self._buffer or not self._blocks:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            if self._owned:
+                self._file.close()
+            else:
+                self._file.flush()
+            super().close()
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._executor.submit(self._compress, block))
+        self._blocks += 1
+        # Only a few blocks are kept ahead to keep the memory bounded
+        while len(self._pending) > 2 * self._threads:
+            self._file.write(self._pending.popleft().result())
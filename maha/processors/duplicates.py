@@ -0,0 +1,426 @@
+""" Deduplication of streams of lines """
+
+from __future__ import annotations
+
+__all__ = ["DuplicateFilter", "NearDuplicateFilter"]
+
+
+import hashlib
+import pathlib
+import tempfile
+from itertools import chain
+from typing import Callable, Iterable
+
+import numpy as np
+
+from maha.utils import check_positive_integer
+
+DIGEST_MEMORY = 100
+""" Approximate number of bytes used by each digest kept in memory """
+MERGE_BLOCK_SIZE = 2**20
+""" Number of digests read at a time from each run when merging runs """
+SHINGLE_SIZES = {"character": 5, "word": 2}
+""" Default number of characters or words of the shingles """
+SIGNATURE_CHUNK_SIZE = 256
+""" Number of lines hashed at a time by :class:`NearDuplicateFilter` """
+FALSE_NEGATIVE_WEIGHT = 0.9
+""" Weight of missing similar lines, against comparing dissimilar lines, used to
+choose the bands of :class:`NearDuplicateFilter`. The candidates are compared using
+their signatures, so missing them is worse """
+
+_SHINGLE_BASE = np.uint64(0x100000001B3)
+""" Base of the polynomial hash of the tokens of each shingle """
+
+
+class DuplicateFilter:
+    """Drops the lines that were already seen, used by
+    :meth:`~.StreamTextProcessor.drop_duplicates`.
+
+    Instead of the lines, a 64-bit or 128-bit BLAKE2 digest of each line is kept.
+    Digests are added to a set until it uses about ``max_memory`` bytes, then they
+    are sorted and saved to a run file in ``directory``. Runs with similar sizes are
+    merged, so there are at most a logarithmic number of runs, and each chunk of
+    lines is looked up in the runs using a binary search on memory-mapped arrays.
+
+    Parameters
+    ----------
+    key : Callable[[str], str], optional
+        Function applied to each line before hashing, for example to normalize the
+        lines. Lines with the same key are duplicates, the first one is kept.
+        By default None
+    digest_size : int, optional
+        Number of bytes of the digests, 8 or 16. The probability of dropping a line
+        that is not a duplicate is about ``n**2 / 2**(8 * digest_size + 1)`` for
+        ``n`` unique lines, use 16 for billions of lines, by default 8
+    max_memory : int, optional
+        Approximate number of bytes used by the digests kept in memory,
+        by default 1 GiB
+    directory : Union[str, :obj:`pathlib.Path`], optional
+        Directory of the temporary run files, by default the default temporary
+        directory of :mod:`tempfile`
+
+    Raises
+    ------
+    ValueError
+        If ``digest_size`` is not 8 or 16, or ``max_memory`` is not a positive
+        integer.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.processors import DuplicateFilter
+        >>> drop_duplicates = DuplicateFilter(key=str.lower)
+        >>> drop_duplicates(["Hi", "hello", "hi"])
+        ['Hi', 'hello']
+        >>> drop_duplicates(["Hello", "bye"])
+        ['bye']
+    """
+
+    def __init__(
+        self,
+        key: Callable[[str], str] | None = None,
+        digest_size: int = 8,
+        max_memory: int = 2**30,
+        directory: str | pathlib.Path | None = None,
+    ):
+        if digest_size not in (8, 16):
+            raise ValueError("digest_size must be 8 or 16")
+        check_positive_integer(max_memory, "max_memory")
+
+        self.key = key
+        self.digest_size = digest_size
+        self.max_memory = max_memory
+        self.directory = directory
+        # Byte strings compare like the digests, unlike NumPy "S" strings
+        self._dtype = np.dtype(">u8" if digest_size == 8 else "V16")
+        self._capacity = max(1, max_memory // DIGEST_MEMORY)
+        self._seen: set[bytes] = set()
+        self._runs: list[np.ndarray] = []
+        self._tempdir: tempfile.TemporaryDirectory | None = None
+        self._run_count = 0
+
+    def __call__(self, lines: Iterable[str]) -> list[str]:
+        """Returns the lines that were not seen before, in order
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            Lines to filter
+
+        Returns
+        -------
+        List[str]
+            Lines that are not duplicates of previous lines
+        """
+        lines = list(lines)
+        keys = lines if self.key is None else map(self.key, lines)
+        digests = [self._digest(key) for key in keys]
+        if self._runs:
+            found = self._find_in_runs(digests)
+        else:
+            found = np.zeros(len(digests), dtype=bool)
+
+        output = []
+        seen = self._seen
+        for line, digest, in_runs in zip(lines, digests, found.tolist()):
+            if in_runs or digest in seen:
+                continue
+            seen.add(digest)
+            output.append(line)
+
+        if len(seen) >= self._capacity:
+            self._spill()
+        return output
+
+    def reset(self):
+        """Forgets all seen lines and deletes the run files"""
+        self._seen = set()
+        self._runs = []
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+
+    def _digest(self, text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf8", "surrogatepass"), digest_size=self.digest_size
+        ).digest()
+
+    def _find_in_runs(self, digests: list[bytes]) -> np.ndarray:
+        """Returns whether each digest is in one of the runs"""
+        values = np.frombuffer(b"".join(digests), dtype=self._dtype)
+        found = np.zeros(values.size, dtype=bool)
+        for run in self._runs:
+            indices = np.searchsorted(run, values)
+            valid = indices < run.size
+            found[valid] |= run[indices[valid]] == values[valid]
+        return found
+
+    def _spill(self):
+        """Saves the digests in memory to a sorted run, then merges the last two runs
+        while the last one is more than half the size of the previous one"""
+        values = np.frombuffer(b"".join(self._seen), dtype=self._dtype)
+        self._runs.append(self._save_run([np.sort(values)]))
+        self._seen = set()
+        while len(self._runs) > 1 and self._runs[-2].size < 2 * self._runs[-1].size:
+            second = self._runs.pop()
+            first = self._runs.pop()
+            paths = [first.filename, second.filename]  # type: ignore
+            self._runs.append(self._save_run(_merge_runs(first, second)))
+            # The files are closed once the arrays are released
+            del first, second
+            for path in paths:
+                pathlib.Path(path).unlink()
+
+    def _save_run(self, blocks: Iterable[np.ndarray]) -> np.ndarray:
+        """Writes the sorted blocks to a new run file and returns it memory-mapped"""
+        if self._tempdir is None:
+            self._tempdir = tempfile.TemporaryDirectory(
+                prefix="maha-duplicates-", dir=self.directory
+            )
+        self._run_count += 1
+        path = pathlib.Path(self._tempdir.name) / f"run-{self._run_count}.bin"
+        with path.open("wb") as f:
+            for block in blocks:
+                # NumPy operations may return native byte order
+                f.write(block.astype(self._dtype, copy=False).tobytes())
+        return np.memmap(path, dtype=self._dtype, mode="r")
+
+    def __del__(self):
+        if getattr(self, "_tempdir", None) is not None:
+            self._runs = []
+            self._tempdir.cleanup()  # type: ignore
+
+
+def _merge_runs(first: np.ndarray, second: np.ndarray) -> Iterable[np.ndarray]:
+    """Yields the sorted blocks of the merge of two sorted runs, reading at most
+    :data:`MERGE_BLOCK_SIZE` digests of each run at a time"""
+    i = j = 0
+    while i < first.size and j < second.size:
+        a = np.asarray(first[i : i + MERGE_BLOCK_SIZE])
+        b = np.asarray(second[j : j + MERGE_BLOCK_SIZE])
+        # Only the digests up to the smallest last digest are known to be in order
+        limit = np.sort(np.concatenate([a[-1:], b[-1:]]))[0]
+        count_a = int(np.searchsorted(a, limit, side="right"))
+        count_b = int(np.searchsorted(b, limit, side="right"))
+        yield np.sort(np.concatenate([a[:count_a], b[:count_b]]), kind="stable")
+        i += count_a
+        j += count_b
+    for run, start in ((first, i), (second, j)):
+        for k in range(start, run.size, MERGE_BLOCK_SIZE):
+            yield np.asarray(run[k : k + MERGE_BLOCK_SIZE])
+
+
+class NearDuplicateFilter:
+    """Drops the lines that are similar to a line that was already seen, used by
+    :meth:`~.BaseProcessor.drop_near_duplicates`.
+
+    Each line is split into shingles, the overlapping sequences of ``shingle_size``
+    characters or words, and lines are similar if the Jaccard similarity of their
+    shingles is at least ``threshold``. The similarity is estimated using MinHash
+    signatures of ``num_perm`` hashes, computed using NumPy for chunks of lines.
+    The signatures are split into bands, a line is only compared with the kept
+    lines that have an identical band (locality-sensitive hashing). The number of
+    bands minimizes the probability of missing similar lines and of comparing
+    dissimilar lines for ``threshold``, see :data:`FALSE_NEGATIVE_WEIGHT`.
+
+    Parameters
+    ----------
+    threshold : float, optional
+        Minimum estimated Jaccard similarity of near duplicates, by default 0.9
+    shingle : str, optional
+        Shingles of ``"character"`` or ``"word"``, by default "character"
+    shingle_size : int, optional
+        Number of characters or words of each shingle, lines with fewer characters
+        or words have a single shingle. By default 5 characters or 2 words
+    num_perm : int, optional
+        Number of hashes of the signatures, more hashes are more accurate but
+        slower, by default 128
+    seed : int, optional
+        Seed of the hashes, by default 0
+
+    Raises
+    ------
+    ValueError
+        If ``threshold`` is not in the interval (0, 1], ``shingle`` is invalid or
+        ``shingle_size`` or ``num_perm`` is not a positive integer.
+
+    .. note::
+        The signatures of the kept lines are kept in memory, which uses
+        ``4 * num_perm`` bytes per line.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.processors import NearDuplicateFilter
+        >>> drop_near_duplicates = NearDuplicateFilter(threshold=0.8)
+        >>> drop_near_duplicates(
+        ...     [
+        ...         "السلام عليكم ورحمة الله وبركاته يا جماعة الخير",
+        ...         "السلام عليكم ورحمة الله وبركاته يا جماعة الخير @user",
+        ...         "صباح الخير",
+        ...     ]
+        ... )
+        ['السلام عليكم ورحمة الله وبركاته يا جماعة الخير', 'صباح الخير']
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        shingle: str = "character",
+        shingle_size: int | None = None,
+        num_perm: int = 128,
+        seed: int = 0,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in the interval (0, 1]")
+        if shingle not in SHINGLE_SIZES:
+            raise ValueError(f"shingle must be one of {list(SHINGLE_SIZES)}")
+        if shingle_size is None:
+            shingle_size = SHINGLE_SIZES[shingle]
+        check_positive_integer(shingle_size, "shingle_size")
+        check_positive_integer(num_perm, "num_perm")
+
+        self.threshold = threshold
+        self.shingle = shingle
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        # Odd multipliers of the multiply-shift hash of each permutation
+        self._multipliers = rng.integers(0, 2**64, num_perm, np.uint64) | 1
+        self._increments = rng.integers(0, 2**64, num_perm, np.uint64)
+        self._bands, self._rows = _get_lsh_parameters(threshold, num_perm)
+        # The rows of each band are hashed to a single integer
+        self._band_multipliers = rng.integers(0, 2**64, self._rows, np.uint64) | 1
+        self.reset()
+
+    def __call__(self, lines: Iterable[str]) -> list[str]:
+        """Returns the lines that are not similar to a previous line, in order
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            Lines to filter
+
+        Returns
+        -------
+        List[str]
+            Lines that are not near duplicates of previous lines
+        """
+        lines = list(lines)
+        output = []
+        for start in range(0, len(lines), SIGNATURE_CHUNK_SIZE):
+            chunk = lines[start : start + SIGNATURE_CHUNK_SIZE]
+            signatures = self._get_signatures(chunk)
+            bands = signatures[:, : self._bands * self._rows].reshape(
+                len(chunk), self._bands, self._rows
+            )
+            keys = (bands * self._band_multipliers).sum(axis=2).tolist()
+            for line, signature, line_keys in zip(chunk, signatures, keys):
+                if self._add(signature, line_keys):
+                    output.append(line)
+        return output
+
+    def reset(self):
+        """Forgets all seen lines"""
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(self._bands)]
+        self._signatures = np.empty((0, self.num_perm), dtype=np.uint32)
+        self._count = 0
+
+    def _add(self, signature: np.ndarray, keys: list[int]) -> bool:
+        """Adds the signature of a line if it is not similar to a kept line, returns
+        True if it was added"""
+        candidates: set[int] = set()
+        for bucket, key in zip(self._buckets, keys):
+            candidates.update(bucket.get(key, ()))
+        if candidates:
+            kept = self._signatures[list(candidates)]
+            similarity = np.count_nonzero(kept == signature, axis=1) / self.num_perm
+            if (similarity >= self.threshold).any():
+                return False
+
+        if self._count == len(self._signatures):
+            signatures = np.empty(
+                (max(1024, 2 * self._count), self.num_perm), dtype=np.uint32
+            )
+            signatures[: self._count] = self._signatures
+            self._signatures = signatures
+        self._signatures[self._count] = signature
+        for bucket, key in zip(self._buckets, keys):
+            bucket.setdefault(key, []).append(self._count)
+        self._count += 1
+        return True
+
+    def _get_signatures(self, lines: list[str]) -> np.ndarray:
+        """Returns the MinHash signature of each line"""
+        size = self.shingle_size
+        # Short lines are padded with zero tokens to have one shingle
+        if self.shingle == "character":
+            padded = [line.ljust(size, "\0") for line in lines]
+            text = "".join(padded).encode("utf-32-le", "surrogatepass")
+            tokens = np.frombuffer(text, dtype=np.uint32).astype(np.uint64)
+            lengths = np.array([len(line) for line in padded], dtype=np.int64)
+        else:
+            words = [line.split() for line in lines]
+            hashes = {word: _hash_word(word) for word in set(chain(*words))}
+            tokens = np.fromiter(
+                chain.from_iterable(
+                    [hashes[word] for word in line] + [0] * (size - len(line))
+                    for line in words
+                ),
+                dtype=np.uint64,
+            )
+            lengths = np.array([max(len(line), size) for line in words])
+
+        # Polynomial hash of each window of ``size`` tokens
+        count = tokens.size - size + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for i in range(size):
+            shingles = shingles * _SHINGLE_BASE + tokens[i : i + count]
+        # Only the windows that end in the same line are shingles
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(tokens.size) - np.repeat(offsets, lengths)
+        shingles = _mix(
+            shingles[(positions <= np.repeat(lengths - size, lengths))[:count]]
+        )
+        counts = lengths - size + 1
+        starts = np.cumsum(counts) - counts
+
+        signatures = np.empty((len(lines), self.num_perm), dtype=np.uint32)
+        for i, (a, b) in enumerate(zip(self._multipliers, self._increments)):
+            hashes = (shingles * a + b) >> np.uint64(32)
+            signatures[:, i] = np.minimum.reduceat(hashes, starts)
+        return signatures
+
+
+def _hash_word(word: str) -> int:
+    digest = hashlib.blake2b(word.encode("utf8", "surrogatepass"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Finalizer of SplitMix64, spreads the bits of the shingle hashes"""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _get_lsh_parameters(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Returns the number of bands and rows per band that minimize the weighted
+    probability of false positive and false negative candidates"""
+    similarities = np.linspace(0, 1, 1001)
+    below = similarities < threshold
+    best = (np.inf, 1, num_perm)
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        probability = 1 - (1 - similarities**rows) ** bands
+        error = (1 - FALSE_NEGATIVE_WEIGHT) * probability[
+            below
+        ].sum() + FALSE_NEGATIVE_WEIGHT * (1 - probability[~below]).sum()
+        best = min(best, (error, bands, rows))
+    return best[1], best[2]
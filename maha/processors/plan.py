@@ -0,0 +1,490 @@
+"""
+Compiles the cleaning functions queued by a processor into a fused plan.
+
+Each cleaning function is expanded into primitive operations (character
+translations, regex substitutions and stripping) that are then fused, so that all
+character-level mappings of consecutive steps are executed as a single
+:meth:`str.translate` call.
+"""
+from __future__ import annotations
+
+__all__ = ["CleaningPlan", "compile_functions"]
+
+
+from functools import partial
+from inspect import signature
+from typing import Callable, Iterable
+
+import maha.cleaners.functions.keep_fn as keep_fn
+import maha.cleaners.functions.remove_fn as remove_fn
+from maha.cleaners.functions import (
+    arabic_numbers_to_english,
+    keep,
+    normalize,
+    remove,
+    remove_arabic_letter_dots,
+    replace,
+    replace_pairs,
+)
+from maha.constants import (
+    ALEF,
+    ALEF_VARIATIONS,
+    ALL_HARAKAT,
+    ARABIC_DOTLESS_MAP,
+    ARABIC_LIGATURES,
+    ARABIC_LIGATURES_NORMALIZED,
+    ARABIC_NUMBERS,
+    DOTLESS_NOON_GHUNNA,
+    EMPTY,
+    ENGLISH_NUMBERS,
+    HARAKAT,
+    HEH,
+    LAM,
+    LAM_ALEF_VARIATIONS,
+    SPACE,
+    TATWEEL,
+    TEH_MARBUTA,
+    WAW,
+    WAW_VARIATIONS,
+    YEH,
+    YEH_VARIATIONS,
+)
+from maha.expressions import EXPRESSION_ALL_SPACES
+from maha.rexy import Expression, ExpressionGroup, non_capturing_group
+
+NEWLINE = "\n"
+
+
+class _LazyTable(dict):
+    """Translation table that computes the mapping of a character on first lookup
+    and caches it, so subsequent lookups are plain dictionary hits."""
+
+    def __init__(self, fn: Callable[[str], str]):
+        super().__init__()
+        self.fn = fn
+
+    def __missing__(self, key: int) -> str:
+        value = self.fn(chr(key))
+        self[key] = value
+        return value
+
+
+class _Translate:
+    """Maps each character using a translation table."""
+
+    __slots__ = ["table"]
+
+    def __init__(self, table: dict[int, str]):
+        self.table = table
+
+    def __call__(self, text: str) -> str:
+        return text.translate(self.table)
+
+    def is_space_neutral(self) -> bool:
+        """Returns True if the translation never touches, produces or deletes
+        whitespace, which means it can be swapped with space operations."""
+        if isinstance(self.table, _LazyTable):
+            return False
+        for key, value in self.table.items():
+            if chr(key).isspace() or not value:
+                return False
+            if any(c.isspace() for c in value):
+                return False
+        return True
+
+    def then(self, other: _Translate) -> _Translate:
+        """Returns a translation equivalent to applying this translation followed
+        by ``other``."""
+        first, second = self.table, other.table
+        if isinstance(first, _LazyTable) or isinstance(second, _LazyTable):
+            return _Translate(
+                _LazyTable(lambda char: char.translate(first).translate(second))
+            )
+
+        table = {key: value.translate(second) for key, value in first.items()}
+        for key, value in second.items():
+            table.setdefault(key, value)
+        return _Translate(table)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.table)} characters)"
+
+
+class _Substitute:
+    """Replaces all matches of an expression."""
+
+    __slots__ = ["expression", "with_value"]
+
+    def __init__(self, expression: Expression, with_value: Callable | str):
+        self.expression = expression
+        self.with_value = with_value
+
+    def __call__(self, text: str) -> str:
+        return self.expression.sub(self.with_value, text)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.expression.pattern!r})"
+
+
+class _SpaceOperation:
+    """Idempotent whitespace operation. Space operations commute with each other."""
+
+    __slots__ = ["name", "fn"]
+
+    def __init__(self, name: str, fn: Callable[[str], str]):
+        self.name = name
+        self.fn = fn
+
+    def __call__(self, text: str) -> str:
+        return self.fn(text)
+
+    def __repr__(self):
+        return self.name
+
+
+_EXPRESSION_EXTRA_SPACES = Expression(SPACE + "+")
+
+COLLAPSE_SPACES = _SpaceOperation(
+    "CollapseSpaces", partial(_EXPRESSION_EXTRA_SPACES.sub, SPACE)
+)
+STRIP = _SpaceOperation("Strip", str.strip)
+SPACE_OPERATIONS = (COLLAPSE_SPACES, STRIP)
+
+
+def _translate_strings(strings: list[str] | str, with_value: str):
+    """Returns the translation equivalent to :func:`~.replace`, None if the input
+    strings are not single characters or ``with_value`` is a regex template."""
+    if isinstance(strings, str):
+        strings = [strings]
+    if not strings or "\\" in with_value:
+        return None
+    if any(len(s) != 1 for s in strings):
+        return None
+    return _Translate({ord(s): with_value for s in strings})
+
+
+def _translate_pairs(keys: list[str], values: list[str]):
+    """Returns the translation equivalent to :func:`~.replace_pairs`, None if the
+    keys are not single characters."""
+    if len(keys) != len(values) or any(len(k) != 1 for k in keys):
+        return None
+    table: dict[int, str] = {}
+    for key, value in zip(keys, values):
+        table.setdefault(ord(key), value)
+    return _Translate(table)
+
+
+def _translate_except(strings: list[str], with_value: str):
+    """Returns the translation equivalent to :func:`~.replace_except` followed by
+    removing extra spaces. Each character that is not in ``strings`` is mapped to
+    ``with_value``, new lines are never replaced."""
+    if any(len(s) != 1 for s in strings):
+        return None
+    to_keep = set(strings) | {NEWLINE}
+    return _Translate(_LazyTable(lambda char: char if char in to_keep else with_value))
+
+
+def _arguments(fn: Callable, kwargs: dict) -> dict:
+    """Returns all arguments of ``fn`` except the text with their passed or default
+    values, in the same order of the signature."""
+    arguments = {
+        name: param.default
+        for name, param in signature(fn).parameters.items()
+        if name != "text"
+    }
+    arguments.update(kwargs)
+    return arguments
+
+
+def _normalize_operations(**kwargs):
+    args = _arguments(normalize, kwargs)
+    every = args["all"]
+
+    def selected(name: str):
+        return args[name] or (every and args[name] is not False)
+
+    if not any(args.values()):
+        return None
+
+    operations = []
+    if selected("lam_alef"):
+        operations.append(_translate_strings(LAM_ALEF_VARIATIONS, LAM + ALEF))
+    if selected("alef"):
+        operations.append(_translate_strings(ALEF_VARIATIONS, ALEF))
+    if selected("waw"):
+        operations.append(_translate_strings(WAW_VARIATIONS, WAW))
+    if selected("yeh"):
+        operations.append(_translate_strings(YEH_VARIATIONS, YEH))
+    if selected("teh_marbuta"):
+        operations.append(_translate_strings(TEH_MARBUTA, HEH))
+    if selected("ligatures"):
+        operations.append(
+            _translate_pairs(ARABIC_LIGATURES, ARABIC_LIGATURES_NORMALIZED)
+        )
+    if selected("spaces"):
+        operations.append(
+            _Translate(
+                _LazyTable(
+                    lambda char: SPACE
+                    if EXPRESSION_ALL_SPACES.fullmatch(char)
+                    else char
+                )
+            )
+        )
+    return operations
+
+
+def _remove_operations(**kwargs):
+    args = _arguments(remove, kwargs)
+    constants = vars(remove_fn)
+
+    custom_strings = args["custom_strings"] or []
+    custom_expressions = args["custom_expressions"] or ExpressionGroup()
+    if isinstance(custom_strings, str):
+        custom_strings = [custom_strings]
+    if isinstance(custom_expressions, str):
+        custom_expressions = Expression(custom_expressions)
+    elif isinstance(custom_expressions, list):
+        custom_expressions = Expression(non_capturing_group(*custom_expressions))
+
+    chars_to_remove = list(custom_strings)
+    expressions_to_remove = ExpressionGroup(custom_expressions)
+    for arg, value in args.items():
+        const = constants.get(arg.upper())
+        if const and value is True:
+            chars_to_remove += const
+            continue
+        expression = constants.get("EXPRESSION_" + arg.upper())
+        if expression and value is True:
+            expressions_to_remove.add(expression)
+
+    if not (chars_to_remove or expressions_to_remove):
+        return None
+
+    operations: list = []
+    if expressions_to_remove:
+        operations += [
+            _Substitute(Expression(expressions_to_remove.join()), EMPTY),
+            COLLAPSE_SPACES,
+            STRIP,
+        ]
+
+    if chars_to_remove:
+        if args["all_harakat"]:
+            operations += [_translate_strings(ALL_HARAKAT, EMPTY), STRIP]
+        elif args["harakat"]:
+            operations += [_translate_strings(HARAKAT, EMPTY), STRIP]
+        if args["tatweel"]:
+            operations += [_translate_strings(TATWEEL, EMPTY), STRIP]
+
+        use_space = args["use_space"]
+        operations.append(
+            _translate_strings(
+                list(set(chars_to_remove)), SPACE if use_space else EMPTY
+            )
+        )
+        if use_space:
+            operations.append(COLLAPSE_SPACES)
+        operations.append(STRIP)
+
+    return operations
+
+
+def _keep_operations(**kwargs):
+    args = _arguments(keep, kwargs)
+    constants = vars(keep_fn)
+
+    custom_strings = args["custom_strings"] or []
+    if isinstance(custom_strings, str):
+        custom_strings = [custom_strings]
+
+    chars_to_keep = list(custom_strings)
+    for arg, value in args.items():
+        const = constants.get(arg.upper())
+        if const and value is True:
+            chars_to_keep += const
+
+    if not chars_to_keep:
+        return None
+
+    if not args["use_space"]:
+        return [_translate_except(chars_to_keep, EMPTY), STRIP]
+
+    operations = []
+    not_included_harakat = [
+        h for h in ALL_HARAKAT + [TATWEEL] if h not in chars_to_keep
+    ]
+    if not_included_harakat:
+        operations.append(_translate_strings(not_included_harakat, EMPTY))
+    operations += [_translate_except(chars_to_keep, SPACE), COLLAPSE_SPACES, STRIP]
+    return operations
+
+
+def _replace_operations(strings, with_value):
+    return [_translate_strings(strings, with_value)]
+
+
+def _replace_pairs_operations(keys, values):
+    return [_translate_pairs(keys, values)]
+
+
+def _arabic_numbers_to_english_operations():
+    return [_translate_pairs(ARABIC_NUMBERS, ENGLISH_NUMBERS)]
+
+
+def _remove_arabic_letter_dots_operations():
+    return [
+        _Substitute(remove_fn.EXPRESSION_NOON_WITHOUT_DOT, DOTLESS_NOON_GHUNNA),
+        _translate_pairs(
+            list(ARABIC_DOTLESS_MAP.keys()), list(ARABIC_DOTLESS_MAP.values())
+        ),
+    ]
+
+
+OPERATIONS_MAP: dict[Callable, Callable] = {
+    normalize: _normalize_operations,
+    remove: _remove_operations,
+    keep: _keep_operations,
+    replace: _replace_operations,
+    replace_pairs: _replace_pairs_operations,
+    arabic_numbers_to_english: _arabic_numbers_to_english_operations,
+    remove_arabic_letter_dots: _remove_arabic_letter_dots_operations,
+}
+""" Maps each supported cleaning function to a function that expands it into
+primitive operations """
+
+
+def _get_operations(fn: Callable[[str], str]) -> list[Callable[[str], str]]:
+    """Expands the cleaning function into primitive operations. Functions that
+    cannot be expanded are returned as is."""
+    func, kwargs = fn, {}
+    if isinstance(fn, partial) and not fn.args:
+        func, kwargs = fn.func, fn.keywords
+
+    get_operations = OPERATIONS_MAP.get(func)
+    if get_operations is None:
+        return [fn]
+
+    try:
+        operations = get_operations(**kwargs)
+    except TypeError:
+        operations = None
+
+    if not operations or any(op is None for op in operations):
+        # Invalid arguments raise when the plan is built instead of when it is
+        # applied, the cleaning functions return empty text before checking them.
+        fn(SPACE)
+        return [fn]
+    return operations
+
+
+def _fuse(operations: Iterable[Callable[[str], str]]) -> list[Callable[[str], str]]:
+    output: list[Callable[[str], str]] = []
+    for operation in operations:
+        if isinstance(operation, _Translate):
+            index = len(output)
+            if operation.is_space_neutral():
+                while index > 0 and output[index - 1] in SPACE_OPERATIONS:
+                    index -= 1
+            if index > 0 and isinstance(output[index - 1], _Translate):
+                output[index - 1] = output[index - 1].then(operation)  # type: ignore
+            else:
+                output.append(operation)
+        elif operation in SPACE_OPERATIONS:
+            index = len(output)
+            while index > 0 and output[index - 1] in SPACE_OPERATIONS:
+                index -= 1
+            run = set(output[index:]) | {operation}
+            output[index:] = [op for op in SPACE_OPERATIONS if op in run]
+        else:
+            output.append(operation)
+    return output
+
+
+class CleaningPlan:
+    """Fused sequence of cleaning functions.
+
+    The input functions are expanded into primitive operations where possible:
+    :func:`~.normalize`, :func:`~.remove`, :func:`~.keep`, :func:`~.replace`,
+    :func:`~.replace_pairs`, :func:`~.arabic_numbers_to_english` and
+    :func:`~.remove_arabic_letter_dots` (including partials of them, as created by
+    the processors). Consecutive character mappings are then fused into one
+    translation table. Other functions are applied as is. The output is identical to
+    applying the input functions in sequence.
+
+    Parameters
+    ----------
+    functions : Iterable[Callable[[str], str]]
+        Functions to apply in sequence.
+
+    Example
+    -------
+
+    .. code:: pycon
+
+        >>> from functools import partial
+        >>> from maha.cleaners.functions import normalize, remove
+        >>> from maha.processors import CleaningPlan
+        >>> plan = CleaningPlan(
+        ...     [partial(normalize, alef=True), partial(remove, harakat=True)]
+        ... )
+        >>> plan("أَحمد")
+        'احمد'
+    """
+
+    __slots__ = ["functions", "operations"]
+
+    def __init__(self, functions: Iterable[Callable[[str], str]]):
+        self.functions = list(functions)
+        self.operations = _fuse(
+            op for fn in self.functions for op in _get_operations(fn)
+        )
+
+    def __call__(self, text: str) -> str:
+        for operation in self.operations:
+            text = operation(text)
+        return text
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.operations})"
+
+
+def compile_functions(functions: Iterable[Callable]) -> list[Callable]:
+    """Fuses consecutive ``map`` functions of a stream processor into a single
+    ``map`` over a :class:`CleaningPlan`. Other functions (e.g. ``filter``) are
+    kept in place.
+
+    Parameters
+    ----------
+    functions : Iterable[Callable]
+        Functions of the form ``partial(map, fn)`` or ``partial(filter, fn)``.
+
+    Returns
+    -------
+    List[Callable]
+        Equivalent list of functions.
+    """
+    output: list[Callable] = []
+    pending: list[Callable] = []
+
+    for function in functions:
+        if (
+            isinstance(function, partial)
+            and function.func is map
+            and len(function.args) == 1
+            and not function.keywords
+        ):
+            pending.append(function.args[0])
+            continue
+        if pending:
+            output.append(partial(map, CleaningPlan(pending)))
+            pending = []
+        output.append(function)
+
+    if pending:
+        output.append(partial(map, CleaningPlan(pending)))
+
+    return output
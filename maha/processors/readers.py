@@ -0,0 +1,309 @@
+""" Readers of the lines of large files """
+
+from __future__ import annotations
+
+__all__ = ["IndexedFileReader"]
+
+
+import mmap
+import os
+import pathlib
+import re
+import tempfile
+from typing import Iterator, overload
+
+import numpy as np
+
+INDEX_INTERVAL = 1024
+""" Number of lines between the offsets kept in the index """
+SCAN_BLOCK_SIZE = 2**24
+""" Number of bytes searched for newlines at a time when building the index """
+READ_BLOCK_SIZE = 2**20
+""" Approximate number of bytes decoded at a time when reading lines """
+
+_LINE_BREAK = re.compile(rb"\r\n?|\n")
+
+
+class IndexedFileReader:
+    """Reads the lines of a file using a memory map and an index of line offsets.
+
+    The file is scanned for newlines once, using NumPy on the memory map, and the
+    byte offset of every :data:`INDEX_INTERVAL`-th line is kept, which is 8 bytes
+    per 1024 lines. Lines are decoded lazily in blocks of about
+    :data:`READ_BLOCK_SIZE` bytes, the number of lines is known without reading the
+    lines and any line or range of lines can be read directly, e.g. to resume
+    processing from a line.
+
+    Lines are separated by ``"\\n"``, ``"\\r\\n"`` or ``"\\r"`` as in text files
+    and the separators are not included in the lines.
+
+    Parameters
+    ----------
+    path : Union[str, :obj:`pathlib.Path`]
+        Path of the file.
+    encoding : str, optional
+        File encoding, it must encode newlines as ASCII newlines, by default "utf8"
+    cache : bool, optional
+        If True, the index is saved next to the file with the ``.lines.npz``
+        suffix and loaded if the file didn't change. The index is not saved if the
+        directory is not writable and it is built again if the saved index can't
+        be read, by default False
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file doesn't exist.
+    ValueError
+        If the encoding is not compatible with ASCII newlines.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.processors import IndexedFileReader
+        >>> reader = IndexedFileReader("sample_data/surah_al-ala.txt")
+        >>> len(reader)
+        22
+        >>> reader[2]
+        'الَّذِي خَلَقَ فَسَوَّىٰ ﴿2﴾'
+        >>> reader[-3:]
+        ['صُحُفِ إِبْرَاهِيمَ وَمُوسَىٰ ﴿19﴾', '', '']
+    """
+
+    def __init__(
+        self, path: str | pathlib.Path, encoding: str = "utf8", cache: bool = False
+    ):
+        path = pathlib.Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"{str(path)} doesn't exist.")
+        if not _is_ascii_compatible(encoding):
+            raise ValueError(f"Encoding {encoding} is not supported")
+
+        self.path = path
+        self.encoding = encoding
+        self.size = path.stat().st_size
+        self._file = path.open("rb")
+        self._map: mmap.mmap | None = None
+        if self.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        index_path = path.with_name(path.name + ".lines.npz")
+        index = self._load_index(index_path) if cache else None
+        if index is None:
+            index = self._build_index()
+            if cache:
+                self._save_index(index_path, *index)
+        self._offsets, self._length = index
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, key: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[str]:
+        ...
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return [
+                line for _, lines in self.iter_blocks(start, stop) for line in lines
+            ]
+
+        index = key + self._length if key < 0 else key
+        if not 0 <= index < self._length:
+            raise IndexError("line index out of range")
+        return self[index : index + 1][0]
+
+    def __iter__(self) -> Iterator[str]:
+        for _, lines in self.iter_blocks():
+            yield from lines
+
+    def offset(self, line: int) -> int:
+        """Returns the byte offset of the start of a line
+
+        Parameters
+        ----------
+        line : int
+            Line number, from 0 to the number of lines. The offset of the number of
+            lines is the size of the file.
+
+        Returns
+        -------
+        int
+            Byte offset
+
+        Raises
+        ------
+        IndexError
+            If the line number is out of range.
+        """
+        if not 0 <= line <= self._length:
+            raise IndexError("line index out of range")
+        if line == self._length:
+            return self.size
+
+        start = int(self._offsets[line // INDEX_INTERVAL])
+        for _ in range(line % INDEX_INTERVAL):
+            start = _LINE_BREAK.search(self._map, start).end()  # type: ignore
+        return start
+
+    def iter_blocks(
+        self, start: int = 0, stop: int | None = None
+    ) -> Iterator[tuple[int, list[str]]]:
+        """Yields the lines from ``start`` to before ``stop``, the lines of each
+        block of about :data:`READ_BLOCK_SIZE` bytes are decoded at once
+
+        Parameters
+        ----------
+        start : int, optional
+            First line number, by default 0
+        stop : int, optional
+            Line number to stop at, by default the number of lines
+
+        Yields
+        -------
+        Tuple[int, List[str]]
+            Number of bytes and lines of each block, in order
+        """
+        stop = self._length if stop is None else stop
+        if start >= stop:
+            return
+        position = self.offset(start)
+        end = self.offset(stop)
+        while position < end:
+            # The end is a line start, so the block can't end inside a line break
+            match = _LINE_BREAK.search(
+                self._map, position + READ_BLOCK_SIZE - 1, end  # type: ignore
+            )
+            block_end = end if match is None else match.end()
+            yield block_end - position, self._decode(position, block_end)
+            position = block_end
+
+    def close(self):
+        """Closes the file"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _decode(self, start: int, end: int) -> list[str]:
+        """Returns the lines of the bytes ``[start, end)``, which start at the start
+        of a line and end at the end of a line"""
+        data = self._map[start:end]  # type: ignore
+        return _decode_lines(data, self.encoding, start == 0)
+
+    def _build_index(self) -> tuple[np.ndarray, int]:
+        """Returns the offsets of every :data:`INDEX_INTERVAL`-th line and the number
+        of lines"""
+        offsets = [np.zeros(1, dtype=np.uint64)]
+        line_breaks = 0
+        for start in range(0, self.size, SCAN_BLOCK_SIZE):
+            count = min(SCAN_BLOCK_SIZE, self.size - start)
+            # The next byte is needed to know if a "\r" is followed by "\n"
+            block = np.frombuffer(
+                self._map,  # type: ignore
+                dtype=np.uint8,
+                count=min(count + 1, self.size - start),
+                offset=start,
+            )
+            positions = np.flatnonzero(block[:count] == ord("\n"))
+            returns = np.flatnonzero(block[:count] == ord("\r"))
+            if returns.size:
+                following = block[np.minimum(returns + 1, block.size - 1)]
+                alone = (returns + 1 == block.size) | (following != ord("\n"))
+                positions = np.union1d(positions, returns[alone])
+            # Line ``line_breaks + i + 1`` starts after the i-th line break
+            first = -(line_breaks + 1) % INDEX_INTERVAL
+            offsets.append(
+                (positions[first::INDEX_INTERVAL] + start + 1).astype(np.uint64)
+            )
+            line_breaks += positions.size
+            del block
+
+        length = line_breaks
+        if self.size and self._map[self.size - 1] not in b"\r\n":  # type: ignore
+            # A file with only a byte order mark has no lines
+            if line_breaks or self.size > 4 or self._decode(0, self.size):
+                length += 1
+        index = np.concatenate(offsets)
+        return index[: (length - 1) // INDEX_INTERVAL + 1], length
+
+    def _load_index(self, path: pathlib.Path) -> tuple[np.ndarray, int] | None:
+        """Returns the saved index if it is of the current file, otherwise None"""
+        if not path.is_file():
+            return None
+        stat = self.path.stat()
+        try:
+            with np.load(path) as index:
+                if (
+                    int(index["interval"]) != INDEX_INTERVAL
+                    or int(index["size"]) != stat.st_size
+                    or int(index["mtime"]) != stat.st_mtime_ns
+                ):
+                    return None
+                return index["offsets"], int(index["length"])
+        except Exception:
+            # Corrupted or truncated index
+            return None
+
+    def _save_index(self, path: pathlib.Path, offsets: np.ndarray, length: int):
+        """Saves the index atomically, the index is not saved if the directory is
+        not writable"""
+        stat = self.path.stat()
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    offsets=offsets,
+                    length=length,
+                    interval=INDEX_INTERVAL,
+                    size=stat.st_size,
+                    mtime=stat.st_mtime_ns,
+                )
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def __del__(self):
+        if hasattr(self, "_file"):
+            self.close()
+
+
+def _decode_lines(data: bytes, encoding: str, file_start: bool) -> list[str]:
+    """Returns the lines of bytes that end at the end of a line, with the same
+    newline translation as reading the file in text mode. ``file_start`` is True
+    if the bytes are at the start of the file."""
+    if file_start:
+        text = data.decode(encoding)
+    else:
+        # The newline prevents encodings such as ``utf-8-sig`` from removing a BOM
+        # character that is not at the start of the file.
+        text = (b"\n" + data).decode(encoding)[1:]
+    if not text:
+        return []
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()
+    return lines
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Returns True if the encoding encodes newlines as ASCII newlines, so lines can
+    be found in the encoded bytes"""
+    return "\n\r".encode(encoding)[-2:] == b"\n\r"
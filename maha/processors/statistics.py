@@ -0,0 +1,157 @@
+""" Statistics accumulated over the lines of the processors """
+
+from __future__ import annotations
+
+__all__ = ["TextStatistics", "STATISTICS", "LENGTH_PERCENTILES"]
+
+
+from array import array
+from collections import Counter
+from typing import Any, Iterable
+
+import numpy as np
+
+from maha.constants import ALL_HARAKAT, ARABIC_LETTERS, ENGLISH_LETTERS
+
+STATISTICS = [
+    "unique_characters",
+    "character_length",
+    "word_length",
+    "character_frequency",
+    "arabic_ratio",
+    "harakat_density",
+    "length_percentiles",
+]
+""" Names of the available statistics, in the order they are returned """
+
+LENGTH_PERCENTILES = [0, 25, 50, 75, 90, 99, 100]
+""" Percentiles of the character and word lengths in ``length_percentiles`` """
+
+
+class TextStatistics:
+    """Accumulates statistics about lines of text, one chunk of lines at a time.
+
+    Only the values needed by the selected statistics are kept: the lengths of the
+    lines are stored in compact arrays and the characters are counted in a
+    :class:`~collections.Counter`, the lines themselves are never stored. Use
+    :meth:`update` with each chunk, then :meth:`get` to compute the statistics.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        Names of the statistics to compute, see :data:`STATISTICS`.
+
+    Raises
+    ------
+    ValueError
+        If an unknown statistic is passed.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.processors import TextStatistics
+        >>> statistics = TextStatistics(["character_length", "arabic_ratio"])
+        >>> statistics.update(["مرحبا", "Hello مرحبا"])
+        >>> statistics.get()
+        {'character_length': [5, 11], 'arabic_ratio': 0.6666666666666666}
+    """
+
+    __slots__ = ["names", "_characters", "_character_lengths", "_word_lengths"]
+
+    def __init__(self, names: Iterable[str]):
+        names = list(names)
+        for name in names:
+            if name not in STATISTICS:
+                raise ValueError(f"Unknown statistic {name!r}")
+        self.names = [name for name in STATISTICS if name in names]
+
+        self._characters: Counter[str] | None = None
+        self._character_lengths: array | None = None
+        self._word_lengths: array | None = None
+        if set(self.names) - {"character_length", "word_length"}:
+            self._characters = Counter()
+        if "character_length" in self.names or "length_percentiles" in self.names:
+            self._character_lengths = array("I")
+        if "word_length" in self.names or "length_percentiles" in self.names:
+            self._word_lengths = array("I")
+
+    def update(self, lines: list[str]):
+        """Adds a chunk of lines to the statistics
+
+        Parameters
+        ----------
+        lines : List[str]
+            Lines to add
+        """
+        if self._characters is not None:
+            self._characters.update("".join(lines))
+        if self._character_lengths is not None:
+            self._character_lengths.extend(map(len, lines))
+        if self._word_lengths is not None:
+            self._word_lengths.extend(map(len, map(str.split, lines)))
+
+    def get(self) -> dict[str, Any]:
+        """Returns the selected statistics of the added lines
+
+        Returns
+        -------
+        Dict[str, Any]
+            Value of each selected statistic:
+
+            * ``unique_characters``: List of the unique characters.
+            * ``character_length``: List of the number of characters of each line.
+            * ``word_length``: List of the number of words of each line (split by
+              space).
+            * ``character_frequency``: Dictionary of the number of occurrences of
+              each character, from the most common.
+            * ``arabic_ratio``: Ratio of Arabic letters to Arabic and English
+              letters, NaN if there are no letters.
+            * ``harakat_density``: Number of harakat per Arabic letter, NaN if there
+              are no Arabic letters.
+            * ``length_percentiles``: Dictionary with ``"character_length"`` and
+              ``"word_length"`` keys, each has the value of each percentile in
+              :data:`LENGTH_PERCENTILES`.
+        """
+        output: dict[str, Any] = {}
+        for name in self.names:
+            if name == "unique_characters":
+                output[name] = list(self._characters)  # type: ignore
+            elif name == "character_length":
+                output[name] = self._character_lengths.tolist()  # type: ignore
+            elif name == "word_length":
+                output[name] = self._word_lengths.tolist()  # type: ignore
+            elif name == "character_frequency":
+                output[name] = dict(self._characters.most_common())  # type: ignore
+            elif name == "arabic_ratio":
+                arabic = self._count(ARABIC_LETTERS)
+                output[name] = _ratio(arabic, arabic + self._count(ENGLISH_LETTERS))
+            elif name == "harakat_density":
+                output[name] = _ratio(
+                    self._count(ALL_HARAKAT), self._count(ARABIC_LETTERS)
+                )
+            elif name == "length_percentiles":
+                character_lengths: array = self._character_lengths  # type: ignore
+                word_lengths: array = self._word_lengths  # type: ignore
+                output[name] = {
+                    "character_length": _percentiles(character_lengths),
+                    "word_length": _percentiles(word_lengths),
+                }
+        return output
+
+    def _count(self, characters: list[str]) -> int:
+        counter: Counter[str] = self._characters  # type: ignore
+        return sum(counter[c] for c in characters if c in counter)
+
+
+def _ratio(count: int, total: int) -> float:
+    return count / total if total else float("nan")
+
+
+def _percentiles(lengths: array) -> dict[int, float]:
+    values = np.frombuffer(lengths, dtype=np.uintc)
+    if values.size == 0:
+        return {p: float("nan") for p in LENGTH_PERCENTILES}
+    return dict(
+        zip(LENGTH_PERCENTILES, np.percentile(values, LENGTH_PERCENTILES).tolist())
+    )
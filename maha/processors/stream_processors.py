@@ -7,12 +7,26 @@ __all__ = [
 
 
 import pathlib
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from functools import partial
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Iterator
 
 from tqdm import tqdm
 
+from maha.utils import check_positive_integer
+
 from .base_processor import BaseProcessor
+from .compression import detect_compression, open_file
+from .duplicates import DuplicateFilter, NearDuplicateFilter
+from .plan import compile_functions
+from .readers import (
+    READ_BLOCK_SIZE,
+    IndexedFileReader,
+    _decode_lines,
+    _is_ascii_compatible,
+)
 
 
 class StreamTextProcessor(BaseProcessor):
@@ -28,6 +42,7 @@ class StreamTextProcessor(BaseProcessor):
 
         self.lines = lines
         self.functions: list[Callable] = []
+        self._compiled: tuple[list[Callable], list[Callable]] = ([], [])
 
     def apply(self, fn: Callable[[str], str]):
         self.functions.append(partial(map, fn))
@@ -35,6 +50,58 @@ class StreamTextProcessor(BaseProcessor):
     def filter(self, fn: Callable[[str], bool]):
         self.functions.append(partial(filter, fn))
 
+    def filter_chunks(self, fn: Callable[[list[str]], list[str]]):
+        self.functions.append(fn)
+
+    def drop_duplicates(
+        self,
+        key: Callable[[str], str] | None = None,
+        digest_size: int = 8,
+        max_memory: int = 2**30,
+        directory: str | pathlib.Path | None = None,
+    ):
+        """Drops duplicate lines, the first occurrence of each line is kept.
+
+        A digest of each line is kept instead of the line, digests that don't fit
+        in ``max_memory`` are saved to sorted files in ``directory``, see
+        :class:`~.DuplicateFilter`.
+
+        Parameters
+        ----------
+        key : Callable[[str], str], optional
+            Function applied to each line before comparing, e.g.
+            ``partial(normalize, all=True)``, by default None
+        digest_size : int, optional
+            Number of bytes of the digests, 8 or 16. Use 16 for billions of unique
+            lines, by default 8
+        max_memory : int, optional
+            Approximate number of bytes of the digests kept in memory,
+            by default 1 GiB
+        directory : Union[str, :obj:`pathlib.Path`], optional
+            Directory of the temporary files, by default the default temporary
+            directory
+
+        Raises
+        ------
+        ValueError
+            If ``digest_size`` is not 8 or 16, or ``max_memory`` is not a positive
+            integer.
+
+        .. note::
+            The seen lines are forgotten each time the processing starts. This
+            function can't be used with ``workers`` in
+            :meth:`~.StreamFileProcessor.process_and_save`.
+        """
+        self.filter_chunks(
+            DuplicateFilter(
+                key=key,
+                digest_size=digest_size,
+                max_memory=max_memory,
+                directory=directory,
+            )
+        )
+        return self
+
     def get_lines(self, n_lines: int = 100):
         selected_lines = []
 
@@ -68,6 +135,9 @@ class StreamTextProcessor(BaseProcessor):
         if len(self.functions) == 0:
             raise ValueError("No functions were selected")
 
+        for function in self.functions:
+            if isinstance(function, (DuplicateFilter, NearDuplicateFilter)):
+                function.reset()
         for lines in self.get_lines(n_lines):
             yield self.apply_functions(lines)
 
@@ -80,20 +150,39 @@ class StreamTextProcessor(BaseProcessor):
             List of strings to process
         """
         output = text
-        for function in self.functions:
+        for function in self._get_compiled_functions():
             output = list(function(output))
         return output
 
+    def _get_compiled_functions(self) -> list[Callable]:
+        """Returns the selected functions with consecutive ``map`` functions fused
+        into a :class:`~.CleaningPlan`, compiled once until the functions change."""
+        functions, compiled = self._compiled
+        if functions != self.functions:
+            compiled = compile_functions(self.functions)
+            self._compiled = (list(self.functions), compiled)
+        return compiled
+
 
 class StreamFileProcessor(StreamTextProcessor):
     """For processing file stream input.
 
+    The file is read using an :class:`~.IndexedFileReader`, available as
+    :attr:`reader`, which gives the number of lines and reads any range of lines
+    directly. Files compressed with gzip, bz2 or xz, detected from their first bytes,
+    and files with encodings that are not compatible with ASCII newlines, such as
+    UTF-16, are read as text files instead and :attr:`reader` is None. The progress
+    is computed on the bytes of the file, compressed or not.
+
     Parameters
     ----------
     path : Union[str, :obj:`pathlib.Path`]
         Path of the file to process.
     encoding : str
         File encoding.
+    cache_index : bool
+        If True, the line index of the file is saved next to it and reused, see
+        :class:`~.IndexedFileReader`, by default False
 
     Raises
     ------
@@ -101,7 +190,12 @@ class StreamFileProcessor(StreamTextProcessor):
         If the file doesn't exist.
     """
 
-    def __init__(self, path: str | pathlib.Path, encoding: str = "utf8") -> None:
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        encoding: str = "utf8",
+        cache_index: bool = False,
+    ) -> None:
 
         if isinstance(path, str):
             path = pathlib.Path(path)
@@ -111,14 +205,16 @@ class StreamFileProcessor(StreamTextProcessor):
 
         self.encoding = encoding
         self.file = path
-        self.openfile = path.open("r", encoding=encoding)
-        super().__init__(self.openfile)
+        self.compression = detect_compression(path)
+        self.reader: IndexedFileReader | None = None
+        if self.compression is None and _is_ascii_compatible(encoding):
+            self.reader = IndexedFileReader(path, encoding, cache=cache_index)
+            super().__init__(self.reader)
+        else:
+            super().__init__(line for _, lines in self._iter_blocks() for line in lines)
 
     def get_lines(self, n_lines: int = 100):
-        # set pointer to top of the file
-        self.openfile.seek(0)
-
-        selected_lines = []
+        selected_lines: list[str] = []
 
         with tqdm(
             total=self.file.stat().st_size,
@@ -127,52 +223,253 @@ class StreamFileProcessor(StreamTextProcessor):
             unit_scale=True,
             leave=True,
         ) as pbar:
-            for i, line in enumerate(self.lines, 1):
-                pbar.update(len(line.encode(self.encoding)))
-                selected_lines.append(line.strip())
-                if i % n_lines == 0:
-                    yield selected_lines
-                    selected_lines = []
+            for size, lines in self._iter_blocks():
+                for line in lines:
+                    selected_lines.append(line.strip())
+                    if len(selected_lines) == n_lines:
+                        yield selected_lines
+                        selected_lines = []
+                pbar.update(size)
 
         if selected_lines:
             yield selected_lines
 
+    def _iter_blocks(
+        self, block_size: int = READ_BLOCK_SIZE
+    ) -> Iterator[tuple[int, list[str]]]:
+        """Yields the lines of the file in blocks, with the number of bytes of
+        the file read for each block"""
+        if self.reader is not None:
+            yield from self.reader.iter_blocks()
+            return
+
+        with self.file.open("rb") as raw, open_file(
+            raw, "r", self.encoding, compression=self.compression
+        ) as f:
+            position = 0
+            while True:
+                lines = f.readlines(block_size)
+                if not lines:
+                    break
+                # The position of the file itself, so compressed bytes
+                yield raw.tell() - position, lines
+                position = raw.tell()
+
     def process_and_save(
-        self, path: str | pathlib.Path, n_lines: int = 100, override: bool = False
+        self,
+        path: str | pathlib.Path,
+        n_lines: int = 100,
+        override: bool = False,
+        workers: int | None = None,
+        chunk_size: int = 2**20,
+        compression_threads: int | None = None,
     ):
         """Process the input file and save the result in the given path
 
         Parameters
         ----------
         path : Union[str, :obj:`pathlib.Path`]
-            Path to save the file
+            Path to save the file, it is compressed if its extension is one of
+            :data:`~.COMPRESSIONS`, e.g. ``output.txt.gz``
         n_lines : int, optional
             Number of lines to process at a time, by default 100
         override : bool, optional
             True to override the file if exists, by default False
+        workers : int, optional
+            Number of processes used to process the file. The file is split into
+            chunks of complete lines that are processed in parallel, the output is
+            written in the same order and is identical to processing the file in
+            the current process. If None or 1, the file is processed in the current
+            process, by default None
+        chunk_size : int, optional
+            Approximate number of bytes of each chunk sent to a process,
+            by default 1 MiB
+        compression_threads : int, optional
+            Number of threads used to compress the output, which is written as
+            independent compressed blocks, see :func:`~.open_file`. If None or 1,
+            the output is compressed as a single stream, by default None
 
         Raises
         ------
         FileExistsError
             If the file exists
+        ValueError
+            If ``workers``, ``chunk_size`` or ``compression_threads`` is not a
+            positive integer, if the selected functions can't be pickled (e.g.
+            lambdas) or include :meth:`~.StreamTextProcessor.drop_duplicates` or
+            :meth:`~.BaseProcessor.drop_near_duplicates` when using workers or if
+            the encoding of an uncompressed file is not compatible with ASCII
+            newlines.
+
+        .. note::
+            When using workers, the functions are applied to each line separately
+            and must be picklable. Use functions defined at module level, or
+            :func:`functools.partial` of them, instead of lambdas.
         """
         if isinstance(path, str):
             path = pathlib.Path(path)
 
+        if workers is not None:
+            check_positive_integer(workers, "workers")
+        check_positive_integer(chunk_size, "chunk_size")
+        if compression_threads is not None:
+            check_positive_integer(compression_threads, "compression_threads")
+        # Checked before the output is opened to leave an existing file unchanged
+        if workers is not None and workers > 1:
+            self._check_workers()
+
         if not override and path.is_file():
             raise FileExistsError(f"{str(path)} exists.")
 
-        with path.open("w", encoding=self.encoding) as file:
-            for lines in self.process(n_lines):
+        if workers is None or workers == 1:
+            groups: Iterable[list[str]] = self.process(n_lines)
+        else:
+            groups = self._process_in_workers(n_lines, workers, chunk_size)
+
+        with open_file(path, "w", self.encoding, threads=compression_threads) as file:
+            for lines in groups:
                 text = "\n".join(lines).strip("\n")
                 if not text:
                     continue
                 file.write(text)
                 file.write("\n")
 
+    def _check_workers(self):
+        """Checks that the selected functions can be applied in worker processes"""
+        if len(self.functions) == 0:
+            raise ValueError("No functions were selected")
+        for function in self.functions:
+            if isinstance(function, (DuplicateFilter, NearDuplicateFilter)):
+                raise ValueError(
+                    "drop_duplicates and drop_near_duplicates can't be used with "
+                    "workers"
+                )
+        _check_picklable(self.functions)
+        if self.compression is None and not _is_ascii_compatible(self.encoding):
+            raise ValueError(
+                f"Encoding {self.encoding} is not supported when using workers"
+            )
+
+    def _process_in_workers(
+        self, n_lines: int, workers: int, chunk_size: int
+    ) -> Iterator[list[str]]:
+        """Yields the output of each ``n_lines`` input lines, same as :meth:`process`
+        but the lines are processed in multiple processes. The functions must be
+        checked using :meth:`_check_workers` first."""
+        group: list[str] = []
+        count = 0
+        with tqdm(
+            total=self.file.stat().st_size,
+            desc="Processing",
+            unit="B",
+            unit_scale=True,
+            leave=True,
+        ) as pbar, ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(self.functions,)
+        ) as executor:
+            # Chunks are written in order, only a few chunks are submitted ahead to
+            # keep the memory bounded.
+            pending: deque[tuple[Future, int]] = deque()
+            tasks = self._iter_tasks(chunk_size)
+            while True:
+                for function, arguments, size in tasks:
+                    pending.append((executor.submit(function, *arguments), size))
+                    if len(pending) > 2 * workers:
+                        break
+                if not pending:
+                    break
+
+                future, size = pending.popleft()
+                for output in future.result():
+                    group.extend(output)
+                    count += 1
+                    if count == n_lines:
+                        yield group
+                        group = []
+                        count = 0
+                pbar.update(size)
+
+        if count:
+            yield group
+
+    def _iter_tasks(self, chunk_size: int) -> Iterator[tuple[Callable, tuple, int]]:
+        """Yields the function and the arguments of each chunk sent to the workers,
+        with the number of bytes of the file in the chunk"""
+        if self.compression is None:
+            for start, end in _get_ranges(self.file, chunk_size):
+                yield _process_chunk, (
+                    self.file,
+                    self.encoding,
+                    start,
+                    end,
+                ), end - start
+            return
+
+        # Compressed files can't be read from an offset, the chunks are decompressed
+        # in the current process and the lines are sent instead.
+        for size, lines in self._iter_blocks(chunk_size):
+            yield _process_lines, (lines,), size
+
     def __del__(self):
-        if hasattr(self, "openfile"):
-            self.openfile.close()
+        if getattr(self, "reader", None) is not None:
+            self.reader.close()  # type: ignore
+
+
+_worker_functions: list[Callable] = []
+""" Compiled functions of the current worker process """
+
+
+def _init_worker(functions: list[Callable]):
+    global _worker_functions
+    _worker_functions = compile_functions(functions)
+
+
+def _process_chunk(
+    path: pathlib.Path, encoding: str, start: int, end: int
+) -> list[list[str]]:
+    """Returns the output lines of each line of the chunk ``[start, end)``"""
+    with path.open("rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    return _process_lines(_decode_lines(data, encoding, start == 0))
+
+
+def _process_lines(lines: Iterable[str]) -> list[list[str]]:
+    """Returns the output lines of each line"""
+    output = []
+    for line in lines:
+        processed = [line.strip()]
+        for function in _worker_functions:
+            processed = list(function(processed))
+        output.append(processed)
+    return output
+
+
+def _get_ranges(path: pathlib.Path, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Yields byte ranges of approximately ``chunk_size`` bytes that end after a
+    newline, or at the end of the file."""
+    size = path.stat().st_size
+    start = 0
+    with path.open("rb") as f:
+        while start < size:
+            f.seek(start + chunk_size - 1)
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def _check_picklable(functions: list[Callable]):
+    for function in functions:
+        try:
+            pickle.dumps(function)
+        except Exception as error:
+            raise ValueError(
+                f"Function {function!r} can't be pickled to be sent to the workers. "
+                "Use functions defined at module level (or functools.partial of "
+                "them) instead of lambdas and local functions."
+            ) from error
 
 
 class StreamFolderProcessor:
@@ -1,2 +1,4 @@
+from .intervals import *
+from .pattern_cache import *
 from .rexy import *
 from .templates import *
@@ -0,0 +1,188 @@
+"""Resolution of overlapping matches"""
+
+from __future__ import annotations
+
+__all__ = ["IntervalIndex", "resolve_overlaps", "OVERLAP_POLICIES"]
+
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+
+OVERLAP_POLICIES = ("first", "longest", "priority")
+""" Policies of :func:`resolve_overlaps` """
+
+
+class IntervalIndex:
+    """Sorted index of ``(start, end)`` intervals that checks whether an interval is
+    contained in any of the added intervals in ``O(log n)``.
+
+    Intervals that are contained in other intervals don't affect the checks, so only
+    the outermost intervals are kept. These are sorted by both their starts and
+    ends, which allows finding the only interval that can contain another one
+    using binary search.
+
+    Intervals are closed, an interval contains itself.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.rexy import IntervalIndex
+        >>> index = IntervalIndex()
+        >>> index.add(0, 10)
+        True
+        >>> index.add(2, 5)
+        False
+        >>> index.contains(3, 10), index.contains(5, 12)
+        (True, False)
+    """
+
+    __slots__ = ["_starts", "_ends"]
+
+    def __init__(self):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def contains(self, start: int, end: int) -> bool:
+        """Checks whether the input interval is contained in any of the added
+        intervals.
+
+        Parameters
+        ----------
+        start : int
+            Start of the interval.
+        end : int
+            End of the interval.
+
+        Returns
+        -------
+        bool
+            True if the interval is contained in an added interval.
+        """
+        # The interval with the largest start before ``start`` has the largest end
+        index = bisect_right(self._starts, start) - 1
+        return index >= 0 and self._ends[index] >= end
+
+    def add(self, start: int, end: int) -> bool:
+        """Adds the input interval if it is not contained in any of the added
+        intervals.
+
+        Parameters
+        ----------
+        start : int
+            Start of the interval.
+        end : int
+            End of the interval.
+
+        Returns
+        -------
+        bool
+            True if the interval is added, False if it is already contained.
+        """
+        if self.contains(start, end):
+            return False
+
+        # Removes the intervals contained in the new one
+        first = bisect_left(self._starts, start)
+        last = first
+        while last < len(self._ends) and self._ends[last] <= end:
+            last += 1
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+        return True
+
+    def clear(self):
+        """Removes all intervals"""
+        self._starts.clear()
+        self._ends.clear()
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+def resolve_overlaps(
+    results: Iterable[T],
+    policy: str = "first",
+    priority: Callable[[T], Any] | None = None,
+) -> list[T]:
+    """Removes the results that are contained in other results. Each result should
+    have ``start`` and ``end`` attributes, e.g. :class:`~.ExpressionResult` or
+    :class:`~.Dimension`.
+
+    Results are accepted one at a time, a result is removed if it is contained in
+    an already accepted result. The order in which results are accepted depends on
+    the ``policy``:
+
+    * ``"first"``: The order of the input results, the first result wins.
+    * ``"longest"``: Longer results first, the longest result wins.
+    * ``"priority"``: Ascending order of the ``priority`` of the results, the result
+      with the lowest value (highest priority) wins.
+
+    Ties are accepted in the order of the input results. Results that overlap
+    without being contained in each other are all kept.
+
+    Parameters
+    ----------
+    results : Iterable[T]
+        Results to resolve.
+    policy : str, optional
+        Policy used to choose between overlapping results, one of
+        :data:`OVERLAP_POLICIES`, by default "first"
+    priority : Callable[[T], Any], optional
+        Function that returns the priority of a result, required when ``policy``
+        is "priority", by default None
+
+    Returns
+    -------
+    List[T]
+        Accepted results in the same order of the input results.
+
+    Raises
+    ------
+    ValueError
+        If ``policy`` is not supported or if ``priority`` is not provided for the
+        "priority" policy.
+
+    Example
+    -------
+    .. code:: pycon
+
+        >>> from maha.rexy import Expression, ExpressionGroup, resolve_overlaps
+        >>> group = ExpressionGroup(
+        ...     Expression("ثلاثة"), Expression("أيام"), Expression("ثلاثة أيام")
+        ... )
+        >>> results = list(group.normal_parse("ثلاثة أيام"))
+        >>> [(r.start, r.end) for r in resolve_overlaps(results)]
+        [(0, 5), (6, 10), (0, 10)]
+        >>> [(r.start, r.end) for r in resolve_overlaps(results, "longest")]
+        [(0, 10)]
+    """
+    items: list[Any] = list(results)
+    order = _get_order(items, policy, priority)
+
+    index = IntervalIndex()
+    accepted = [i for i in order if index.add(items[i].start, items[i].end)]
+    return [items[i] for i in sorted(accepted)]
+
+
+def _get_order(
+    results: Sequence[Any], policy: str, priority: Callable[[Any], Any] | None
+) -> Sequence[int]:
+    """Returns the indices of the results in the order they are accepted"""
+    indices = range(len(results))
+    if policy == "first":
+        return indices
+    if policy == "longest":
+        return sorted(indices, key=lambda i: results[i].start - results[i].end)
+    if policy == "priority":
+        if priority is None:
+            raise ValueError("'priority' is required for the 'priority' policy")
+        return sorted(indices, key=lambda i: priority(results[i]))
+    raise ValueError(
+        f"Invalid policy {policy!r}, expected one of {', '.join(OVERLAP_POLICIES)}"
+    )
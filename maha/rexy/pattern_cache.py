@@ -0,0 +1,445 @@
+"""Persistent cache of compiled regular expressions"""
+
+from __future__ import annotations
+
+__all__ = ["PatternCache", "CacheStats", "PATTERN_CACHE"]
+
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import regex as re
+from regex import Pattern
+
+from maha import LIBRARY_PATH
+
+BUNDLED_CACHE_PATH = Path(LIBRARY_PATH) / "rexy" / "cache"
+""" Read-only cache shipped with the library """
+CACHE_DIR_ENV = "MAHA_CACHE_DIR"
+""" Environment variable of the cache directory """
+CACHE_MAX_SIZE_ENV = "MAHA_CACHE_MAX_SIZE"
+""" Environment variable of the maximum size of the cache in bytes """
+DEFAULT_MAX_SIZE = 256 * 2**20
+""" Default maximum size of the cache in bytes """
+SUFFIX = ".crp"
+""" Suffix of the cache files, crp: compiled regex pattern """
+PREFIX_SUFFIX = ".pre"
+""" Suffix of the cache files of the prefix patterns of
+:class:`~.ExpressionScanner` """
+
+
+def get_version_tag() -> str:
+    """Returns the tag of the current Python and ``regex`` versions. Compiled
+    patterns are only loaded by the same versions that saved them."""
+    major, minor = sys.version_info[:2]
+    return f"py{major}{minor}-regex{re.__version__}"
+
+
+def get_default_directory() -> Path:
+    """Returns the cache directory, which is the value of the environment variable
+    ``MAHA_CACHE_DIR`` if set, otherwise ``$XDG_CACHE_HOME/maha`` or
+    ``~/.cache/maha``."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if directory:
+        return Path(directory).expanduser()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "maha"
+
+
+@dataclass
+class CacheStats:
+    """Statistics of a :class:`PatternCache`"""
+
+    directory: Path
+    """Cache directory"""
+    entries: int
+    """Number of cached patterns"""
+    size: int
+    """Total size of the cached patterns in bytes"""
+    stale_entries: int
+    """Number of cached patterns saved by other Python or ``regex`` versions"""
+    stale_size: int
+    """Total size of the stale patterns in bytes"""
+    max_size: int
+    """Maximum size of the cache in bytes"""
+
+
+class PatternCache:
+    """Persistent cache of compiled regular expressions.
+
+    Compiling large patterns, such as the rules of the parsers, can take seconds.
+    Compiled patterns are pickled to the cache directory and loaded in later runs.
+    Each pattern is stored in a file named after the digest of the pattern and its
+    flags along with the Python and ``regex`` versions, so patterns are never loaded
+    by a different version.
+
+    Files are written atomically, so the cache can be shared between processes.
+    When the cache exceeds its maximum size, the least recently used patterns are
+    removed. If the directory is not writable (e.g. a read-only file system), the
+    patterns are compiled without caching.
+
+    Patterns that are not in the cache are looked up in the read-only cache shipped
+    with the library, which is only used if it was built with the installed
+    ``regex`` version.
+
+    The prefix patterns found by :class:`~.ExpressionScanner` are cached in the
+    same directory, see :meth:`load_prefix`.
+
+    Parameters
+    ----------
+    directory : Union[str, :obj:`pathlib.Path`], optional
+        Cache directory. If None, the value of the environment variable
+        ``MAHA_CACHE_DIR`` is used, otherwise ``$XDG_CACHE_HOME/maha`` or
+        ``~/.cache/maha``, by default None
+    max_size : int, optional
+        Maximum size of the cache in bytes. If None, the value of the environment
+        variable ``MAHA_CACHE_MAX_SIZE`` is used, otherwise 256 MiB,
+        by default None
+    bundled_directory : Union[str, :obj:`pathlib.Path`], optional
+        Read-only cache directory, by default the cache shipped with the library
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_size: int | None = None,
+        bundled_directory: str | Path | None = BUNDLED_CACHE_PATH,
+    ):
+        self._directory = Path(directory) if directory is not None else None
+        self._max_size = max_size
+        self.bundled_directory = (
+            Path(bundled_directory) if bundled_directory is not None else None
+        )
+        self._bundled_version: str | None = None
+
+    @property
+    def directory(self) -> Path:
+        """Cache directory"""
+        if self._directory is not None:
+            return self._directory
+        return get_default_directory()
+
+    @property
+    def max_size(self) -> int:
+        """Maximum size of the cache in bytes"""
+        if self._max_size is not None:
+            return self._max_size
+        return int(os.environ.get(CACHE_MAX_SIZE_ENV, DEFAULT_MAX_SIZE))
+
+    def get_path(self, pattern: str, flags: int = re.MULTILINE) -> Path:
+        """Returns the path of the cache file of the input ``pattern``.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression pattern.
+        flags : int, optional
+            Regular expression flags, by default ``regex.MULTILINE``
+
+        Returns
+        -------
+        :obj:`pathlib.Path`
+            Path of the cache file.
+        """
+        digest = hashlib.sha256(f"{flags}:{pattern}".encode()).hexdigest()
+        return self.directory / f"{digest}.{get_version_tag()}{SUFFIX}"
+
+    def compile(self, pattern: str, flags: int = re.MULTILINE) -> Pattern[str]:
+        """Loads the compiled ``pattern`` from the cache, or compiles and saves it
+        if it is not cached.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression pattern.
+        flags : int, optional
+            Regular expression flags, by default ``regex.MULTILINE``
+
+        Returns
+        -------
+        :class:`regex.Pattern`
+            Compiled pattern.
+        """
+        compiled = self.load(pattern, flags)
+        if compiled is None:
+            compiled = re.compile(pattern, flags)
+            self.save(compiled, flags)
+        return compiled
+
+    def load(self, pattern: str, flags: int = re.MULTILINE) -> Pattern[str] | None:
+        """Loads the compiled ``pattern`` from the cache.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression pattern.
+        flags : int, optional
+            Regular expression flags, by default ``regex.MULTILINE``
+
+        Returns
+        -------
+        Optional[:class:`regex.Pattern`]
+            Compiled pattern, None if it is not cached.
+        """
+        path = self.get_path(pattern, flags)
+        compiled = _load_file(path)
+        if compiled is not None:
+            try:
+                # Marks the file as recently used
+                os.utime(path)
+            except OSError:
+                pass
+            return compiled
+        if path.exists():
+            # Corrupted file
+            _remove_file(path)
+        return self._load_bundled(pattern, flags)
+
+    def save(self, compiled: Pattern[str], flags: int = re.MULTILINE) -> bool:
+        """Saves the input ``compiled`` pattern to the cache.
+
+        Parameters
+        ----------
+        compiled : :class:`regex.Pattern`
+            Compiled pattern.
+        flags : int, optional
+            Regular expression flags the pattern was compiled with,
+            by default ``regex.MULTILINE``
+
+        Returns
+        -------
+        bool
+            True if the pattern is saved, False if the directory is not writable.
+        """
+        path = self.get_path(compiled.pattern, flags)
+        data = pickle.dumps(compiled, pickle.HIGHEST_PROTOCOL)
+        if not _write_file(path, data):
+            return False
+
+        self._evict()
+        return True
+
+    def get_prefix_path(self, pattern: str, version: int) -> Path:
+        """Returns the path of the cache file of the prefix pattern of the input
+        ``pattern``.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression pattern.
+        version : int
+            Version of the algorithm that finds the prefix pattern.
+
+        Returns
+        -------
+        :obj:`pathlib.Path`
+            Path of the cache file.
+        """
+        digest = hashlib.sha256(f"prefix{version}:{pattern}".encode()).hexdigest()
+        return self.directory / f"{digest}.{get_version_tag()}{PREFIX_SUFFIX}"
+
+    def load_prefix(self, pattern: str, version: int) -> str | None:
+        """Loads the prefix pattern of the input ``pattern`` from the cache.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression pattern.
+        version : int
+            Version of the algorithm that finds the prefix pattern.
+
+        Returns
+        -------
+        Optional[str]
+            Prefix pattern, an empty string if the pattern has no prefix pattern or
+            None if it is not cached.
+        """
+        path = self.get_prefix_path(pattern, version)
+        try:
+            prefix = path.read_bytes().decode("utf8")
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return prefix
+
+    def save_prefix(self, pattern: str, prefix: str | None, version: int) -> bool:
+        """Saves the prefix pattern of the input ``pattern`` to the cache.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression pattern.
+        prefix : Optional[str]
+            Prefix pattern, None if the pattern has no prefix pattern.
+        version : int
+            Version of the algorithm that found the prefix pattern.
+
+        Returns
+        -------
+        bool
+            True if the prefix is saved, False if the directory is not writable.
+        """
+        path = self.get_prefix_path(pattern, version)
+        if not _write_file(path, (prefix or "").encode("utf8")):
+            return False
+
+        self._evict()
+        return True
+
+    def entries(self) -> list[Path]:
+        """Returns the paths of the cached patterns and prefixes, including stale
+        ones.
+
+        Returns
+        -------
+        List[:obj:`pathlib.Path`]
+            Paths of the cache files.
+        """
+        try:
+            return [
+                p
+                for p in self.directory.iterdir()
+                if p.suffix in (SUFFIX, PREFIX_SUFFIX)
+            ]
+        except OSError:
+            return []
+
+    def stats(self) -> CacheStats:
+        """Returns statistics of the cache.
+
+        Returns
+        -------
+        :class:`CacheStats`
+            Statistics of the cache.
+        """
+        tag = get_version_tag()
+        entries = stale_entries = size = stale_size = 0
+        for path in self.entries():
+            file_size = _get_size(path)
+            entries += 1
+            size += file_size
+            if not path.name.endswith(f".{tag}{path.suffix}"):
+                stale_entries += 1
+                stale_size += file_size
+        return CacheStats(
+            self.directory, entries, size, stale_entries, stale_size, self.max_size
+        )
+
+    def clear(self, stale_only: bool = False) -> int:
+        """Removes the cached patterns.
+
+        Parameters
+        ----------
+        stale_only : bool, optional
+            True to only remove patterns saved by other Python or ``regex``
+            versions, by default False
+
+        Returns
+        -------
+        int
+            Number of removed patterns.
+        """
+        tag = get_version_tag()
+        removed = 0
+        for path in self.entries():
+            if stale_only and path.name.endswith(f".{tag}{path.suffix}"):
+                continue
+            removed += _remove_file(path)
+        return removed
+
+    def _evict(self):
+        """Removes the least recently used patterns until the cache fits in
+        :attr:`max_size`."""
+        entries = []
+        for path in self.entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(e[1] for e in entries)
+        for _, file_size, path in sorted(entries, key=lambda e: e[0]):
+            if size <= self.max_size:
+                break
+            if _remove_file(path):
+                size -= file_size
+
+    def _load_bundled(self, pattern: str, flags: int) -> Pattern[str] | None:
+        # The bundled cache holds the patterns of the rules, which are compiled
+        # with the multiline flag, and is named after the hash of the expressions.
+        if self.bundled_directory is None or flags != re.MULTILINE:
+            return None
+        if self._bundled_version is None:
+            try:
+                manifest = json.loads(
+                    (self.bundled_directory / "manifest.json").read_text()
+                )
+                self._bundled_version = str(manifest["regex"])
+            except (OSError, ValueError, KeyError):
+                self._bundled_version = ""
+        if self._bundled_version != re.__version__:
+            return None
+        name = self._bundled_name(pattern)
+        return _load_file(self.bundled_directory / f"{name}{SUFFIX}")
+
+    @staticmethod
+    def _bundled_name(pattern: str) -> str:
+        """Returns the name of the bundled cache file, the hash of the expression"""
+        return str(hash(int(hashlib.md5(pattern.encode()).hexdigest(), 16)))
+
+
+def _load_file(path: Path) -> Pattern[str] | None:
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_file(path: Path, data: bytes) -> bool:
+    """Writes the file atomically, returns False if the directory is not
+    writable"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    except OSError:
+        return False
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        _remove_file(Path(temp_path))
+        return False
+    return True
+
+
+def _remove_file(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except OSError:
+        return False
+
+
+def _get_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+PATTERN_CACHE = PatternCache()
+""" Cache used by :class:`~.Expression` to load compiled patterns """
@@ -8,11 +8,21 @@ __all__ = [
     "positive_lookahead",
     "named_group",
     "capture_group",
+    "get_expression",
+    "get_strings_expression",
 ]
 
 
+from functools import lru_cache
+
+import regex as re
+
 from maha.rexy.templates import Expression
 
+EXPRESSION_CACHE_SIZE = 1024
+""" Maximum number of expressions memoized by :func:`get_expression` and
+:func:`get_strings_expression` """
+
 
 def non_capturing_group(*patterns: Expression | str):
     """Returns a non capturing groups of patterns."""
@@ -42,3 +52,41 @@ def named_group(name: str, pattern: Expression | str):
 def capture_group(*patterns: Expression | str):
     """Returns a capturing group pattern"""
     return "({})".format("|".join(str(p) for p in patterns))
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def get_expression(pattern: str) -> Expression:
+    """Returns a shared expression of the input ``pattern``, so the pattern is
+    compiled once.
+
+    Expressions are memoized in a bounded LRU cache, use
+    ``get_expression.cache_info()`` to get the number of hits and misses.
+    """
+    return Expression(pattern)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def get_strings_expression(
+    strings: tuple[str, ...], template: str = "({})", separator: str = "|"
+) -> Expression:
+    """Returns a shared expression that matches any of the input ``strings``.
+
+    The escaped strings are joined by ``separator`` and formatted into
+    ``template``. Expressions are memoized in a bounded LRU cache, use
+    ``get_strings_expression.cache_info()`` to get the number of hits and misses.
+
+    Parameters
+    ----------
+    strings : Tuple[str, ...]
+        Strings to match, in order of priority.
+    template : str, optional
+        Pattern template, by default a capturing group ``"({})"``
+    separator : str, optional
+        Separator of the escaped strings, by default ``"|"``
+
+    Returns
+    -------
+    :class:`~.Expression`
+        Shared expression.
+    """
+    return Expression(template.format(separator.join(re.escape(s) for s in strings)))
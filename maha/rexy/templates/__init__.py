@@ -1,3 +1,5 @@
-from .expression import Expression
+from .expression import Expression, get_concurrent, set_concurrent
 from .expression_group import ExpressionGroup
 from .expression_result import ExpressionResult
+from .expression_scanner import ExpressionScanner, get_prefix_pattern
+from .trie_expression import TrieExpression
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-__all__ = ["Expression"]
+__all__ = ["Expression", "set_concurrent", "get_concurrent"]
 
 
 import hashlib
 import pickle
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Iterable
@@ -12,24 +13,58 @@ from typing import Callable, Iterable
 import regex as re
 from regex import Match, Pattern
 
+import maha.rexy as rx
 from maha import LIBRARY_PATH
 
 from .expression_result import ExpressionResult
 
 CACHE_PATH = Path(LIBRARY_PATH) / "rexy" / "cache"
 
+_COMPILE_LOCK = threading.RLock()
+""" Lock of the lazy compilation of the expressions """
+_concurrent = False
+""" Whether the GIL is released while matching, see :func:`set_concurrent` """
+
+
+def set_concurrent(enabled: bool = True):
+    """Enables or disables the concurrent matching mode of all expressions.
+
+    In the concurrent mode, the GIL is released while matching (using the
+    ``concurrent`` argument of :mod:`regex`), so texts that are parsed in
+    multiple threads (e.g. using :class:`~concurrent.futures.ThreadPoolExecutor`)
+    are matched in parallel. This adds a small overhead to each match, so it is
+    disabled by default.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to enable the concurrent mode, by default True
+    """
+    global _concurrent
+    _concurrent = bool(enabled)
+
+
+def get_concurrent() -> bool:
+    """Returns whether the concurrent matching mode is enabled. See
+    :func:`set_concurrent`."""
+    return _concurrent
+
 
 @dataclass
 class Expression:
     """Regex pattern holder.
 
+    Expressions can be shared between threads, the pattern is compiled once on
+    first use.
+
     Parameters
     ----------
     pattern : str
         Regular expression pattern.
     pickle : bool
-        If ``True``, the compiled pattern will be pickled. This is useful to save
-        compilation time for large patterns.
+        If ``True``, the compiled pattern will be loaded from (and saved to) the
+        persistent :class:`~.PatternCache`. This is useful to save compilation time
+        for large patterns.
     """
 
     __slots__ = ["pattern", "_compiled_pattern", "pickle"]
@@ -48,22 +83,18 @@ class Expression:
 
     def compile(self):
         """Compile the regular expersion."""
-        if self._compiled_pattern is None:
-            if self.pickle:
-                self._load_compiled_pattern()
-            else:
-                self._compiled_pattern = re.compile(self.pattern, re.MULTILINE)
+        if self._compiled_pattern is not None:
+            return
+        with _COMPILE_LOCK:
+            # Another thread might have compiled the pattern while waiting
+            if self._compiled_pattern is None:
+                if self.pickle:
+                    self._load_compiled_pattern()
+                else:
+                    self._compiled_pattern = re.compile(self.pattern, re.MULTILINE)
 
     def _load_compiled_pattern(self):
-        # crp: compiled regex pattern
-        path = CACHE_PATH / f"{hash(self)}.crp"
-        if path.exists():
-            with path.open("rb") as f:
-                self._compiled_pattern = pickle.load(f)
-        else:
-            self._compiled_pattern = re.compile(self.pattern, re.MULTILINE)
-            with path.open("wb") as f:
-                pickle.dump(self._compiled_pattern, f)
+        self._compiled_pattern = rx.PATTERN_CACHE.compile(self.pattern, re.MULTILINE)
 
     @classmethod
     def from_cache(cls, cache: str) -> Expression:
@@ -101,7 +132,7 @@ class Expression:
             Matched object.
         """
         self.compile()
-        return self._compiled_pattern.search(text)
+        return self._compiled_pattern.search(text, concurrent=_concurrent)
 
     def match(self, text: str) -> Match[str] | None:
         """Match the pattern in the input ``text``.
@@ -117,7 +148,7 @@ class Expression:
             Matched object.
         """
         self.compile()
-        return self._compiled_pattern.match(text)
+        return self._compiled_pattern.match(text, concurrent=_concurrent)
 
     def fullmatch(self, text: str) -> Match[str] | None:
         """Match the pattern in the input ``text``.
@@ -133,7 +164,7 @@ class Expression:
             Matched object.
         """
         self.compile()
-        return self._compiled_pattern.fullmatch(text)
+        return self._compiled_pattern.fullmatch(text, concurrent=_concurrent)
 
     def sub(self, repl: Callable[..., str] | str, text: str) -> str:
         """Replace all occurrences of the pattern in the input ``text``.
@@ -151,7 +182,7 @@ class Expression:
             Text with replaced occurrences.
         """
         self.compile()
-        return self._compiled_pattern.sub(repl, text)
+        return self._compiled_pattern.sub(repl, text, concurrent=_concurrent)
 
     def __call__(self, text: str) -> Iterable[ExpressionResult]:
         """
@@ -185,7 +216,7 @@ class Expression:
         """
         self.compile()
 
-        for m in re.finditer(self._compiled_pattern, text):
+        for m in self._compiled_pattern.finditer(text, concurrent=_concurrent):
             yield self._parse(m, text)
 
     def _parse(self, match: Match[str], _: str) -> ExpressionResult:
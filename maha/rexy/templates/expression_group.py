@@ -5,8 +5,81 @@ __all__ = ["ExpressionGroup"]
 
 from typing import Iterable, overload
 
+import regex as re
+from regex import Pattern
+
 import maha.rexy as rx
 
+MATCHED_CACHE_SIZE = 4096
+""" Maximum number of memoized texts of :meth:`ExpressionGroup.get_matched_expression`
+of each group """
+
+
+_NOT_COMBINABLE = re.compile(r"\\[1-9]|\\g<\d|\(\?\(\d|\(\?[a-zA-Z-]+\)")
+""" Numbered references and global flags, which change when patterns are combined """
+
+
+class _IndexedMatcher:
+    """Finds the first expression that fully matches a text using a single pattern
+    that combines the expressions. Each expression is wrapped in a named group to
+    know which one matched. The matched expressions are memoized by text.
+
+    If the patterns can't be combined (e.g. patterns with global flags or numbered
+    references), each expression is matched separately.
+    """
+
+    __slots__ = ["expressions", "size", "pattern", "groups", "memo"]
+
+    def __init__(self, expressions: list[rx.Expression]):
+        self.expressions = expressions
+        self.size = len(expressions)
+        self.memo: dict[str, int] = {}
+        self.pattern = self._compile(expressions)
+        self.groups = []
+        if self.pattern is not None:
+            self.groups = [
+                self.pattern.groupindex[f"_rx_{i}"] for i in range(self.size)
+            ]
+
+    @staticmethod
+    def _compile(expressions: list[rx.Expression]) -> Pattern[str] | None:
+        if any(_NOT_COMBINABLE.search(e.pattern) for e in expressions):
+            return None
+        patterns = [f"(?P<_rx_{i}>{e.pattern})" for i, e in enumerate(expressions)]
+        pattern = "|".join(patterns)
+        try:
+            if any(e.pickle for e in expressions):
+                return rx.PATTERN_CACHE.compile(pattern, re.MULTILINE)
+            return re.compile(pattern, re.MULTILINE)
+        except re.error:
+            return None
+
+    def match(self, text: str) -> int:
+        """Returns the index of the first expression that fully matches the text,
+        -1 if no expression matches."""
+        index = self.memo.get(text)
+        if index is not None:
+            return index
+
+        index = -1
+        if self.pattern is None:
+            for i, expression in enumerate(self.expressions):
+                if expression.fullmatch(text):
+                    index = i
+                    break
+        else:
+            # The alternatives are tried in order, so the first expression that can
+            # fully match the text is matched.
+            m = self.pattern.fullmatch(text)
+            if m is not None:
+                regs = m.regs
+                index = next(i for i, g in enumerate(self.groups) if regs[g][0] >= 0)
+
+        if len(self.memo) >= MATCHED_CACHE_SIZE:
+            self.memo.clear()
+        self.memo[text] = index
+        return index
+
 
 class ExpressionGroup:
     """A group of expressions that match the same dimension. Expressions are evaluated
@@ -18,19 +91,35 @@ class ExpressionGroup:
         List of expressions to match. High-priority expressions should be passed first.
     smart : bool, optional
         Whether to parse the text in a smart way. See :meth:`~.smart_parse`.
+    overlap : str, optional
+        Policy used by :meth:`~.smart_parse` to choose between overlapping values,
+        one of :data:`~.OVERLAP_POLICIES`. See :func:`~.resolve_overlaps`,
+        by default "first"
+
+    Raises
+    ------
+    ValueError
+        If ``overlap`` is not a supported policy.
     """
 
-    __slots__ = ["expressions", "smart", "_parsed_ranges"]
+    __slots__ = ["expressions", "smart", "overlap", "_matcher"]
 
     def __init__(
         self,
         *expressions: rx.Expression | ExpressionGroup,
         smart: bool = False,
+        overlap: str = "first",
     ):
+        if overlap not in rx.OVERLAP_POLICIES:
+            raise ValueError(
+                f"Invalid overlap {overlap!r}, expected one of "
+                f"{', '.join(rx.OVERLAP_POLICIES)}"
+            )
 
         self.expressions = self._merge_expressions(expressions)
-        self._parsed_ranges: set[tuple[int, int]] = set()
+        self._matcher: _IndexedMatcher | None = None
         self.smart = smart
+        self.overlap = overlap
 
     def compile_expressions(self):
         for expression in self.expressions:
@@ -56,6 +145,7 @@ class ExpressionGroup:
             Expressions to add.
         """
         self.expressions.extend(expression)
+        self._matcher = None
 
     def join(self) -> str:
         """Returns non capturing group of the expressions.
@@ -68,7 +158,11 @@ class ExpressionGroup:
         return rx.non_capturing_group(*list(map(str, self.expressions)))
 
     def get_matched_expression(self, text: str) -> rx.Expression | None:
-        """Returns the expression that fully matches the text.
+        """Returns the expression that fully matches the text. If more than one
+        expression matches, the first one is returned.
+
+        The text is matched once using a pattern that combines all expressions,
+        and the matched expression of each text is memoized.
 
         Parameters
         ----------
@@ -80,10 +174,17 @@ class ExpressionGroup:
         :class:`~.Expression`
             Expression that fully matches the text.
         """
-        for expression in self.expressions:
-            if expression.fullmatch(text):
-                return expression
-        return None
+        matcher = self._matcher
+        # The expressions can also be changed directly
+        if (
+            matcher is None
+            or matcher.expressions is not self.expressions
+            or matcher.size != len(self.expressions)
+        ):
+            matcher = self._matcher = _IndexedMatcher(self.expressions)
+
+        index = matcher.match(text)
+        return self.expressions[index] if index >= 0 else None
 
     def parse(self, text: str) -> Iterable[rx.ExpressionResult]:
         """
@@ -106,8 +207,6 @@ class ExpressionGroup:
         else:
             yield from self.normal_parse(text)
 
-        self._clear_parsed()
-
     def normal_parse(self, text: str) -> Iterable[rx.ExpressionResult]:
         """Parse the input ``text`` and return the extracted values.
 
@@ -130,6 +229,10 @@ class ExpressionGroup:
         expression parses the value, no value is matched more than once. This means
         high-priority expressions should be added to the group first.
 
+        Values that are contained in other values are chosen using the
+        :attr:`overlap` policy, by default the first value wins. The priority of
+        the "priority" policy is the order of the expressions.
+
         Parameters
         ----------
         text : str
@@ -141,24 +244,24 @@ class ExpressionGroup:
             Extracted value.
         """
 
+        if self.overlap != "first":
+            priorities = {id(e): i for i, e in enumerate(self.expressions)}
+            yield from rx.resolve_overlaps(
+                self.normal_parse(text),
+                self.overlap,
+                lambda result: priorities.get(id(result.expression), len(priorities)),
+            )
+            return
+
+        # The state is local to each call, so the group can be shared between threads
+        parsed_ranges = rx.IntervalIndex()
         for result in self.normal_parse(text):
-            if self._is_parsed(result):
-                continue
-            self._parsed_ranges.add((result.start, result.end))
-            yield result
-
-    def _is_parsed(self, result: rx.ExpressionResult):
-        for start, end in self._parsed_ranges:
-            if start <= result.start <= end and start <= result.end <= end:
-                return True
-
-        return False
-
-    def _clear_parsed(self):
-        self._parsed_ranges = set()
+            if parsed_ranges.add(result.start, result.end):
+                yield result
 
     def __add__(self, other: ExpressionGroup) -> ExpressionGroup:
         self.expressions.extend(other.expressions)
+        self._matcher = None
         return self
 
     def __iter__(self):
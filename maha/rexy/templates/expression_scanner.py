@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+__all__ = ["ExpressionScanner", "get_prefix_pattern"]
+
+
+from typing import Iterable
+
+import regex as re
+
+import maha.rexy as rx
+
+from .expression import Expression, get_concurrent
+from .expression_result import ExpressionResult
+
+try:
+    from re import _parser as sre_parse  # type: ignore
+except ImportError:  # pragma: no cover
+    import sre_parse  # type: ignore
+
+PREFIX_LENGTH = 3
+""" Maximum number of characters of the prefixes used to find candidate positions """
+MAX_PREFIXES = 20000
+""" Maximum number of prefixes, shorter prefixes are used if exceeded """
+PREFIX_VERSION = 1
+""" Version of :func:`get_prefix_pattern`, cached prefixes of other versions are
+not used. Increment it when the prefixes change. """
+
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: r"\d",
+    sre_parse.CATEGORY_NOT_DIGIT: r"\D",
+    sre_parse.CATEGORY_SPACE: r"\s",
+    sre_parse.CATEGORY_NOT_SPACE: r"\S",
+    sre_parse.CATEGORY_WORD: r"\w",
+    sre_parse.CATEGORY_NOT_WORD: r"\W",
+}
+_REPEATS = {
+    sre_parse.MAX_REPEAT,
+    sre_parse.MIN_REPEAT,
+    getattr(sre_parse, "POSSESSIVE_REPEAT", sre_parse.MAX_REPEAT),
+}
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+_ZERO_WIDTH = {sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT}
+_UNSUPPORTED_FLAGS = (
+    sre_parse.SRE_FLAG_IGNORECASE
+    | sre_parse.SRE_FLAG_LOCALE
+    | sre_parse.SRE_FLAG_DOTALL
+    | sre_parse.SRE_FLAG_VERBOSE
+    | sre_parse.SRE_FLAG_ASCII
+)
+_EXPRESSION_NAMED_GROUP = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _TooManyPrefixes(Exception):
+    pass
+
+
+def _concat(prefixes: set[tuple], others: set[tuple], length: int) -> set[tuple]:
+    output = set()
+    for prefix in prefixes:
+        if len(prefix) >= length:
+            output.add(prefix)
+            continue
+        for other in others:
+            output.add((prefix + other)[:length])
+        if len(output) > MAX_PREFIXES:
+            raise _TooManyPrefixes()
+    return output
+
+
+def _char_class(items) -> str:
+    negate = False
+    parts = []
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            parts.append(re.escape(chr(av)))
+        elif op is sre_parse.RANGE:
+            parts.append(re.escape(chr(av[0])) + "-" + re.escape(chr(av[1])))
+        elif op is sre_parse.CATEGORY and av in _CATEGORIES:
+            parts.append(_CATEGORIES[av])
+        else:
+            raise _Unsupported()
+    return "[" + ("^" if negate else "") + "".join(parts) + "]"
+
+
+def _sequence_prefixes(items, length: int) -> set[tuple]:
+    prefixes: set[tuple] = {()}
+    for op, av in items:
+        if all(len(prefix) >= length for prefix in prefixes):
+            break
+        prefixes = _concat(prefixes, _item_prefixes(op, av, length), length)
+    return prefixes
+
+
+def _item_prefixes(op, av, length: int) -> set[tuple]:
+    if op is sre_parse.LITERAL:
+        return {(re.escape(chr(av)),)}
+    if op is sre_parse.NOT_LITERAL:
+        return {("[^" + re.escape(chr(av)) + "]",)}
+    if op is sre_parse.IN:
+        return {(_char_class(av),)}
+    if op is sre_parse.ANY:
+        return {(".",)}
+    if op in _ZERO_WIDTH:
+        # Assertions don't consume characters, ignoring them only adds candidates
+        return {()}
+    if op is sre_parse.BRANCH:
+        output: set[tuple] = set()
+        for branch in av[1]:
+            output |= _sequence_prefixes(branch, length)
+        return output
+    if op is sre_parse.SUBPATTERN:
+        if av[1] or av[2]:
+            raise _Unsupported()
+        return _sequence_prefixes(av[3], length)
+    if op is _ATOMIC_GROUP:
+        return _sequence_prefixes(av, length)
+    if op in _REPEATS:
+        minimum, maximum, items = av
+        prefixes = _sequence_prefixes(items, length)
+        if () in prefixes:
+            minimum = 0
+        # Each non empty repetition adds at least one character
+        maximum = length if maximum is sre_parse.MAXREPEAT else min(maximum, length)
+        minimum = min(minimum, length)
+        output = set()
+        repeated: set[tuple] = {()}
+        for count in range(maximum + 1):
+            if count >= minimum:
+                output |= repeated
+            repeated = _concat(repeated, prefixes, length)
+        return output
+    raise _Unsupported()
+
+
+def get_prefix_pattern(pattern: str) -> str | None:
+    """Returns a pattern that matches at every position the input ``pattern`` can
+    start matching at. It matches the possible first characters (up to
+    :data:`PREFIX_LENGTH`) of the input pattern.
+
+    Parameters
+    ----------
+    pattern : str
+        Regular expression pattern.
+
+    Returns
+    -------
+    Optional[str]
+        Prefix pattern, None if the input pattern is not supported or can match
+        an empty string.
+    """
+    # Duplicate group names are allowed in the regex module only, group names don't
+    # affect the matched text.
+    pattern = _EXPRESSION_NAMED_GROUP.sub("(?:", pattern)
+    try:
+        tree = sre_parse.parse(pattern, sre_parse.SRE_FLAG_MULTILINE)
+    except Exception:
+        return None
+
+    if tree.state.flags & _UNSUPPORTED_FLAGS:
+        return None
+
+    for length in range(PREFIX_LENGTH, 0, -1):
+        try:
+            prefixes = _sequence_prefixes(tree, length)
+        except _Unsupported:
+            return None
+        except _TooManyPrefixes:
+            continue
+        if () in prefixes:
+            return None
+        return "(?:{})".format("|".join(sorted("".join(p) for p in prefixes)))
+    return None
+
+
+class ExpressionScanner:
+    """Extracts values of multiple expressions from a text in a single scan.
+
+    The text is scanned once for candidate positions, i.e. positions at which any
+    of the expressions can start matching, based on the possible first characters
+    of each expression. Each expression is then only matched at its candidate
+    positions instead of every position in the text. The results are identical to
+    parsing the text with each expression separately.
+
+    Expressions that don't use a regular expression to parse the text (e.g.
+    :class:`~.TrieExpression`) are parsed normally.
+
+    .. note::
+        The prefixes of expressions with ``pickle=True`` are cached in the
+        :class:`~.PatternCache`, because finding the prefixes of large patterns is
+        slow.
+
+    Parameters
+    ----------
+    *expressions : :class:`~.Expression`
+        Expressions to extract values with.
+    """
+
+    __slots__ = ["expressions", "_prefixes", "_candidates"]
+
+    def __init__(self, *expressions: Expression):
+        self.expressions = list(expressions)
+        self._prefixes = [self._get_prefix(e) for e in self.expressions]
+
+        patterns = [p.pattern for p in self._prefixes if p is not None]
+        self._candidates = (
+            re.compile(f"(?={'|'.join(patterns)})", re.MULTILINE) if patterns else None
+        )
+
+    @staticmethod
+    def _get_prefix(expression: Expression):
+        if type(expression).parse is not Expression.parse:
+            return None
+
+        pattern = None
+        if expression.pickle:
+            pattern = rx.PATTERN_CACHE.load_prefix(expression.pattern, PREFIX_VERSION)
+        if pattern is None:
+            pattern = get_prefix_pattern(expression.pattern)
+            if expression.pickle:
+                rx.PATTERN_CACHE.save_prefix(
+                    expression.pattern, pattern, PREFIX_VERSION
+                )
+
+        if not pattern:
+            return None
+        return re.compile(pattern, re.MULTILINE)
+
+    def scan(self, text: str) -> list[list[ExpressionResult]]:
+        """Extracts the values of all expressions from the input ``text``.
+
+        Parameters
+        ----------
+        text : str
+            Text to extract values from.
+
+        Returns
+        -------
+        List[List[:class:`~.ExpressionResult`]]
+            Extracted values of each expression, in the same order of the
+            expressions.
+        """
+        concurrent = get_concurrent()
+        positions: list[int] = []
+        if self._candidates is not None:
+            positions = [
+                m.start()
+                for m in self._candidates.finditer(text, concurrent=concurrent)
+            ]
+
+        output = []
+        for expression, prefix in zip(self.expressions, self._prefixes):
+            if prefix is None:
+                output.append(list(expression(text)))
+            else:
+                output.append(
+                    list(self._parse(expression, prefix, text, positions, concurrent))
+                )
+        return output
+
+    @staticmethod
+    def _parse(
+        expression: Expression,
+        prefix,
+        text: str,
+        positions: list[int],
+        concurrent: bool = False,
+    ) -> Iterable[ExpressionResult]:
+        expression.compile()
+        match = expression._compiled_pattern.match
+        next_position = 0
+        for position in positions:
+            if position < next_position or not prefix.match(text, position):
+                continue
+            m = match(text, position, concurrent=concurrent)
+            if m is not None:
+                # Prefixes are never empty, so matches are never empty
+                next_position = m.end()
+                yield expression._parse(m, text)
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+__all__ = ["TrieExpression"]
+
+
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import regex as re
+
+import maha.rexy as rx
+
+from .expression import Expression, get_concurrent
+from .expression_result import ExpressionResult
+
+MAGIC = b"MAHATRIE"
+""" Signature of the binary trie file """
+VERSION = 1
+""" Version of the binary trie file format """
+HEADER = struct.Struct("<8sIII")
+""" Magic, version, number of nodes and the item size of the labels """
+
+
+def _build_trie(words: Iterable[str]):
+    """Builds the flat trie arrays of the input words.
+
+    Nodes are numbered in breadth-first order and the edges of each node are sorted
+    by label and stored contiguously, so the edge at index ``i`` always leads to the
+    node ``i + 1`` and no target array is needed.
+    """
+    root: list = [{}, -1]
+    rank = 0
+    for word in words:
+        if not word:
+            raise ValueError("Words must not be empty")
+        node = root
+        for char in word:
+            node = node[0].setdefault(char, [{}, -1])
+        if node[1] == -1:
+            node[1] = rank
+            rank += 1
+
+    offsets = array("I", [0])
+    labels = []
+    ranks = array("i")
+    queue = [root]
+    for children, node_rank in queue:
+        ranks.append(node_rank)
+        for char in sorted(children):
+            labels.append(ord(char))
+            queue.append(children[char])
+        offsets.append(len(labels))
+
+    typecode = "H" if not labels or max(labels) <= 0xFFFF else "I"
+    return offsets, array(typecode, labels), ranks
+
+
+def _as_expression(expression: Expression | str | None) -> Expression | None:
+    if expression is None or isinstance(expression, Expression):
+        return expression
+    return Expression(expression)
+
+
+class TrieExpression(Expression):
+    """Expression that matches any of the input words using a trie.
+
+    The text is scanned once; the trie is walked from each position that satisfies
+    the ``start`` boundary, so matching is linear in the length of the text. When
+    more than one word matches at the same position, the first one in the input
+    order that satisfies the ``end`` boundary is selected, which is identical to
+    matching the regular expression ``start + capture_group(*words) + end``.
+
+    The trie is stored in flat arrays that can be saved to a binary file using
+    :meth:`save` and memory-mapped using :meth:`load`.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        Words to match.
+    start : Union[:class:`~.Expression`, str], optional
+        Zero-width pattern that must match at the start of the word, by default None
+    end : Union[:class:`~.Expression`, str], optional
+        Zero-width pattern that must match at the end of the word, by default None
+
+    Raises
+    ------
+    ValueError
+        If any of the words is empty.
+
+    Example
+    -------
+
+    .. code:: pycon
+
+        >>> from maha.rexy import TrieExpression
+        >>> expression = TrieExpression(["محمد", "أحمد"], end=r"\\b")
+        >>> [result.value for result in expression("محمد وأحمد")]
+        ['محمد', 'أحمد']
+    """
+
+    __slots__ = ["start", "end", "_offsets", "_labels", "_ranks", "_path"]
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        start: Expression | str | None = None,
+        end: Expression | str | None = None,
+    ):
+        offsets, labels, ranks = _build_trie(words)
+        self._setup(offsets, labels, ranks, start, end)
+
+    def _setup(
+        self,
+        offsets: Sequence[int],
+        labels: Sequence[int],
+        ranks: Sequence[int],
+        start: Expression | str | None,
+        end: Expression | str | None,
+        path: Path | None = None,
+    ):
+        self.pickle = False
+        self._compiled_pattern = None  # type: ignore
+        self.start = _as_expression(start)
+        self.end = _as_expression(end)
+        self._offsets = offsets
+        self._labels = labels
+        self._ranks = ranks
+        self._path = path
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        start: Expression | str | None = None,
+        end: Expression | str | None = None,
+    ) -> TrieExpression:
+        """Loads a trie saved by :meth:`save`. The file is memory-mapped, so only
+        the parts of the trie visited while matching are read from disk.
+
+        Parameters
+        ----------
+        path : Union[str, :obj:`pathlib.Path`]
+            Path of the trie file.
+        start : Union[:class:`~.Expression`, str], optional
+            Zero-width pattern that must match at the start of the word,
+            by default None
+        end : Union[:class:`~.Expression`, str], optional
+            Zero-width pattern that must match at the end of the word,
+            by default None
+
+        Returns
+        -------
+        :class:`~.TrieExpression`
+            Loaded expression.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a valid trie file.
+        """
+        path = Path(path)
+        with path.open("rb") as f:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{str(path)} is not a valid trie file")
+        magic, version, n_nodes, label_size = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION or label_size not in (2, 4):
+            raise ValueError(f"{str(path)} is not a valid trie file")
+
+        sizes = [4 * (n_nodes + 1), label_size * (n_nodes - 1), 4 * n_nodes]
+        if len(buffer) != HEADER.size + sum(sizes):
+            raise ValueError(f"{str(path)} is not a valid trie file")
+
+        arrays: list[Sequence[int]] = []
+        position = HEADER.size
+        for size, typecode in zip(sizes, ["I", "H" if label_size == 2 else "I", "i"]):
+            data = buffer[position : position + size]
+            position += size
+            if sys.byteorder == "little":
+                arrays.append(data.cast(typecode))  # type: ignore
+            else:
+                values = array(typecode, data.tobytes())
+                values.byteswap()
+                arrays.append(values)
+
+        expression = cls.__new__(cls)
+        offsets, labels, ranks = arrays
+        expression._setup(offsets, labels, ranks, start, end, path)
+        return expression
+
+    def save(self, path: str | Path):
+        """Saves the trie to a flat binary file that can be loaded using
+        :meth:`load`. The boundaries are not saved.
+
+        Parameters
+        ----------
+        path : Union[str, :obj:`pathlib.Path`]
+            Path of the trie file.
+        """
+        with Path(path).open("wb") as f:
+            f.write(self._to_bytes())
+
+    def _to_bytes(self) -> bytes:
+        label_size = self._labels.itemsize  # type: ignore
+        output = [HEADER.pack(MAGIC, VERSION, len(self._ranks), label_size)]
+        for typecode, values in zip(
+            ["I", "H" if label_size == 2 else "I", "i"],
+            [self._offsets, self._labels, self._ranks],
+        ):
+            values = array(typecode, values)
+            if sys.byteorder != "little":
+                values.byteswap()
+            output.append(values.tobytes())
+        return b"".join(output)
+
+    @property
+    def words(self) -> list[str]:
+        """Words of the trie in the input order"""
+        words = []
+        stack = [(0, "")]
+        while stack:
+            node, prefix = stack.pop()
+            if self._ranks[node] >= 0:
+                words.append((self._ranks[node], prefix))
+            for edge in range(self._offsets[node], self._offsets[node + 1]):
+                stack.append((edge + 1, prefix + chr(self._labels[edge])))
+        return [word for _, word in sorted(words)]
+
+    @property  # type: ignore
+    def pattern(self) -> str:  # type: ignore
+        """Equivalent regular expression, used by the regex based methods such as
+        :meth:`~.Expression.search` and :meth:`~.Expression.sub`."""
+        return (
+            str(self.start or "")
+            + rx.capture_group(*(re.escape(w) for w in self.words))
+            + str(self.end or "")
+        )
+
+    def parse(self, text: str) -> Iterable[ExpressionResult]:
+        offsets, labels, ranks = self._offsets, self._labels, self._ranks
+        concurrent = get_concurrent()
+
+        if self.start is not None:
+            self.start.compile()
+            positions: Iterable[int] = (
+                m.start()
+                for m in self.start._compiled_pattern.finditer(
+                    text, concurrent=concurrent
+                )
+            )
+        else:
+            positions = range(len(text))
+
+        end = None
+        if self.end is not None:
+            self.end.compile()
+            end = self.end._compiled_pattern.match
+
+        length = len(text)
+        next_position = 0
+        for start in positions:
+            if start < next_position:
+                continue
+
+            node = 0
+            best_rank = -1
+            best_end = start
+            index = start
+            while index < length:
+                low, high = offsets[node], offsets[node + 1]
+                if low == high:
+                    break
+                char = ord(text[index])
+                edge = bisect_left(labels, char, low, high)
+                if edge == high or labels[edge] != char:
+                    break
+                node = edge + 1
+                index += 1
+                rank = ranks[node]
+                if (
+                    rank >= 0
+                    and (best_rank < 0 or rank < best_rank)
+                    and (end is None or end(text, index) is not None)
+                ):
+                    best_rank = rank
+                    best_end = index
+
+            if best_rank >= 0:
+                next_position = best_end
+                yield ExpressionResult(start, best_end, text[start:best_end], self)
+
+    def __reduce__(self):
+        if self._path is not None:
+            return (self.__class__.load, (self._path, self.start, self.end))
+        return (self.__class__, (self.words, self.start, self.end))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TrieExpression):
+            return NotImplemented
+        return (
+            self.start == other.start
+            and self.end == other.end
+            and self._to_bytes() == other._to_bytes()
+        )
+
+    def __hash__(self):
+        return int(hashlib.md5(self._to_bytes()).hexdigest(), 16)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(nodes={len(self._ranks)}, "
+            f"start={self.start!r}, end={self.end!r})"
+        )
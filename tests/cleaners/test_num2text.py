@@ -1,6 +1,6 @@
 import pytest
 
-from maha.cleaners.functions import numbers_to_text
+from maha.cleaners.functions import numbers_to_text, numbers_to_text_many
 from maha.parsers.functions import parse_dimension
 from maha.parsers.utils import convert_to_number_if_possible
 
@@ -575,3 +575,22 @@ def test_numbers_in_text():
         numbers_to_text("كان عدد الكتب 150 كتاب ل3 أشخاص")
         == "كان عدد الكتب مائة وخمسون كتاب لثلاثة أشخاص"
     )
+
+
+def test_numbers_to_text_many():
+    texts = ["كان عدد الكتب 150 كتاب", "لا يوجد أرقام", "", "٣ و 3.5 و 150"]
+    for accusative in (False, True):
+        output = numbers_to_text_many(texts, accusative)
+        assert output == [numbers_to_text(text, accusative) for text in texts]
+    assert numbers_to_text_many(iter(["12"]), accusative=True) == ["إثني عشر"]
+    assert numbers_to_text_many([]) == []
+
+
+def test_numbers_to_text_with_long_number():
+    with pytest.warns(UserWarning):
+        assert numbers_to_text("العدد 12345678901234567") == "العدد 12345678901234567"
+
+
+def test_numbers_to_text_with_invalid_number():
+    with pytest.raises(ValueError):
+        numbers_to_text("-5")
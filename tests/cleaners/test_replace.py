@@ -3,13 +3,18 @@ import pytest
 from maha.cleaners.functions import (
     arabic_numbers_to_english,
     connect_single_letter_word,
+    keep,
+    normalize,
+    remove,
     replace,
     replace_except,
     replace_expression,
+    replace_fn,
     replace_pairs,
 )
 from maha.constants import (
     ARABIC_FOUR,
+    ARABIC_LETTERS,
     ARABIC_NUMBERS,
     ARABIC_ONE,
     ARABIC_TWO,
@@ -18,6 +23,7 @@ from maha.constants import (
     ENGLISH_NUMBERS,
     ENGLISH_SMALL_LETTERS,
 )
+from maha.rexy import get_strings_expression
 from tests.utils import list_not_in_string, list_only_in_string
 
 
@@ -72,6 +78,22 @@ def test_replace_pairs():
     assert processedtext == ARABIC_ONE + ARABIC_FOUR + ARABIC_TWO
 
 
+def test_replace_pairs_with_duplicate_keys():
+    assert replace_pairs("ab", ["a", "a", "b"], ["1", "2", "3"]) == "13"
+
+
+def test_replace_pairs_special_characters():
+    assert replace_pairs("(a)+.", ["(", ")", "+", "."], ["[", "]", "-", "!"]) == "[a]-!"
+
+
+def test_replace_reuses_expressions():
+    get_strings_expression.cache_clear()
+    replace("abc", ["ab", "c"], "x")
+    replace("bca", ["ab", "c"], "y")
+    assert get_strings_expression.cache_info().hits == 1
+    assert get_strings_expression.cache_info().misses == 1
+
+
 def test_replace_pairs_raises_valueerror():
     with pytest.raises(ValueError):
         replace_pairs("142", ["A", "B"], ["C"])
@@ -107,3 +129,87 @@ def test_replace_except(simple_text_input: str):
 def test_replace_except_with_list(simple_text_input: str):
     processedtext = replace_except(simple_text_input, list("Mma"), EMPTY)
     assert list_only_in_string(list("Mma"), processedtext)
+
+
+MATRIX_TEXTS = [
+    "",
+    " 1. بِسْمِ،اللَّهِ الرَّحْمَٰنِ الرَّحِيمِ In the name of Allah,Most Gracious. ",
+    "سطر أول\nسطر ثان\n\n  سطر\tثالث ــ ﷺ ﻻ  ",
+    "a-b]c^d\\e.f$g(h)|i [j] \r\n k",
+    "\nأ\nإ ى ؤ ة\n",
+]
+
+
+def _apply_with_and_without_fast_path(monkeypatch, function, *args, **kwargs):
+    """Applies the function to the matrix texts using the fast path of single
+    characters and using the expressions"""
+    fast = [function(text, *args, **kwargs) for text in MATRIX_TEXTS]
+    with monkeypatch.context() as m:
+        m.setattr(replace_fn, "_are_characters", lambda strings: False)
+        replace_fn._get_characters_expression.cache_clear()
+        slow = [function(text, *args, **kwargs) for text in MATRIX_TEXTS]
+    replace_fn._get_characters_expression.cache_clear()
+    return fast, slow
+
+
+@pytest.mark.parametrize(
+    "strings",
+    [["a"], ["-", "]", "^", "\\", "$"], ARABIC_NUMBERS, ["\n"], [" ", "\t", "\r"]],
+)
+@pytest.mark.parametrize("with_value", [EMPTY, " ", "xy", "\\1"])
+def test_replace_fast_path_matches_expression(monkeypatch, strings, with_value):
+    if with_value == "\\1":
+        # The value is a template of the expression
+        strings = ["(" + "|".join(strings) + ")"]
+    fast, slow = _apply_with_and_without_fast_path(
+        monkeypatch, replace, strings, with_value
+    )
+    assert fast == slow
+
+
+@pytest.mark.parametrize(
+    "strings",
+    [["a"], ["-", "]", "^", "\\", "$"], ARABIC_LETTERS + [" "], ["\n"], ["ab", "c"]],
+)
+@pytest.mark.parametrize("with_value", [EMPTY, " ", "xy", "\\"])
+def test_replace_except_fast_path_matches_expression(monkeypatch, strings, with_value):
+    fast, slow = _apply_with_and_without_fast_path(
+        monkeypatch, replace_except, strings, with_value
+    )
+    assert fast == slow
+
+
+@pytest.mark.parametrize(
+    "keys, values",
+    [
+        (ARABIC_NUMBERS, ENGLISH_NUMBERS),
+        (["ﷺ", "ﻻ", "ﷺ"], ["صلى الله عليه وسلم", "لا", "x"]),
+        (["\\", "$", "\n"], ["\\1", "", " "]),
+    ],
+)
+def test_replace_pairs_fast_path_matches_expression(monkeypatch, keys, values):
+    fast, slow = _apply_with_and_without_fast_path(
+        monkeypatch, replace_pairs, keys, values
+    )
+    assert fast == slow
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (keep, dict(arabic=True)),
+        (keep, dict(arabic_letters=True)),
+        (keep, dict(arabic_letters=True, harakat=True, use_space=False)),
+        (keep, dict(english=True, custom_strings=["\n", "ـ"])),
+        (keep, dict(arabic_letters=True, custom_strings="سطر")),
+        (remove, dict(harakat=True)),
+        (remove, dict(all_harakat=True, punctuations=True, tatweel=True)),
+        (remove, dict(english=True, use_space=False)),
+        (remove, dict(arabic_ligatures=True, custom_strings=["سطر", "-"])),
+        (normalize, dict(all=True)),
+        (normalize, dict(alef=True, yeh=True, ligatures=True)),
+    ],
+)
+def test_cleaners_fast_path_matches_expression(monkeypatch, function, kwargs):
+    fast, slow = _apply_with_and_without_fast_path(monkeypatch, function, **kwargs)
+    assert fast == slow
@@ -0,0 +1,98 @@
+import random
+import re
+import time
+
+import pytest
+
+from maha.cleaners import utils
+from maha.cleaners.utils import find_repeated_substrings, has_repeated_substring
+
+TEXTS = [
+    "",
+    "ههههههه",
+    "Hi hihihi",
+    "هلا والله هلا والله هلا والله",
+    "abcdefghijklabcdefghijklabcdefghijklabcdefghijkl",
+    "aaaaaaaaaaaaab" * 4,
+    "xyzxyzxyzxyzxyzxyzxyzxyzxyzxyzx\nyyy\n\nabababab",
+    "abaababaabaababaabababaabaababaabaab",
+    "0110100110010110100101100110100110010110",
+]
+
+
+def regex_matches(text: str, min_repeated: int):
+    pattern = re.compile(r"(.+?)\1{%d,}" % (min_repeated - 1), re.MULTILINE)
+    return [(m.start(), m.end(), len(m.group(1))) for m in pattern.finditer(text)]
+
+
+@pytest.mark.parametrize("min_repeated", [1, 2, 3, 4])
+@pytest.mark.parametrize("text", TEXTS)
+def test_find_repeated_substrings(text: str, min_repeated: int):
+    expected = regex_matches(text, min_repeated)
+    assert list(find_repeated_substrings(text, min_repeated)) == expected
+    assert has_repeated_substring(text, min_repeated) is bool(expected)
+
+
+def test_find_repeated_substrings_long_units():
+    unit = "يا هلا ومرحبا "
+    text = "قال:" + unit * 3 + "بكم"
+    assert list(find_repeated_substrings(text)) == [(4, 4 + len(unit) * 3, len(unit))]
+    assert not has_repeated_substring(text, 4)
+
+
+@pytest.mark.parametrize("periodic_scan_length", [0, utils.PERIODIC_SCAN_LENGTH])
+@pytest.mark.parametrize("min_repeated", [1, 2, 3, 4])
+def test_find_repeated_substrings_random_long_units(
+    monkeypatch, min_repeated: int, periodic_scan_length: int
+):
+    monkeypatch.setattr(utils, "PERIODIC_SCAN_LENGTH", periodic_scan_length)
+    generator = random.Random(min_repeated)
+    for _ in range(500):
+        unit = "".join(generator.choices("ab", k=generator.randint(9, 14)))
+        text = "".join(generator.choices("ab", k=generator.randint(0, 30)))
+        text += unit * generator.randint(1, 4)
+        text += "".join(generator.choices("ab", k=generator.randint(0, 30)))
+        expected = regex_matches(text, min_repeated)
+        assert list(find_repeated_substrings(text, min_repeated)) == expected
+        assert has_repeated_substring(text, min_repeated) is bool(expected)
+
+
+ARABIC_LETTERS = "ابتثجحخدذرزسشصضطظعغفقكلمنهوي"
+
+
+def near_periodic_line(length: int) -> str:
+    generator = random.Random(0)
+    unit = "".join(generator.choices(ARABIC_LETTERS, k=12))
+    units: list[str] = []
+    while len(units) * len(unit) < length:
+        units += [unit, unit]
+        index = generator.randrange(len(unit))
+        unit = unit[:index] + generator.choice(ARABIC_LETTERS) + unit[index + 1 :]
+    return "".join(units)[:length]
+
+
+def no_repeats_line(length: int) -> str:
+    return "".join(map(chr, range(0x4E00, 0x4E00 + length)))
+
+
+def search_time(text: str) -> float:
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        list(find_repeated_substrings(text))
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("make_line", [near_periodic_line, no_repeats_line])
+def test_find_repeated_substrings_scaling(make_line):
+    short, long = make_line(2_000), make_line(64_000)
+    # A quadratic search is about 1000 times slower on a line 32 times longer
+    assert search_time(long) < 128 * search_time(short) + 0.01
+
+
+def test_find_repeated_substrings_raise_value_error():
+    with pytest.raises(ValueError):
+        list(find_repeated_substrings("", min_repeated=0))
+    with pytest.raises(ValueError):
+        has_repeated_substring("", min_repeated=1.5)  # type: ignore
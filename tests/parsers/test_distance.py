@@ -3,12 +3,14 @@ from __future__ import annotations
 import random
 from itertools import chain
 
+import numpy as np
 import pytest
 
-from maha.parsers.functions import parse_dimension
+from maha.parsers.functions import parse_dimension, parse_dimension_many
 from maha.parsers.rules.distance import *
 from maha.parsers.rules.distance.template import DistanceValue, ValueUnit
-from maha.parsers.templates import Dimension, DistanceUnit
+from maha.parsers.rules.distance.utils import convert_between_distances
+from maha.parsers.templates import Dimension, DistanceUnit, DurationUnit
 
 M = DistanceUnit.METERS
 KM = DistanceUnit.KILOMETERS
@@ -262,3 +264,56 @@ def test_multiple_units():
 def test_negative_simple_values(input: str):
     output = parse_dimension(input, distance=True)
     assert output == []
+
+
+NORMALIZE_INPUTS = [
+    "3 كيلومتر و 20 سم",
+    "مترين وعشرين سم",
+    "100 ميل او 100 قدم",
+    "لا شيء",
+    "نصف متر",
+]
+
+
+@pytest.mark.parametrize("to_unit", [M, KM, FT])
+def test_normalize_distances(to_unit: DistanceUnit):
+    output = list(chain(*parse_dimension_many(NORMALIZE_INPUTS, distance=True)))
+    expected = [
+        convert_between_distances(d.value.valueunit, to_unit=to_unit).value
+        for d in output
+    ]
+    assert normalize_distances(output, to_unit).tolist() == pytest.approx(expected)
+
+
+def test_normalize_distances_with_values():
+    values = [DistanceValue(ValueUnit(2, KM)), ValueUnit(30, CM)]
+    assert normalize_distances(values).tolist() == pytest.approx([2000, 0.3])
+    assert normalize_distances([]).tolist() == []
+
+
+@pytest.mark.parametrize(
+    "how, expected",
+    [
+        ("sum", [3000.2, 2.2, 160964.48, 0, 0.5]),
+        ("min", [0.2, 0.2, 30.48, np.nan, 0.5]),
+        ("max", [3000, 2, 160934, np.nan, 0.5]),
+    ],
+)
+def test_aggregate_distances(how: str, expected: list[float]):
+    documents = parse_dimension_many(NORMALIZE_INPUTS, distance=True, duration=True)
+    output = aggregate_distances(documents, how)
+    assert output.tolist() == pytest.approx(expected, nan_ok=True)
+
+
+def test_aggregate_distances_without_documents():
+    assert aggregate_distances([]).tolist() == []
+
+
+def test_aggregate_distances_with_invalid_aggregation():
+    with pytest.raises(ValueError):
+        aggregate_distances([[ValueUnit(1, M)]], "mean")
+
+
+def test_normalize_distances_with_invalid_value():
+    with pytest.raises(ValueError):
+        normalize_distances([ValueUnit(1, DurationUnit.SECONDS)])
@@ -3,12 +3,14 @@ from __future__ import annotations
 import random
 from itertools import chain
 
+import numpy as np
 import pytest
 
-from maha.parsers.functions import parse_dimension
+from maha.parsers.functions import parse_dimension, parse_dimension_many
 from maha.parsers.rules.duration import *
 from maha.parsers.rules.duration.template import DurationUnit, DurationValue, ValueUnit
-from maha.parsers.templates import Dimension
+from maha.parsers.rules.duration.utils import convert_between_durations
+from maha.parsers.templates import Dimension, DistanceUnit
 
 S = DurationUnit.SECONDS
 MIN = DurationUnit.MINUTES
@@ -448,3 +450,51 @@ def test_parse_combination(
 ):
     output = parse_dimension(input, duration=True)
     assert_combined_expression_one_output(output, expected, units)
+
+
+NORMALIZE_INPUTS = [
+    "ساعتين و 30 دقيقة",
+    "يومين او 3 اسابيع",
+    "لا شيء",
+    "3 سنين ، 3 شهور ،4 أيام وساعتين",
+]
+
+
+@pytest.mark.parametrize("to_unit", [S, MIN, D, Y])
+def test_normalize_durations(to_unit: DurationUnit):
+    output = list(chain(*parse_dimension_many(NORMALIZE_INPUTS, duration=True)))
+    expected = [
+        convert_between_durations(*d.value.values, to_unit=to_unit).value
+        for d in output
+    ]
+    assert normalize_durations(output, to_unit).tolist() == pytest.approx(expected)
+
+
+def test_normalize_durations_with_values():
+    values = [DurationValue([ValueUnit(2, H), ValueUnit(30, MIN)]), ValueUnit(3, S)]
+    assert normalize_durations(values).tolist() == [9000, 3]
+    assert normalize_durations([]).tolist() == []
+
+
+@pytest.mark.parametrize(
+    "how, expected",
+    [
+        ("sum", [9000, 2 * 86400 + 3 * 604800, 0, 102736800]),
+        ("min", [9000, 2 * 86400, np.nan, 102736800]),
+        ("max", [9000, 3 * 604800, np.nan, 102736800]),
+    ],
+)
+def test_aggregate_durations(how: str, expected: list[float]):
+    documents = parse_dimension_many(NORMALIZE_INPUTS, distance=True, duration=True)
+    output = aggregate_durations(documents, how)
+    assert output.tolist() == pytest.approx(expected, nan_ok=True)
+
+
+def test_aggregate_durations_with_invalid_aggregation():
+    with pytest.raises(ValueError):
+        aggregate_durations([[ValueUnit(1, S)]], "median")
+
+
+def test_normalize_durations_with_invalid_value():
+    with pytest.raises(ValueError):
+        normalize_durations([DurationValue([ValueUnit(1, DistanceUnit.METERS)])])
@@ -1,4 +1,11 @@
+import pickle
+
+import pytest
+
 from maha.parsers.functions import parse_dimension
+from maha.parsers.rules import RULE_NAME
+from maha.parsers.rules.common import EXPRESSION_END, EXPRESSION_START
+from maha.rexy import Expression, TrieExpression, capture_group
 
 BOYS = [
     "محمد",
@@ -61,3 +68,60 @@ def test_names_of_girls():
     output = parse_dimension(" ".join(GIRLS), names=True)
     assert len(output) == 25
     assert output[-1].value == "جوليا"
+
+
+def test_names_with_prefix():
+    output = parse_dimension("لمحمد وأحمد", names=True)
+    assert [d.value for d in output] == ["محمد", "أحمد"]
+    assert output[0].start == 1
+
+
+WORDS = ["آد", "آدم", "عبد", "عبد الله", "الله", "سارة"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "آدم وآد",
+        "عبد الله عبد",
+        "عبد اللهي",
+        "لسارة،آدم\nعبد\nالله",
+        "آدمي سارةآد",
+        "",
+    ],
+)
+def test_trie_expression_same_as_regex(text):
+    trie = TrieExpression(WORDS, EXPRESSION_START, EXPRESSION_END)
+    regex = Expression(EXPRESSION_START + capture_group(*WORDS) + EXPRESSION_END)
+    expected = [(r.start, r.end, r.value) for r in regex(text)]
+    assert [(r.start, r.end, r.value) for r in trie(text)] == expected
+
+
+def test_trie_expression_save_load(tmp_path):
+    trie = TrieExpression(WORDS, EXPRESSION_START, EXPRESSION_END)
+    trie.save(tmp_path / "words.trie")
+    loaded = TrieExpression.load(tmp_path / "words.trie", EXPRESSION_START)
+    assert loaded.words == WORDS
+    assert [r.value for r in loaded("عبد الله")] == ["عبد", "الله"]
+
+
+def test_trie_expression_invalid_file(tmp_path):
+    path = tmp_path / "invalid.trie"
+    path.write_bytes(b"invalid")
+    with pytest.raises(ValueError):
+        TrieExpression.load(path)
+
+
+def test_trie_expression_empty_word():
+    with pytest.raises(ValueError):
+        TrieExpression(["", "محمد"])
+
+
+def test_trie_expression_regex_methods():
+    trie = TrieExpression(WORDS, end=r"\b")
+    assert trie.search("قال سارة").group(0) == "سارة"
+    assert trie.sub("X", "سارة و آدم") == "X و X"
+
+
+def test_rule_name_pickle():
+    assert pickle.loads(pickle.dumps(RULE_NAME)) == RULE_NAME
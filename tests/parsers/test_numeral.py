@@ -12,6 +12,12 @@ from maha.parsers.templates import Dimension, DimensionType
 random.seed(0)
 
 
+@pytest.fixture(params=["regex", "fsm"])
+def engine(request):
+    """Both engines should extract the same values"""
+    return request.param
+
+
 def assert_expression_output(output: list[Dimension], expected):
     assert len(output) == 1
     assert isinstance(output[0], Dimension)
@@ -73,8 +79,10 @@ def get_value_with_integer(ar_int: str, en_int: str, values: list[str]):
         get_value_with_integer("٩", "9", ["تسعة", "تسعه", "تسع"]),
     ),
 )
-def test_ones(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_ones(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -149,8 +157,10 @@ def test_ones(input, expected):
         ),
     ),
 )
-def test_tens(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_tens(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -167,8 +177,10 @@ def test_tens(input, expected):
         get_value_with_integer("٩٠", "90", ["تسعين", "تسعون"]),
     ),
 )
-def test_perfect_tens(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_perfect_tens(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -207,8 +219,10 @@ def test_perfect_tens(input, expected):
         get_value_with_integer("٢٢", "22", ["إثنتين و عشرون"]),
     ),
 )
-def test_combines_tens(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_combines_tens(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -255,8 +269,10 @@ def test_combines_tens(input, expected):
         ),
     ),
 )
-def test_perfect_hundreds(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_perfect_hundreds(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -274,8 +290,10 @@ def test_perfect_hundreds(input, expected):
         get_value_with_integer("٩٩٩", "999", ["تسع مية وتسعه وتسعين"]),
     ),
 )
-def test_hundreds(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_hundreds(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -292,8 +310,10 @@ def test_hundreds(input, expected):
         get_value_with_integer("٩٠٠٠", "9000", ["تسع آلاف", "تسعة الاف"]),
     ),
 )
-def test_perfect_thousands(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_perfect_thousands(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -315,8 +335,10 @@ def test_perfect_thousands(input, expected):
         get_value_with_integer("١٧١٠٠", "17100", ["سبعطعشر الف ومية"]),
     ),
 )
-def test_thousands(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_thousands(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -339,8 +361,10 @@ def test_thousands(input, expected):
         ("200%", 2),
     ],
 )
-def test_numbers(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_numbers(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -362,8 +386,10 @@ def test_numbers(input, expected):
         (2070, "الفين وعشرين ونص مية"),
     ],
 )
-def test_fasila_numbers(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_fasila_numbers(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -380,8 +406,10 @@ def test_fasila_numbers(input, expected):
         get_value_with_integer("٩٠٠٠٠٠٠", "9000000", ["تسع ملايين", "تسعة ملايين"]),
     ),
 )
-def test_perfect_millions(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_perfect_millions(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -409,8 +437,10 @@ def test_perfect_millions(input, expected):
         get_value_with_integer("١٧٠٠٠١٠٠", "17000100", ["سبعطعشر مليون ومية"]),
     ),
 )
-def test_millions(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_millions(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -423,8 +453,10 @@ def test_millions(input, expected):
         (2991, "واحد وتسعين وتسعمية والفين"),
     ],
 )
-def test_combinations(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_combinations(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -440,8 +472,10 @@ def test_combinations(input, expected):
         (3_300_000, "ثلاثة وثلاثين مئة الف"),
     ],
 )
-def test_hierarchical_parsing(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_hierarchical_parsing(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -456,8 +490,10 @@ def test_hierarchical_parsing(input, expected):
         (0.33, "ثلاثة وثلاثين بالمية"),
     ],
 )
-def test_multiplier_fraction_parsing(input, expected):
-    assert_expression_output(parse_dimension(input, numeral=True), expected)
+def test_multiplier_fraction_parsing(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, numeral=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -473,6 +509,6 @@ def test_multiplier_fraction_parsing(input, expected):
         ("وواثنين"),
     ],
 )
-def test_negative_simple_values(input: str):
-    output = parse_dimension(input, numeral=True)
+def test_negative_simple_values(input: str, engine):
+    output = parse_dimension(input, numeral=True, engine=engine)
     assert output == []
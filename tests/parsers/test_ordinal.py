@@ -12,6 +12,12 @@ from maha.parsers.templates import Dimension, DimensionType
 random.seed(0)
 
 
+@pytest.fixture(params=["regex", "fsm"])
+def engine(request):
+    """Both engines should extract the same values"""
+    return request.param
+
+
 def assert_expression_output(output: list[Dimension], expected):
     assert len(output) == 1
     assert isinstance(output[0], Dimension)
@@ -66,8 +72,10 @@ def get_value(exprected: int | list[int], values: list[str]):
         get_value(9, ["التاسع", "التاسعه", "تاسعة", "تاسع"]),
     ),
 )
-def test_ones(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_ones(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -95,8 +103,10 @@ def test_ones(input, expected):
         get_value(19, ["التاسع  عشر", "تاسع عشرة", "التاسعة عشره"]),
     ),
 )
-def test_tens(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_tens(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -113,8 +123,10 @@ def test_tens(input, expected):
         get_value(90, ["التسعين", "التسعون"]),
     ),
 )
-def test_perfect_tens(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_perfect_tens(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -149,8 +161,10 @@ def test_perfect_tens(input, expected):
         get_value(22, ["التانية و العشرون"]),
     ),
 )
-def test_combines_tens(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_combines_tens(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -188,8 +202,10 @@ def test_combines_tens(input, expected):
         ),
     ),
 )
-def test_perfect_hundreds(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_perfect_hundreds(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -207,8 +223,10 @@ def test_perfect_hundreds(input, expected):
         get_value(999, ["التسع مية والتاسع والتسعين"]),
     ),
 )
-def test_hundreds(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_hundreds(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -222,8 +240,10 @@ def test_hundreds(input, expected):
         get_value(1_000_001, ["الأول بعد المليون"]),
     ),
 )
-def test_after_value(input, expected):
-    assert_expression_output(parse_dimension(input, ordinal=True), expected)
+def test_after_value(input, expected, engine):
+    assert_expression_output(
+        parse_dimension(input, ordinal=True, engine=engine), expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -240,9 +260,9 @@ def test_after_value(input, expected):
         get_value([1000000000, 20], ["البليون والعشرين", "المليار والعشرون"]),
     ),
 )
-def test_perfect_millions(input, expected):
+def test_perfect_millions(input, expected, engine):
     assert_combined_expression_one_output(
-        parse_dimension(input, ordinal=True), expected
+        parse_dimension(input, ordinal=True, engine=engine), expected
     )
 
 
@@ -255,9 +275,9 @@ def test_perfect_millions(input, expected):
         ([1, 2, 3], "الأول والثاني والثالث"),
     ],
 )
-def test_combinations(input, expected):
+def test_combinations(input, expected, engine):
     assert_combined_expression_one_output(
-        parse_dimension(input, ordinal=True), expected
+        parse_dimension(input, ordinal=True, engine=engine), expected
     )
 
 
@@ -274,6 +294,6 @@ def test_combinations(input, expected):
         ("وواثنين"),
     ],
 )
-def test_negative_simple_values(input: str):
-    output = parse_dimension(input, ordinal=True)
+def test_negative_simple_values(input: str, engine):
+    output = parse_dimension(input, ordinal=True, engine=engine)
     assert output == []
@@ -1,8 +1,19 @@
 import itertools as it
-from pprint import pprint
+
+import pytest
 
 from maha.parsers.functions import parse_dimension
-from maha.parsers.templates.enums import DurationUnit
+from maha.parsers.rules import (
+    RULE_DISTANCE,
+    RULE_DURATION,
+    RULE_NAME,
+    RULE_NUMERAL,
+    RULE_ORDINAL,
+    RULE_TIME,
+)
+from maha.parsers.templates.enums import DimensionType, DurationUnit
+from maha.rexy import Expression, ExpressionScanner
+from maha.rexy.templates.expression_scanner import get_prefix_pattern
 
 
 def test_parse_numeral_wiki_arlang(wiki_arlang):
@@ -32,3 +43,104 @@ def test_parse_duration_wiki_arnumbers(wiki_arnumbers):
         assert len(d.value) == 1
         assert d.value[0].unit == DurationUnit.HOURS
         assert d.value[0].value == e
+
+
+def _spans(results):
+    return [(r.start, r.end, r.value) for r in results]
+
+
+def test_scanner_same_as_parse(wiki_arlang, wiki_arnumbers, multiple_tweets):
+    rules = [RULE_DURATION, RULE_DISTANCE, RULE_NUMERAL, RULE_ORDINAL, RULE_TIME]
+    scanner = ExpressionScanner(*rules, RULE_NAME)
+    for text in (wiki_arlang + wiki_arnumbers + multiple_tweets).split("\n"):
+        output = scanner.scan(text)
+        for rule, results in zip(rules + [RULE_NAME], output):
+            assert _spans(results) == _spans(rule(text))
+
+
+def test_parse_multiple_dimensions(wiki_arnumbers):
+    output = parse_dimension(wiki_arnumbers, duration=True, numeral=True, time=True)
+    expected = (
+        parse_dimension(wiki_arnumbers, duration=True)
+        + parse_dimension(wiki_arnumbers, numeral=True)
+        + parse_dimension(wiki_arnumbers, time=True)
+    )
+    assert [(d.start, d.end, d.dimension_type) for d in output] == [
+        (d.start, d.end, d.dimension_type) for d in expected
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern, text",
+    [
+        (r"(?<=\b)(?:ab|cd)+(?=\b)", "ab abcd cdx xab"),
+        (r"\d{2,}(?:\.\d+)?", "1 12 123.5 .5"),
+        (r"(?P<a>x)|(?P<a>y)z", "xyzxyy"),
+        (r"[^a]b", "ab cb\nb"),
+        (r".b", "\nbab"),
+    ],
+)
+def test_scanner_patterns(pattern, text):
+    expression = Expression(pattern)
+    assert get_prefix_pattern(pattern) is not None
+    assert _spans(ExpressionScanner(expression).scan(text)[0]) == _spans(
+        expression(text)
+    )
+
+
+@pytest.mark.parametrize("pattern", [r"a*", r"(?i)a", r"(a)\1", r"\p{L}+", r"(?=a)"])
+def test_prefix_pattern_unsupported(pattern):
+    assert get_prefix_pattern(pattern) is None
+    expression = Expression(pattern)
+    text = "aA aa"
+    assert _spans(ExpressionScanner(expression).scan(text)[0]) == _spans(
+        expression(text)
+    )
+
+
+@pytest.mark.parametrize("overlap", ["first", "longest", "priority"])
+def test_parse_dimension_overlap(overlap):
+    text = "سافرت لمدة ثلاثة أيام و عشرين دقيقة في اليوم الثالث"
+    output = parse_dimension(
+        text, numeral=True, duration=True, ordinal=True, overlap=overlap
+    )
+    assert [(d.body, d.dimension_type) for d in output] == [
+        ("ثلاثة أيام و عشرين دقيقة", DimensionType.DURATION),
+        ("الثالث", DimensionType.ORDINAL),
+    ]
+
+
+@pytest.mark.parametrize(
+    "overlap, expected",
+    [
+        (None, ["DURATION", "NUMERAL", "TIME"]),
+        ("first", ["DURATION", "TIME"]),
+        ("longest", ["TIME"]),
+        ("priority", ["TIME"]),
+    ],
+)
+def test_parse_dimension_overlap_policies(overlap, expected):
+    output = parse_dimension(
+        "بعد ثلاثة أيام", numeral=True, duration=True, time=True, overlap=overlap
+    )
+    assert [d.dimension_type.name for d in output] == expected
+
+
+def test_parse_dimension_invalid_overlap():
+    with pytest.raises(ValueError):
+        parse_dimension("ثلاثة", numeral=True, overlap="shortest")
+
+
+def test_parse_dimension_fsm_engine():
+    text = "بعد ثلاثة أيام و عشرين دقيقة في اليوم الحادي عشر، فاز الف ومئتين وخمسين"
+    arguments = dict(numeral=True, ordinal=True, duration=True, time=True)
+    output = parse_dimension(text, engine="fsm", **arguments)
+    expected = parse_dimension(text, **arguments)
+    assert [(d.body, d.value, d.start, d.end, d.dimension_type) for d in output] == [
+        (d.body, d.value, d.start, d.end, d.dimension_type) for d in expected
+    ]
+
+
+def test_parse_dimension_invalid_engine():
+    with pytest.raises(ValueError):
+        parse_dimension("ثلاثة", numeral=True, engine="dfa")
@@ -0,0 +1,99 @@
+import pytest
+
+from maha.parsers.functions import (
+    parse,
+    parse_dimension,
+    parse_dimension_many,
+    parse_many,
+)
+from maha.rexy import Expression
+
+
+def _values(dimensions):
+    return [(d.start, d.end, d.value, d.dimension_type) for d in dimensions]
+
+
+@pytest.fixture()
+def lines(wiki_arnumbers: str, multiple_tweets: str):
+    return (wiki_arnumbers + "\n" + multiple_tweets).split("\n")
+
+
+@pytest.mark.parametrize("workers", [None, 1, 2])
+def test_parse_dimension_many(lines, workers):
+    output = parse_dimension_many(
+        iter(lines), numeral=True, duration=True, workers=workers, chunksize=3
+    )
+    expected = [parse_dimension(line, numeral=True, duration=True) for line in lines]
+    output = list(output)
+    assert len(output) == len(lines)
+    for dimensions, expected_dimensions in zip(output, expected):
+        assert _values(dimensions) == _values(expected_dimensions)
+        for d, e in zip(dimensions, expected_dimensions):
+            assert d.expression is e.expression
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_parse_dimension_many_overlap(lines, workers):
+    output = parse_dimension_many(
+        lines, numeral=True, duration=True, overlap="longest", workers=workers
+    )
+    expected = [
+        parse_dimension(line, numeral=True, duration=True, overlap="longest")
+        for line in lines
+    ]
+    assert [_values(d) for d in output] == [_values(d) for d in expected]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_parse_dimension_many_fsm_engine(lines, workers):
+    output = parse_dimension_many(
+        lines, numeral=True, ordinal=True, engine="fsm", workers=workers
+    )
+    expected = [parse_dimension(line, numeral=True, ordinal=True) for line in lines]
+    assert [_values(d) for d in output] == [_values(d) for d in expected]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_parse_many(lines, workers):
+    output = list(parse_many(lines, arabic=True, emojis=True, workers=workers))
+    expected = [parse(line, arabic=True, emojis=True) for line in lines]
+    assert [_values(d) for d in output] == [_values(d) for d in expected]
+
+
+def test_parse_many_custom_expressions():
+    expression = Expression("([0-9]+)")
+    output = list(parse_many(["12 ab 3", "", "x"], custom_expressions=expression))
+    assert [[d.value for d in dims] for dims in output] == [["12", "3"], [], []]
+
+
+def test_parse_many_with_index(lines):
+    output = list(parse_many(lines, english=True, with_index=True, workers=2))
+    assert [index for index, _ in output] == list(range(len(lines)))
+
+
+def test_parse_dimension_many_no_arguments():
+    with pytest.raises(ValueError):
+        parse_dimension_many(["ثلاثة"])
+
+
+def test_parse_dimension_many_invalid_overlap():
+    with pytest.raises(ValueError):
+        parse_dimension_many(["ثلاثة"], numeral=True, overlap="shortest")
+
+
+def test_parse_dimension_many_invalid_engine():
+    with pytest.raises(ValueError):
+        parse_dimension_many(["ثلاثة"], numeral=True, engine="dfa")
+
+
+def test_parse_many_no_arguments():
+    with pytest.raises(ValueError):
+        parse_many(["a"])
+
+
+@pytest.mark.parametrize("workers, chunksize", [(0, 1), (2, 0), (1.5, 10)])
+def test_parse_dimension_many_invalid_workers(workers, chunksize):
+    with pytest.raises(ValueError):
+        parse_dimension_many(
+            ["ثلاثة"], numeral=True, workers=workers, chunksize=chunksize
+        )
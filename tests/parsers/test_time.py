@@ -1,11 +1,17 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 from dateutil.relativedelta import MO, SA, TU
 from hijri_converter import Gregorian, Hijri
 
 from maha.parsers.functions import parse_dimension
-from maha.parsers.rules.time import constants
+from maha.parsers.rules.time import (
+    HIJRI_CALENDAR,
+    HijriCalendar,
+    constants,
+    resolve_times,
+)
 from maha.parsers.rules.time.template import TimeInterval, TimeValue
 
 DATE = datetime(2021, 9, 1)
@@ -1106,3 +1112,171 @@ def test_predefined_time_intervals(start_time, end_time, input):
 def test_negative_cases(input):
     output = parse_dimension(input, time=True)
     assert output == []
+
+
+@pytest.mark.parametrize(
+    "value",
+    [TimeValue(weeks=1), TimeValue(next_month=3), TimeValue(hijri=True, days=40)],
+)
+def test_time_value_add_does_not_change_value(value):
+    before = repr(value)
+    assert NOW + value == value + NOW
+    assert repr(value) == before
+
+
+def test_time_value_iadd_merges_in_place():
+    value = TimeValue(days=1, hour=3)
+    output = value
+    output += TimeValue(days=2, minute=5, am_pm="PM")
+    assert output is value
+    assert value == TimeValue(days=3, hour=15, minute=5, am_pm="PM")
+
+
+def test_time_value_add_returns_new_value():
+    value = TimeValue(days=1)
+    output = value + TimeValue(days=2)
+    assert output == TimeValue(days=3)
+    assert value == TimeValue(days=1)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        TimeValue(months=30, hours=30),
+        TimeValue(weeks=-1),
+        TimeValue(next_month=3, day=1),
+        TimeValue(hijri=True, month=9),
+        TimeValue(weekday=MO(-1), hour=9, am_pm="PM"),
+    ],
+)
+def test_time_value_to_relativedelta(value):
+    assert NOW + value.to_relativedelta(NOW) == NOW + value
+
+
+RESOLVE_INPUTS = [
+    "غدا",
+    "الاسبوع الجاي",
+    "الاسبوع الماضي",
+    "الساعة 3 العصر",
+    "بعد يومين",
+    "يوم الخميس",
+    "الخميس الماضي",
+    "3 اكتوبر 2021",
+    "الشهر الماضي",
+    "شهر رمضان",
+    "اول يوم من رمضان",
+    "من الساعة 9 الى 11 صباحا",
+    "من 13 الشهر الجاي",
+    "الى الساعة 4 وربع العصر",
+]
+REFERENCE_TIMES = [
+    datetime(2021, 9, 1, 10, 38, 4),
+    datetime(2020, 2, 29, 23, 59, 59),
+    datetime(2022, 1, 31, 0, 0, 1, 5),
+    datetime(1999, 12, 31, 12),
+]
+
+
+def _resolve(value, reference):
+    if value is None:
+        return None
+    return reference + value
+
+
+@pytest.mark.parametrize("input", RESOLVE_INPUTS)
+def test_resolve_times(input):
+    dimension = parse_dimension(input, time=True)[0]
+    starts, ends = resolve_times([dimension] * 4, REFERENCE_TIMES)
+
+    value = dimension.value
+    start, end = (
+        (value, value) if isinstance(value, TimeValue) else (value.start, value.end)
+    )
+    assert [s.item() for s in starts] == [_resolve(start, r) for r in REFERENCE_TIMES]
+    assert [e.item() for e in ends] == [_resolve(end, r) for r in REFERENCE_TIMES]
+
+
+def test_resolve_times_with_one_reference_time():
+    values = [TimeValue(days=1), TimeInterval(end=TimeValue(hour=3, weeks=1))]
+    starts, ends = resolve_times(values, np.datetime64(DATE))
+
+    assert starts.dtype == ends.dtype == np.dtype("datetime64[us]")
+    assert starts.tolist() == [datetime(2021, 9, 2), None]
+    assert ends.tolist() == [datetime(2021, 9, 2), datetime(2021, 9, 5, 3)]
+
+
+def test_resolve_times_empty():
+    starts, ends = resolve_times([], [])
+    assert starts.shape == ends.shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "values, reference_times",
+    [
+        ([TimeValue(days=1)], [DATE, DATE]),
+        ([TimeValue(days=1)], [np.datetime64("NaT")]),
+        ([1], DATE),
+        (parse_dimension("ثلاثة", numeral=True), DATE),
+        ([TimeValue(year=9999, years=1)], DATE),
+    ],
+)
+def test_resolve_times_invalid_input(values, reference_times):
+    with pytest.raises(ValueError):
+        resolve_times(values, reference_times)
+
+
+def test_hijri_calendar_matches_hijri_converter():
+    day = datetime(1924, 8, 1).date()
+    while day <= datetime(2077, 11, 16).date():
+        hijri = Gregorian.fromdate(day).to_hijri()
+        assert HIJRI_CALENDAR.to_hijri(day) == hijri.datetuple()
+        assert HIJRI_CALENDAR.to_gregorian(*hijri.datetuple()) == day
+        assert HIJRI_CALENDAR.month_length(hijri.year, hijri.month) == (
+            hijri.month_length()
+        )
+        day += timedelta(days=1)
+
+
+@pytest.mark.parametrize("day", [datetime(1924, 7, 31), datetime(2077, 11, 17)])
+def test_hijri_calendar_out_of_range(day):
+    with pytest.raises(OverflowError):
+        HIJRI_CALENDAR.to_hijri(day)
+
+
+@pytest.mark.parametrize(
+    "date, error",
+    [
+        ((1342, 12, 1), OverflowError),
+        ((1501, 1, 1), OverflowError),
+        ((1443, 13, 1), ValueError),
+        ((1443, 1, 0), ValueError),
+        ((1443, 2, 30), ValueError),
+    ],
+)
+def test_hijri_calendar_invalid_date(date, error):
+    with pytest.raises(error):
+        HIJRI_CALENDAR.to_gregorian(*date)
+
+
+def test_hijri_calendar_month_lengths():
+    assert HIJRI_CALENDAR.month_lengths(1443) == [
+        Hijri(1443, month, 1).month_length() for month in range(1, 13)
+    ]
+
+
+def test_hijri_calendar_save_and_load(tmp_path):
+    path = tmp_path / "calendar.npz"
+    HIJRI_CALENDAR.save(path)
+    calendar = HijriCalendar.load(path)
+
+    assert calendar.first_year == HIJRI_CALENDAR.first_year
+    assert calendar.last_year == HIJRI_CALENDAR.last_year
+    assert calendar.to_hijri(DATE) == HIJRI_CALENDAR.to_hijri(DATE)
+
+
+@pytest.mark.parametrize(
+    "month_starts", [[], [0, 29, 59], list(range(0, 390, 30))[::-1]]
+)
+def test_hijri_calendar_invalid_table(month_starts):
+    with pytest.raises(ValueError):
+        HijriCalendar(1443, month_starts)
@@ -76,6 +76,37 @@ class TestBaseProcessor:
         assert "character_length" in outputs
         assert "word_length" in outputs
 
+    def test_get_with_character_frequency(self, processor: BaseProcessor):
+        frequency = processor.get(character_frequency=True)
+        assert isinstance(frequency, dict)
+        assert len(frequency) == 91
+        assert sum(frequency.values()) == sum(processor.get(character_length=True))
+        counts = list(frequency.values())
+        assert counts == sorted(counts, reverse=True)
+
+    def test_get_with_ratios(self, processor: BaseProcessor):
+        outputs = processor.get(arabic_ratio=True, harakat_density=True)
+        assert list(outputs) == ["arabic_ratio", "harakat_density"]
+        assert 0 < outputs["arabic_ratio"] < 1
+        assert 0 < outputs["harakat_density"] < 1
+
+    def test_get_with_length_percentiles(self, processor: BaseProcessor):
+        percentiles = processor.get(length_percentiles=True)
+        assert percentiles["character_length"][0] == 29
+        assert percentiles["character_length"][50] == 69
+        assert percentiles["character_length"][100] == 212
+        assert percentiles["word_length"][50] == 11
+
+    def test_get_independent_of_n_lines(self, processor: BaseProcessor):
+        arguments = dict(character_frequency=True, length_percentiles=True)
+        assert processor.get(**arguments, n_lines=1) == processor.get(
+            **arguments, n_lines=4
+        )
+
+    def test_get_raises_valueerror(self, processor: BaseProcessor):
+        with pytest.raises(ValueError):
+            processor.get(character_length=True, n_lines=0)
+
     def test_print_unique_characters(self, processor: BaseProcessor):
         assert processor.print_unique_characters() is processor
 
@@ -196,6 +227,14 @@ class TestBaseProcessor:
         processor.drop_lines_above_len(16, word_level=True)
         assert len(self.get_processed_lines(processor)) == 6
 
+    def test_drop_near_duplicates_no_duplicates(self, processor: BaseProcessor):
+        assert processor.drop_near_duplicates() is processor
+        assert len(self.get_processed_lines(processor)) == 9
+
+    def test_drop_near_duplicates_raises_valueerror(self, processor: BaseProcessor):
+        with pytest.raises(ValueError):
+            processor.drop_near_duplicates(threshold=0)
+
     def test_drop_lines_with_repeated_substring(self, processor: BaseProcessor):
         assert processor.drop_lines_contain_repeated_substring(3) is processor
         assert len(self.get_processed_lines(processor)) == 8
@@ -1,3 +1,7 @@
+import bz2
+import gzip
+import lzma
+
 import pytest
 
 from maha.processors import FileProcessor, TextProcessor
@@ -49,12 +53,45 @@ class TestTextProcessor(TestBaseProcessor):
         processor.drop_duplicates()
         assert len(processor.lines) == 9
 
+    def test_drop_near_duplicates(self):
+        text = "السلام عليكم ورحمة الله وبركاته يا جماعة الخير"
+        processor = TextProcessor([text, text + " @user", "صباح الخير", text + "!"])
+        processor.drop_near_duplicates(threshold=0.8)
+        assert processor.lines == [text, "صباح الخير"]
+
+    def test_drop_near_duplicates_after_cleaning(self):
+        processor = TextProcessor(["هلا والله #وسم_طويل_جدا", "هلا والله @user"])
+        processor.remove(hashtags=True, mentions=True).drop_near_duplicates()
+        assert processor.lines == ["هلا والله"]
+
     def test_drop_empty_lines(self, processor):
         self.get_processed_lines(processor).append("")
         assert len(self.get_processed_lines(processor)) == 10
         assert processor.drop_empty_lines() is processor
         assert len(self.get_processed_lines(processor)) == 9
 
+    def test_invalid_arguments_raise_when_applied(self):
+        processor = TextProcessor(["أَهلاً x"]).normalize(alef=True)
+        with pytest.raises(ValueError):
+            processor.keep()
+        processor.remove(harakat=True)
+        assert processor.lines == ["اهلا x"]
+
+    def test_failing_function_raises_when_applied(self):
+        processor = TextProcessor(["أَهلاً"]).normalize(alef=True)
+        with pytest.raises(ZeroDivisionError):
+            processor.apply(lambda line: line[1 // 0])
+        assert processor.text == "اَهلاً"
+        assert processor.remove(harakat=True).text == "اهلا"
+
+    def test_failing_queued_function_is_dropped(self):
+        processor = TextProcessor(["أَهلاً", 1]).normalize(alef=True)  # type: ignore
+        with pytest.raises(TypeError):
+            processor.lines
+        assert processor.lines == ["أَهلاً", 1]
+        processor.lines[1] = "أً"
+        assert processor.remove(harakat=True).lines == ["أهلا", "أ"]
+
 
 class TestFileProcessor(TestTextProcessor):
     @pytest.fixture()
@@ -68,3 +105,10 @@ class TestFileProcessor(TestTextProcessor):
     def test_init_raise_empty_file(self, empty_file):
         with pytest.raises(ValueError):
             FileProcessor(empty_file)
+
+    @pytest.mark.parametrize("module", [gzip, bz2, lzma])
+    def test_init_compressed_file(self, multiple_tweets_file, tmp_path, module):
+        path = tmp_path / "tweets.txt"
+        path.write_bytes(module.compress(multiple_tweets_file.read_bytes()))
+        processor = FileProcessor(path)
+        assert processor.lines == FileProcessor(multiple_tweets_file).lines
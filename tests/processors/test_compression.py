@@ -0,0 +1,82 @@
+import gzip
+import io
+import lzma
+
+import pytest
+
+from maha.processors import compression as compression_module
+from maha.processors import detect_compression, open_file
+
+
+@pytest.mark.parametrize(
+    "compression, data",
+    [
+        ("gzip", gzip.compress(b"text")),
+        ("bz2", b"BZh91AY&SY"),
+        ("xz", lzma.compress(b"text")),
+        (None, b"text"),
+        (None, b""),
+    ],
+)
+def test_detect_compression_from_first_bytes(tmp_path, compression, data):
+    # The extension is ignored when reading
+    path = tmp_path / "file.gz"
+    path.write_bytes(data)
+    assert detect_compression(path) == compression
+
+
+@pytest.mark.parametrize(
+    "name, compression",
+    [("a.txt.gz", "gzip"), ("a.BZ2", "bz2"), ("a.xz", "xz"), ("a.txt", None)],
+)
+def test_detect_compression_from_extension(name, compression):
+    assert detect_compression(name, mode="w") == compression
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz", ".txt"])
+@pytest.mark.parametrize("threads", [None, 1, 3])
+def test_open_file_round_trip(tmp_path, monkeypatch, extension, threads):
+    monkeypatch.setattr(compression_module, "COMPRESSION_BLOCK_SIZE", 64)
+    path = tmp_path / f"output{extension}"
+    text = "".join(f"السطر {i}\n" for i in range(100))
+    with open_file(path, "w", threads=threads) as f:
+        f.write(text)
+
+    assert (detect_compression(path) is None) is (extension == ".txt")
+    with open_file(path) as f:
+        assert f.read() == text
+
+
+@pytest.mark.parametrize("threads", [None, 2])
+def test_open_file_empty_output(tmp_path, threads):
+    path = tmp_path / "output.gz"
+    with open_file(path, "w", threads=threads):
+        pass
+    assert gzip.decompress(path.read_bytes()) == b""
+
+
+def test_open_file_object(tmp_path):
+    path = tmp_path / "input"
+    path.write_bytes(gzip.compress("مرحبا\r\nhello".encode("utf8")))
+    with path.open("rb") as raw:
+        with open_file(raw, compression="gzip") as f:
+            assert f.readlines() == ["مرحبا\n", "hello"]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"mode": "a"},
+        {"compression": "zip"},
+        {"threads": 0},
+        {"mode": "w", "threads": 1.5},
+    ],
+)
+def test_open_file_raises_invalid_arguments(tmp_path, arguments):
+    with pytest.raises(ValueError):
+        open_file(tmp_path / "output.gz", **arguments)
+
+
+def test_open_file_raises_infer_file_object():
+    with pytest.raises(ValueError, match="inferred"):
+        open_file(io.BytesIO(b"text"))
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+import maha.processors.duplicates as duplicates
+from maha.processors import DuplicateFilter, NearDuplicateFilter
+
+
+@pytest.mark.parametrize("digest_size", [8, 16])
+@pytest.mark.parametrize("block_size", [3, 1000])
+def test_duplicate_filter_with_runs(monkeypatch, digest_size, block_size):
+    monkeypatch.setattr(duplicates, "MERGE_BLOCK_SIZE", block_size)
+    rng = random.Random(digest_size + block_size)
+    lines = [str(rng.randrange(2000)) for _ in range(5000)]
+
+    drop_duplicates = DuplicateFilter(
+        digest_size=digest_size, max_memory=duplicates.DIGEST_MEMORY * 50
+    )
+    output = []
+    for i in range(0, len(lines), 40):
+        output.extend(drop_duplicates(lines[i : i + 40]))
+
+    assert output == list(dict.fromkeys(lines))
+    assert 1 < len(drop_duplicates._runs) <= 8
+    for run in drop_duplicates._runs:
+        digests = [bytes(run[i : i + 1].data) for i in range(run.size)]
+        assert digests == sorted(set(digests))
+
+
+def test_duplicate_filter_reset(tmp_path):
+    drop_duplicates = DuplicateFilter(max_memory=1, directory=tmp_path)
+    assert drop_duplicates(["a", "b", "a"]) == ["a", "b"]
+    assert len(list(tmp_path.iterdir())) == 1
+    drop_duplicates.reset()
+    assert not list(tmp_path.iterdir())
+    assert drop_duplicates(["a"]) == ["a"]
+
+
+@pytest.mark.parametrize("arguments", [{"digest_size": 4}, {"max_memory": 0}])
+def test_duplicate_filter_raises_valueerror(arguments):
+    with pytest.raises(ValueError):
+        DuplicateFilter(**arguments)
+
+
+def test_near_duplicate_filter_chunks(monkeypatch):
+    rng = random.Random(0)
+    words = [f"كلمة{i}" for i in range(50)]
+    lines = [" ".join(rng.choices(words, k=rng.randint(1, 8))) for _ in range(300)]
+    lines += [line + " #وسم" for line in lines]
+
+    expected = NearDuplicateFilter(threshold=0.5, shingle="word")(lines)
+    monkeypatch.setattr(duplicates, "SIGNATURE_CHUNK_SIZE", 7)
+    drop_near_duplicates = NearDuplicateFilter(threshold=0.5, shingle="word")
+    output = []
+    for i in range(0, len(lines), 11):
+        output.extend(drop_near_duplicates(lines[i : i + 11]))
+    assert output == expected
+    assert len(expected) < len(set(lines))
+
+
+def test_near_duplicate_filter_short_lines():
+    drop_near_duplicates = NearDuplicateFilter(shingle_size=3)
+    assert drop_near_duplicates(["", "ab", "", "ab", "abc", "ba"]) == [
+        "",
+        "ab",
+        "abc",
+        "ba",
+    ]
+    drop_near_duplicates.reset()
+    assert drop_near_duplicates(["ab"]) == ["ab"]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"threshold": 0},
+        {"threshold": 1.5},
+        {"shingle": "sentence"},
+        {"shingle_size": 0},
+        {"num_perm": 0},
+    ],
+)
+def test_near_duplicate_filter_raises_valueerror(arguments):
+    with pytest.raises(ValueError):
+        NearDuplicateFilter(**arguments)
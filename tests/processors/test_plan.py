@@ -0,0 +1,117 @@
+from functools import partial
+
+import pytest
+
+from maha.cleaners.functions import (
+    arabic_numbers_to_english,
+    keep,
+    normalize,
+    reduce_repeated_substring,
+    remove,
+    remove_arabic_letter_dots,
+    replace,
+    replace_pairs,
+)
+from maha.processors import CleaningPlan, compile_functions
+
+CHAINS = [
+    [partial(normalize, all=True)],
+    [partial(normalize, alef=True, spaces=True), partial(remove, harakat=True)],
+    [partial(normalize, ligatures=True), partial(keep, arabic=True)],
+    [
+        partial(remove, all_harakat=True, tatweel=True),
+        partial(keep, arabic_letters=True),
+    ],
+    [partial(remove, punctuations=True, use_space=False), arabic_numbers_to_english],
+    [partial(remove, links=True, mentions=True), partial(remove, english=True)],
+    [partial(keep, arabic_letters=True, use_space=False), remove_arabic_letter_dots],
+    [partial(keep, arabic_letters=True, harakat=True, english=True)],
+    [partial(keep, custom_strings="hello"), partial(remove, numbers=True)],
+    [
+        partial(replace, strings=["a", "b"], with_value="x"),
+        partial(remove, arabic=True),
+    ],
+    [
+        partial(replace_pairs, keys=["ا", "ب"], values=["ب", "c"]),
+        partial(reduce_repeated_substring, min_repeated=2),
+        partial(normalize, all=True),
+    ],
+]
+
+
+def apply_in_sequence(functions, text):
+    for fn in functions:
+        text = fn(text)
+    return text
+
+
+@pytest.mark.parametrize("functions", CHAINS)
+def test_plan_output_is_identical(functions, multiple_tweets: str, wiki_arlang: str):
+    plan = CleaningPlan(functions)
+    for line in (multiple_tweets + "\n" + wiki_arlang).split("\n"):
+        assert plan(line) == apply_in_sequence(functions, line)
+
+
+@pytest.mark.parametrize("functions", CHAINS)
+def test_plan_output_is_identical_multiline(functions, surah_al_ala_file):
+    text = surah_al_ala_file.read_text(encoding="utf8")
+    assert CleaningPlan(functions)(text) == apply_in_sequence(functions, text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", " ", "\n", "   ــ ", "ﻷ ﷲ", " أَ  ١٢ "],
+)
+def test_plan_edge_cases(text):
+    for functions in CHAINS:
+        assert CleaningPlan(functions)(text) == apply_in_sequence(functions, text)
+
+
+def test_plan_fuses_translations():
+    plan = CleaningPlan(
+        [
+            partial(normalize, alef=True),
+            partial(normalize, yeh=True),
+            arabic_numbers_to_english,
+        ]
+    )
+    assert len(plan) == 1
+    assert plan("إلى ٣") == "الي 3"
+
+
+def test_plan_merges_space_operations():
+    plan = CleaningPlan(
+        [
+            partial(remove, english=True),
+            partial(normalize, alef=True),
+            partial(normalize, yeh=True),
+        ]
+    )
+    assert len(plan) == 3
+
+
+def test_plan_keeps_unsupported_functions():
+    fn = partial(reduce_repeated_substring, min_repeated=2)
+    plan = CleaningPlan([fn])
+    assert plan.operations == [fn]
+    assert plan("ههههه") == "هه"
+
+
+def test_plan_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        CleaningPlan([partial(keep)])
+
+
+def test_compile_functions():
+    is_empty = partial(filter, bool)
+    functions = [
+        partial(map, partial(normalize, alef=True)),
+        partial(map, partial(remove, harakat=True)),
+        is_empty,
+        partial(map, arabic_numbers_to_english),
+    ]
+    compiled = compile_functions(functions)
+    assert len(compiled) == 3
+    assert compiled[1] is is_empty
+    assert isinstance(compiled[0].args[0], CleaningPlan)
+    assert isinstance(compiled[2].args[0], CleaningPlan)
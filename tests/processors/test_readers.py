@@ -0,0 +1,90 @@
+import io
+import os
+import pathlib
+
+import pytest
+
+import maha.processors.readers as readers
+from maha.processors import IndexedFileReader
+
+TEXTS = [
+    "",
+    "\n",
+    "أ",
+    "أ\nب\n",
+    "أ\r\n\r\nب\rج\n\n\nد  \nهـ",
+    "\r\r\n\n\r",
+    "a\nb\nc\nd\ne\nf\ng",
+]
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(readers, "INDEX_INTERVAL", 2)
+    monkeypatch.setattr(readers, "SCAN_BLOCK_SIZE", 3)
+    monkeypatch.setattr(readers, "READ_BLOCK_SIZE", 2)
+
+
+@pytest.mark.parametrize("encoding", ["utf8", "utf-8-sig"])
+@pytest.mark.parametrize("text", TEXTS)
+def test_indexed_file_reader(tmp_path: pathlib.Path, text: str, encoding: str):
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode(encoding))
+    expected = [line.rstrip("\n") for line in io.open(path, encoding=encoding)]
+
+    reader = IndexedFileReader(path, encoding)
+    assert len(reader) == len(expected)
+    assert list(reader) == expected
+    assert [reader[i] for i in range(-len(expected), len(expected))] == expected * 2
+    assert reader[1:-1] == expected[1:-1]
+    assert reader[::2] == expected[::2]
+    if expected:
+        assert sum(size for size, _ in reader.iter_blocks()) == path.stat().st_size
+
+
+def test_indexed_file_reader_cache(tmp_path: pathlib.Path):
+    path = tmp_path / "input.txt"
+    path.write_text("أ\nب\nج\nد\n", encoding="utf8")
+    assert IndexedFileReader(path, cache=True)[1:] == ["ب", "ج", "د"]
+    assert (tmp_path / "input.txt.lines.npz").is_file()
+    assert IndexedFileReader(path, cache=True)[3] == "د"
+
+    path.write_text("هـ\nو\n", encoding="utf8")
+    os.utime(path, ns=(0, 0))
+    assert list(IndexedFileReader(path, cache=True)) == ["هـ", "و"]
+
+
+@pytest.mark.parametrize("data", [b"garbage", b"PK\x03\x04", b""])
+def test_indexed_file_reader_corrupted_cache(tmp_path: pathlib.Path, data):
+    path = tmp_path / "input.txt"
+    path.write_text("أ\nب\n", encoding="utf8")
+    index_path = tmp_path / "input.txt.lines.npz"
+    index_path.write_bytes(data)
+    assert list(IndexedFileReader(path, cache=True)) == ["أ", "ب"]
+    # The corrupted index is replaced
+    assert IndexedFileReader(path, cache=True)._load_index(index_path) is not None
+
+
+def test_indexed_file_reader_cache_unwritable_directory(
+    tmp_path: pathlib.Path, monkeypatch
+):
+    path = tmp_path / "input.txt"
+    path.write_text("أ\nب\n", encoding="utf8")
+
+    def mkstemp(*args, **kwargs):
+        raise PermissionError()
+
+    monkeypatch.setattr("tempfile.mkstemp", mkstemp)
+    assert list(IndexedFileReader(path, cache=True)) == ["أ", "ب"]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_indexed_file_reader_raises_errors(tmp_path: pathlib.Path):
+    path = tmp_path / "input.txt"
+    path.write_text("أ\n", encoding="utf8")
+    with pytest.raises(IndexError):
+        IndexedFileReader(path)[1]
+    with pytest.raises(ValueError):
+        IndexedFileReader(path, encoding="utf-16")
+    with pytest.raises(FileNotFoundError):
+        IndexedFileReader(tmp_path / "invalid.txt")
@@ -0,0 +1,36 @@
+import math
+
+import pytest
+
+from maha.processors import LENGTH_PERCENTILES, STATISTICS, TextStatistics
+
+
+def test_text_statistics_chunks():
+    statistics = TextStatistics(["word_length", "unique_characters"])
+    statistics.update(["مَرحبا بكم", "hi"])
+    statistics.update(["", "hi hi"])
+    assert statistics.get() == {
+        "unique_characters": ["م", "َ", "ر", "ح", "ب", "ا", " ", "ك", "h", "i"],
+        "word_length": [2, 1, 0, 2],
+    }
+
+
+def test_text_statistics_ratios():
+    statistics = TextStatistics(["harakat_density", "arabic_ratio"])
+    statistics.update(["مَرْحَبا hi"])
+    assert statistics.get() == {"arabic_ratio": 5 / 7, "harakat_density": 3 / 5}
+
+
+def test_text_statistics_empty():
+    statistics = TextStatistics(STATISTICS)
+    output = statistics.get()
+    assert output["unique_characters"] == []
+    assert output["character_length"] == []
+    assert math.isnan(output["arabic_ratio"])
+    assert math.isnan(output["harakat_density"])
+    assert list(output["length_percentiles"]["word_length"]) == LENGTH_PERCENTILES
+
+
+def test_text_statistics_raises_valueerror():
+    with pytest.raises(ValueError):
+        TextStatistics(["character_length", "lines"])
@@ -1,9 +1,12 @@
+import bz2
+import gzip
+import lzma
 import pathlib
 
 import pytest
 
 from maha.constants import EMPTY
-from maha.processors import StreamFileProcessor, StreamTextProcessor
+from maha.processors import StreamFileProcessor, StreamTextProcessor, open_file
 from tests.processors.test_base_processor import TestBaseProcessor
 
 
@@ -42,6 +45,25 @@ class TestStreamTextProcessor(TestBaseProcessor):
         )
         assert len(self.get_processed_lines(processor)) == 3
 
+    def test_drop_duplicates(self):
+        lines = ["ب", "أ", "ب", "ج", "أ", "A", "a"] * 3
+        processor = StreamTextProcessor(lines)
+        assert processor.drop_duplicates(key=str.lower, max_memory=200) is processor
+        output = [line for lines in processor.process(n_lines=2) for line in lines]
+        assert output == ["ب", "أ", "ج", "A"]
+
+    def test_drop_near_duplicates(self):
+        lines = ["صباح الخير يا أصدقاء", "صباح الخير يا أصدقاء!", "مساء الخير"] * 2
+        processor = StreamTextProcessor(lines)
+        processor.drop_near_duplicates(threshold=0.7)
+        output = [line for lines in processor.process(n_lines=1) for line in lines]
+        assert output == ["صباح الخير يا أصدقاء", "مساء الخير"]
+
+    def test_drop_duplicates_processed_again(self, processor):
+        processor.drop_duplicates(digest_size=16)
+        assert self.get_processed_lines(processor) == list(processor.get_lines())[0]
+        assert self.get_processed_lines(processor) == list(processor.get_lines())[0]
+
 
 class TestStreamFileProcessor(TestStreamTextProcessor):
 
@@ -98,3 +120,121 @@ class TestStreamFileProcessor(TestStreamTextProcessor):
         processor.process_and_save(str(tmpfile))
 
         assert tmpfile.read_text() == EMPTY
+
+    @pytest.mark.parametrize("n_lines", [1, 3, 100])
+    @pytest.mark.parametrize("chunk_size", [1, 64, 2**20])
+    def test_process_and_save_with_workers(
+        self,
+        surah_al_ala_file: pathlib.Path,
+        tmp_path: pathlib.Path,
+        n_lines,
+        chunk_size,
+    ):
+        outputs = []
+        for workers in [None, 2]:
+            processor = StreamFileProcessor(surah_al_ala_file)
+            processor.normalize(all=True).keep(arabic_letters=True)
+            processor.drop_lines_contain(custom_strings="الاعلي").drop_lines_below_len(
+                2, word_level=True
+            )
+            tmpfile = tmp_path / f"{workers}.txt"
+            processor.process_and_save(
+                tmpfile, n_lines=n_lines, workers=workers, chunk_size=chunk_size
+            )
+            outputs.append(tmpfile.read_bytes())
+
+        assert outputs[0] == outputs[1]
+
+    def test_process_and_save_with_workers_newlines(self, tmp_path: pathlib.Path):
+        path = tmp_path / "input.txt"
+        path.write_bytes("أ\r\n\r\nب\rج\n\n\nد  \nهـ".encode("utf8"))
+        outputs = []
+        for workers in [None, 3]:
+            processor = StreamFileProcessor(path)
+            processor.remove(tatweel=True).filter_lines_contain(arabic=True)
+            tmpfile = tmp_path / f"{workers}.txt"
+            processor.process_and_save(
+                tmpfile, n_lines=2, workers=workers, chunk_size=3
+            )
+            outputs.append(tmpfile.read_bytes())
+
+        assert outputs[0] == outputs[1] == "أ\nب\nج\nد\nه\n".encode("utf8")
+
+    @pytest.mark.parametrize("encoding", ["utf8", "utf-16"])
+    def test_process_and_save_encoding(self, tmp_path: pathlib.Path, encoding):
+        path = tmp_path / "input.txt"
+        path.write_text("أ\r\nب\rج\n\nد", encoding=encoding)
+        processor = StreamFileProcessor(path, encoding)
+        assert (processor.reader is None) is (encoding == "utf-16")
+        processor.drop_empty_lines().process_and_save(tmp_path / "output.txt")
+        assert (tmp_path / "output.txt").read_text(encoding) == "أ\nب\nج\nد\n"
+
+    @pytest.mark.parametrize("module", [gzip, bz2, lzma])
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_process_and_save_compressed_input(
+        self,
+        surah_al_ala_file: pathlib.Path,
+        tmp_path: pathlib.Path,
+        module,
+        workers,
+    ):
+        path = tmp_path / "input.txt"
+        path.write_bytes(module.compress(surah_al_ala_file.read_bytes()))
+        outputs = []
+        for input_path in [surah_al_ala_file, path]:
+            processor = StreamFileProcessor(input_path)
+            processor.normalize(all=True).keep(arabic_letters=True)
+            tmpfile = tmp_path / f"{input_path.stem}.out"
+            processor.process_and_save(
+                tmpfile, n_lines=3, workers=workers, chunk_size=64, override=True
+            )
+            outputs.append(tmpfile.read_bytes())
+
+        assert processor.reader is None
+        assert outputs[0] == outputs[1]
+
+    @pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz"])
+    @pytest.mark.parametrize("compression_threads", [None, 4])
+    def test_process_and_save_compressed_output(
+        self, processor, tmp_path: pathlib.Path, extension, compression_threads
+    ):
+        processor.keep(arabic=True).drop_empty_lines()
+        processor.process_and_save(tmp_path / "output.txt")
+        tmpfile = tmp_path / f"output.txt{extension}"
+        processor.process_and_save(tmpfile, compression_threads=compression_threads)
+
+        assert StreamFileProcessor(tmpfile).compression is not None
+        with open_file(tmpfile) as f:
+            assert f.read() == (tmp_path / "output.txt").read_text("utf8")
+
+    def test_process_and_save_with_workers_raises_unpicklable(
+        self, processor, tmp_path
+    ):
+        tmpfile = tmp_path / "tmp.txt"
+        tmpfile.write_text("existing output")
+        processor.filter(lambda line: len(line) > 1)
+        with pytest.raises(ValueError, match="pickled"):
+            processor.process_and_save(tmpfile, override=True, workers=2)
+        assert tmpfile.read_text() == "existing output"
+
+    @pytest.mark.parametrize("method", ["drop_duplicates", "drop_near_duplicates"])
+    def test_process_and_save_with_workers_raises_drop_duplicates(
+        self, processor, tmp_path, method
+    ):
+        tmpfile = tmp_path / "tmp.txt"
+        tmpfile.write_text("existing output")
+        getattr(processor, method)()
+        with pytest.raises(ValueError, match="drop_duplicates"):
+            processor.process_and_save(tmpfile, override=True, workers=2)
+        assert tmpfile.read_text() == "existing output"
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [{"workers": 0}, {"chunk_size": -1}, {"compression_threads": 0}],
+    )
+    def test_process_and_save_raises_invalid_arguments(
+        self, processor, tmp_path, arguments
+    ):
+        processor.keep(arabic=True)
+        with pytest.raises(ValueError):
+            processor.process_and_save(tmp_path / "tmp.txt", **arguments)
@@ -0,0 +1,90 @@
+import sys
+from types import ModuleType
+
+import maha.parsers.rules
+from maha.rexy import Expression, ExpressionGroup
+
+
+def _linear_match(group: ExpressionGroup, text: str):
+    for expression in group.expressions:
+        if expression.fullmatch(text):
+            return expression
+    return None
+
+
+def test_get_matched_expression_first_wins():
+    group = ExpressionGroup(Expression("ab|abc"), Expression("abc"), Expression("a+"))
+    assert group.get_matched_expression("abc") is group[0]
+    assert group.get_matched_expression("aaa") is group[2]
+    assert group.get_matched_expression("abcd") is None
+
+
+def test_get_matched_expression_with_groups():
+    group = ExpressionGroup(
+        Expression(r"(?P<x>a)(b)\2"), Expression(r"(?P<x>c)(d)"), Expression(r"(\w)")
+    )
+    assert group.get_matched_expression("abb") is group[0]
+    assert group.get_matched_expression("cd") is group[1]
+    assert group.get_matched_expression("e") is group[2]
+
+
+def test_get_matched_expression_is_memoized():
+    group = ExpressionGroup(Expression("a"), Expression("b"))
+    assert group.get_matched_expression("b") is group[1]
+    assert group._matcher is not None
+    assert group._matcher.memo == {"b": 1}
+    assert group.get_matched_expression("c") is None
+    assert group._matcher.memo == {"b": 1, "c": -1}
+
+
+def test_get_matched_expression_after_changes():
+    group = ExpressionGroup(Expression("a"))
+    assert group.get_matched_expression("b") is None
+    group.add(Expression("b"))
+    assert group.get_matched_expression("b") is group[1]
+    group += ExpressionGroup(Expression("c"))
+    assert group.get_matched_expression("c") is group[2]
+    group.expressions.append(Expression("d"))
+    assert group.get_matched_expression("d") is group[3]
+
+
+def test_get_matched_expression_global_flags():
+    # Patterns with global flags can't be combined
+    group = ExpressionGroup(Expression("(?i)a"), Expression("(?x) b c"))
+    assert group.get_matched_expression("A") is group[0]
+    assert group.get_matched_expression("bc") is group[1]
+    assert group._matcher is not None and group._matcher.pattern is None
+
+
+def _get_rule_groups() -> list:
+    maha.parsers.rules.__all__
+    groups = {}
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("maha.parsers.rules") or not isinstance(
+            module, ModuleType
+        ):
+            continue
+        for value in vars(module).values():
+            if isinstance(value, ExpressionGroup):
+                groups[id(value)] = value
+    return list(groups.values())
+
+
+def test_get_matched_expression_same_as_linear(wiki_arnumbers, wiki_arlang):
+    words = (wiki_arnumbers + " " + wiki_arlang).split()
+    texts = set(words)
+    texts.update(" ".join(words[i : i + 2]) for i in range(len(words) - 1))
+    texts.update(" ".join(words[i : i + 3]) for i in range(len(words) - 2))
+    texts = sorted(texts)[:3000]
+
+    groups = [g for g in _get_rule_groups() if len(g) < 100]
+    assert groups
+    for group in groups:
+        for text in texts:
+            assert group.get_matched_expression(text) is _linear_match(group, text)
+        for expression in group:
+            if isinstance(expression.pattern, str) and expression.fullmatch(
+                expression.pattern
+            ):
+                text = expression.pattern
+                assert group.get_matched_expression(text) is _linear_match(group, text)
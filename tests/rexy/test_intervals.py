@@ -0,0 +1,117 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from maha.rexy import Expression, ExpressionGroup, IntervalIndex, resolve_overlaps
+
+
+def _brute_force_resolve(intervals, order):
+    accepted = []
+    for i in order:
+        start, end = intervals[i]
+        if not any(
+            s <= start and end <= e for s, e in (intervals[j] for j in accepted)
+        ):
+            accepted.append(i)
+    return sorted(accepted)
+
+
+def test_interval_index_contains():
+    index = IntervalIndex()
+    assert not index.contains(0, 0)
+    assert index.add(5, 10)
+    assert index.contains(5, 10)
+    assert index.contains(6, 6)
+    assert not index.contains(4, 6)
+    assert not index.contains(9, 11)
+    assert not index.add(7, 9)
+    assert index.add(0, 20)
+    # Contained intervals are removed
+    assert list(index) == [(0, 20)]
+    index.clear()
+    assert len(index) == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_interval_index_matches_brute_force(seed):
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(200):
+        start = rng.randrange(100)
+        intervals.append((start, start + rng.randrange(15)))
+
+    index = IntervalIndex()
+    added = []
+    for start, end in intervals:
+        expected = not any(s <= start and end <= e for s, e in added)
+        assert index.add(start, end) is expected
+        if expected:
+            added.append((start, end))
+    for start in range(110):
+        for end in range(start, start + 20):
+            expected = any(s <= start and end <= e for s, e in added)
+            assert index.contains(start, end) is expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("policy", ["first", "longest", "priority"])
+def test_resolve_overlaps_matches_brute_force(seed, policy):
+    rng = random.Random(seed)
+    results = []
+    for _ in range(100):
+        start = rng.randrange(50)
+        results.append(
+            SimpleNamespace(
+                start=start, end=start + rng.randrange(10), priority=rng.randrange(3)
+            )
+        )
+    intervals = [(r.start, r.end) for r in results]
+    indices = range(len(results))
+    order = {
+        "first": list(indices),
+        "longest": sorted(indices, key=lambda i: intervals[i][0] - intervals[i][1]),
+        "priority": sorted(indices, key=lambda i: results[i].priority),
+    }[policy]
+
+    output = resolve_overlaps(results, policy, lambda r: r.priority)
+    assert output == [results[i] for i in _brute_force_resolve(intervals, order)]
+
+
+def test_resolve_overlaps_invalid_arguments():
+    with pytest.raises(ValueError):
+        resolve_overlaps([], "shortest")
+    with pytest.raises(ValueError):
+        resolve_overlaps([], "priority")
+
+
+@pytest.mark.parametrize(
+    "overlap, expected",
+    [
+        ("first", ["ثلاثة", "أيام", "ثلاثة أيام"]),
+        ("priority", ["ثلاثة", "أيام", "ثلاثة أيام"]),
+        ("longest", ["ثلاثة أيام"]),
+    ],
+)
+def test_smart_parse_overlap(overlap, expected):
+    text = "ثلاثة أيام"
+    group = ExpressionGroup(
+        Expression("ثلاثة"),
+        Expression("أيام"),
+        Expression("ثلاثة أيام"),
+        smart=True,
+        overlap=overlap,
+    )
+    assert [text[r.start : r.end] for r in group.parse(text)] == expected
+    # State is cleared between calls
+    assert [text[r.start : r.end] for r in group.parse(text)] == expected
+
+
+def test_smart_parse_skips_contained_values():
+    group = ExpressionGroup(Expression("ab+"), Expression("b"), smart=True)
+    assert [(r.start, r.end) for r in group.parse("abb b")] == [(0, 3), (4, 5)]
+
+
+def test_expression_group_invalid_overlap():
+    with pytest.raises(ValueError):
+        ExpressionGroup(Expression("a"), overlap="shortest")
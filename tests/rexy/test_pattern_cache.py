@@ -0,0 +1,157 @@
+import os
+
+import pytest
+import regex as re
+
+from maha.__main__ import main
+from maha.rexy import Expression, ExpressionScanner, PatternCache
+from maha.rexy.pattern_cache import get_version_tag
+from maha.rexy.templates.expression_scanner import PREFIX_VERSION, get_prefix_pattern
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    return PatternCache(tmp_path / "cache", bundled_directory=None)
+
+
+def test_compile_saves_pattern(cache: PatternCache):
+    assert cache.load("[أا]حمد") is None
+    compiled = cache.compile("[أا]حمد")
+    assert compiled.pattern == "[أا]حمد"
+    assert compiled.flags & re.MULTILINE
+
+    path = cache.get_path("[أا]حمد")
+    assert path.exists()
+    assert get_version_tag() in path.name
+    assert cache.load("[أا]حمد").search("قال احمد").group() == "احمد"
+
+
+def test_key_depends_on_flags(cache: PatternCache):
+    assert cache.get_path("a", re.MULTILINE) != cache.get_path("a", 0)
+    cache.compile("a", 0)
+    assert cache.load("a", re.MULTILINE) is None
+    assert cache.load("a", 0) is not None
+
+
+def test_corrupted_file_is_removed(cache: PatternCache):
+    path = cache.get_path("abc")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"corrupted")
+    assert cache.load("abc") is None
+    assert not path.exists()
+    assert cache.compile("abc").match("abc")
+
+
+def test_unwritable_directory(tmp_path):
+    file = tmp_path / "file"
+    file.write_text("")
+    cache = PatternCache(file / "cache", bundled_directory=None)
+    assert cache.compile("abc").match("abc")
+    assert cache.load("abc") is None
+    assert cache.entries() == []
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = PatternCache(tmp_path, max_size=2**30, bundled_directory=None)
+    sizes = []
+    for i, pattern in enumerate(["a+", "b+", "c+"]):
+        cache.compile(pattern)
+        os.utime(cache.get_path(pattern), (i, i))
+        sizes.append(cache.get_path(pattern).stat().st_size)
+
+    cache._max_size = sizes[1] + sizes[2]
+    cache._evict()
+    assert not cache.get_path("a+").exists()
+    assert cache.get_path("b+").exists()
+
+    cache.load("b+")
+    cache._max_size = max(sizes)
+    cache._evict()
+    assert cache.get_path("b+").exists()
+    assert not cache.get_path("c+").exists()
+
+
+def test_stats_and_clear(cache: PatternCache):
+    cache.compile("a+")
+    cache.compile("b+")
+    stale = cache.directory / f"{'0' * 64}.py27-regex0.0.0.crp"
+    stale.write_bytes(b"stale")
+
+    stats = cache.stats()
+    assert stats.entries == 3
+    assert stats.stale_entries == 1
+    assert stats.stale_size == 5
+    assert stats.size > 5
+
+    assert cache.clear(stale_only=True) == 1
+    assert cache.stats().entries == 2
+    assert cache.clear() == 2
+    assert cache.stats().entries == 0
+
+
+def test_directory_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("MAHA_CACHE_DIR", str(tmp_path / "env"))
+    monkeypatch.setenv("MAHA_CACHE_MAX_SIZE", "100")
+    cache = PatternCache()
+    assert cache.directory == tmp_path / "env"
+    assert cache.max_size == 100
+
+    monkeypatch.delenv("MAHA_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert cache.directory == tmp_path / "xdg" / "maha"
+
+
+def test_bundled_cache_requires_same_regex_version(tmp_path):
+    bundled = tmp_path / "bundled"
+    bundled.mkdir()
+    cache = PatternCache(tmp_path / "cache", bundled_directory=bundled)
+    cache.compile("abc")
+    cache.get_path("abc").rename(bundled / f"{PatternCache._bundled_name('abc')}.crp")
+    (bundled / "manifest.json").write_text('{"regex": "0.0.0"}')
+    assert cache.load("abc") is None
+
+    (bundled / "manifest.json").write_text(f'{{"regex": "{re.__version__}"}}')
+    cache = PatternCache(tmp_path / "cache", bundled_directory=bundled)
+    assert cache.load("abc").match("abc")
+
+
+def test_cli(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("MAHA_CACHE_DIR", str(tmp_path))
+    PatternCache(bundled_directory=None).compile("abc")
+
+    assert main(["cache", "stats"]) == 0
+    output = capsys.readouterr().out
+    assert str(tmp_path) in output
+    assert "Entries: 1 " in output
+
+    assert main(["cache", "clear"]) == 0
+    assert "Removed 1 patterns" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main(["cache"])
+
+
+def test_prefix_is_cached_by_version(cache: PatternCache):
+    assert cache.load_prefix("[أا]حمد", 1) is None
+    assert cache.save_prefix("[أا]حمد", "[أا]ح", 1)
+    assert cache.save_prefix(".*", None, 1)
+
+    assert cache.load_prefix("[أا]حمد", 1) == "[أا]ح"
+    assert cache.load_prefix(".*", 1) == ""
+    assert cache.load_prefix("[أا]حمد", 2) is None
+    assert get_version_tag() in cache.get_prefix_path("[أا]حمد", 1).name
+    assert cache.stats().entries == 2
+    assert cache.clear() == 2
+
+
+def test_scanner_prefixes_use_cache(monkeypatch, cache: PatternCache):
+    monkeypatch.setattr("maha.rexy.PATTERN_CACHE", cache)
+    expression = Expression("[أا]حمد|محمد", pickle=True)
+    ExpressionScanner(expression)
+    prefix = cache.load_prefix(expression.pattern, PREFIX_VERSION)
+    assert prefix == get_prefix_pattern(expression.pattern)
+
+    path = cache.get_prefix_path(expression.pattern, PREFIX_VERSION)
+    path.write_text("محمد", encoding="utf8")
+    results = ExpressionScanner(expression).scan("قال احمد ومحمد")
+    assert [(r.start, r.end) for r in results[0]] == [(10, 14)]
@@ -0,0 +1,35 @@
+import pytest
+
+from maha.rexy import get_expression, get_strings_expression
+from maha.rexy.rexy import EXPRESSION_CACHE_SIZE
+
+
+def test_get_expression_is_shared():
+    assert get_expression("a+") is get_expression("a+")
+    assert get_expression("a+").search("baa").group() == "aa"
+
+
+@pytest.mark.parametrize(
+    "arguments, pattern",
+    [
+        ((("a", "b"),), "(a|b)"),
+        ((("a.", "(b)"),), r"(a\.|\(b\))"),
+        ((("a", "b"), "(.*?)({}|$)"), "(.*?)(a|b|$)"),
+        ((("a", "b"), r"\b[{}]\b", ""), r"\b[ab]\b"),
+    ],
+)
+def test_get_strings_expression(arguments, pattern):
+    assert get_strings_expression(*arguments).pattern == pattern
+
+
+def test_get_strings_expression_counters_and_eviction():
+    get_strings_expression.cache_clear()
+    expression = get_strings_expression(("x",))
+    assert get_strings_expression(("x",)) is expression
+    info = get_strings_expression.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    for i in range(EXPRESSION_CACHE_SIZE):
+        get_strings_expression((str(i),))
+    assert get_strings_expression.cache_info().currsize == EXPRESSION_CACHE_SIZE
+    assert get_strings_expression(("x",)) is not expression
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import maha.rexy.templates.expression as expression_module
+from maha.parsers.functions import parse_dimension
+from maha.rexy import Expression, ExpressionGroup, get_concurrent, set_concurrent
+
+
+@pytest.fixture()
+def concurrent():
+    set_concurrent(True)
+    yield
+    set_concurrent(False)
+
+
+def test_set_concurrent(concurrent):
+    assert get_concurrent()
+    assert Expression("(b+)").search("abb").group() == "bb"
+    assert [r.value for r in Expression("(b+)").parse("abb b")] == ["bb", "b"]
+    set_concurrent(False)
+    assert not get_concurrent()
+
+
+def test_compile_once_in_threads(monkeypatch):
+    calls = []
+    compile = expression_module.re.compile
+
+    def counting_compile(*args, **kwargs):
+        calls.append(args)
+        return compile(*args, **kwargs)
+
+    monkeypatch.setattr(expression_module.re, "compile", counting_compile)
+    expression = Expression("a+b")
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: expression.search("aab"), range(64)))
+
+    assert all(r.group() == "aab" for r in results)
+    assert len(calls) == 1
+
+
+def test_smart_parse_is_reentrant():
+    group = ExpressionGroup(Expression("ab+"), Expression("b"), smart=True)
+    first = group.parse("abb b")
+    second = group.parse("b abb")
+    # Interleaved calls don't share the parsed ranges
+    assert (next(first).start, next(second).start) == (0, 2)
+    assert [(r.start, r.end) for r in first] == [(4, 5)]
+    assert [(r.start, r.end) for r in second] == [(0, 1)]
+
+
+def test_parse_dimension_in_threads(
+    concurrent, wiki_arnumbers: str, multiple_tweets: str
+):
+    lines = (wiki_arnumbers + "\n" + multiple_tweets).split("\n")
+
+    def parse(line):
+        output = parse_dimension(line, numeral=True, duration=True, time=True)
+        return [(d.start, d.end, d.value) for d in output]
+
+    with ThreadPoolExecutor(4) as executor:
+        output = list(executor.map(parse, lines))
+
+    set_concurrent(False)
+    assert output == [parse(line) for line in lines]
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def get_imported_modules(statement: str):
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize(
+    "statement", ["import maha.cleaners.functions", "import maha.processors"]
+)
+def test_cleaners_do_not_import_parsers(statement):
+    modules = get_imported_modules(statement)
+    assert "maha.cleaners.functions" in modules
+    assert not any(m.startswith("maha.parsers") for m in modules)
+    assert "hijri_converter" not in modules
+
+
+def test_parsers_load_rules_on_first_access():
+    modules = get_imported_modules(
+        "import maha.parsers.functions\nfrom maha.parsers.rules import RULE_NUMERAL"
+    )
+    assert "maha.parsers.rules.numeral.rule" in modules
+    assert "maha.parsers.rules.time.rule" not in modules
+    assert "maha.parsers.rules.names" not in modules
+    assert "hijri_converter" not in modules
+
+
+def test_rules_lazy_attributes():
+    import maha.parsers
+    import maha.parsers.rules as rules
+    from maha.parsers.rules.time import RULE_TIME
+
+    assert rules.RULE_TIME is RULE_TIME
+    assert maha.parsers.RULE_TIME is RULE_TIME
+    assert "RULE_TIME_YEARS" in rules.__all__
+    assert "RULE_NAME" in dir(rules)
+    with pytest.raises(AttributeError):
+        rules.RULE_UNKNOWN
+    with pytest.raises(AttributeError):
+        rules.RULE_TIME_UNKNOWN
+
+
+def test_parsers_star_import():
+    import maha.parsers
+    import maha.parsers.rules as rules
+
+    namespace: dict = {}
+    exec("from maha.parsers import *", namespace)
+    assert maha.parsers.__all__ == rules.__all__
+    assert namespace["RULE_NUMERAL"] is rules.RULE_NUMERAL
+    assert namespace["RULE_TIME_YEARS"] is rules.RULE_TIME_YEARS
+    assert "import_module" not in namespace
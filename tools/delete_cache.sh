@@ -1,4 +1,4 @@
-# Remove old rule cache files
+# Remove old rule cache files, rebuild them using update_bundled_cache.py
 # This scipt should be run before commiting modified cache files to prevent repo bloat
 # Should be run from the root of the repository
 git rm --cached maha/rexy/cache/[0-9]*
@@ -0,0 +1,24 @@
+# Rebuilds the cache of compiled rules shipped with the library.
+# Should be run from the root of the repository after modifying the rules, use
+# delete_cache.sh first to remove old cache files.
+import json
+import pickle
+
+import regex as re
+from tqdm import tqdm
+
+from maha.__main__ import _get_rule_expressions
+from maha.rexy.pattern_cache import BUNDLED_CACHE_PATH
+
+expressions = [e for e in _get_rule_expressions() if e.pickle]
+for expression in tqdm(expressions, desc="Compiling rules"):
+    # crp: compiled regex pattern
+    path = BUNDLED_CACHE_PATH / f"{hash(expression)}.crp"
+    if not path.exists():
+        with path.open("wb") as f:
+            pickle.dump(re.compile(expression.pattern, re.MULTILINE), f)
+
+# The bundled cache is only used with the same regex version
+with (BUNDLED_CACHE_PATH / "manifest.json").open("w") as f:
+    json.dump({"regex": re.__version__}, f, indent=4)
+    f.write("\n")